@@ -2,5 +2,12 @@
 
 from .cache_manager import CacheManager, CacheType
 from .breadcrumb_builder import build_breadcrumb
+from .detail_cache import DetailCache, get_detail_cache_dir
 
-__all__ = ["CacheManager", "CacheType", "build_breadcrumb"]
+__all__ = [
+    "CacheManager",
+    "CacheType",
+    "build_breadcrumb",
+    "DetailCache",
+    "get_detail_cache_dir",
+]
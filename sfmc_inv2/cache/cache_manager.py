@@ -55,6 +55,9 @@ class CacheType(str, Enum):
     EMAILS = "emails"
     TRIGGERED_SENDS = "triggered_sends"
 
+    # Persistent detail caches (disk, keyed by ID + modifiedDate)
+    JOURNEY_DETAILS = "journey_details"
+
 
 # Folder content type to CacheType mapping
 FOLDER_CONTENT_TYPES: dict[str, CacheType] = {
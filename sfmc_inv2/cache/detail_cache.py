@@ -0,0 +1,190 @@
+"""Persistent cache for per-object detail payloads.
+
+Stores detail API responses (e.g. full journey definitions) on disk keyed
+by object ID and a version stamp such as modifiedDate. Objects whose stamp
+is unchanged since a previous run can skip the detail request entirely;
+a changed stamp is simply a cache miss, so invalidation is automatic.
+
+Entries are kept in one append-only NDJSON journal per cache type. The
+journal is replayed into memory on first use, and new entries are
+buffered and appended in batches rather than written one file at a time.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+import platformdirs
+
+from .cache_manager import CacheType
+
+logger = logging.getLogger(__name__)
+
+APP_NAME = "sfmc-inv2"
+APP_AUTHOR = "sfmc"
+
+# Number of buffered entries written per journal append
+FLUSH_BATCH_SIZE = 64
+
+
+def get_detail_cache_dir() -> Path:
+    """Get the platform-specific directory for persistent detail caches."""
+    return Path(platformdirs.user_cache_dir(APP_NAME, APP_AUTHOR)) / "details"
+
+
+class DetailCache:
+    """Journal-backed cache of detail payloads keyed by (object ID, version).
+
+    Each journal line is ``{"id": ..., "version": ..., "data": ...}``; later
+    lines supersede earlier ones for the same ID. Call ``flush()`` once the
+    extraction finishes to write any entries still buffered.
+    """
+
+    def __init__(
+        self,
+        cache_type: CacheType,
+        root: Optional[Path] = None,
+        flush_batch_size: int = FLUSH_BATCH_SIZE,
+    ):
+        """Initialize the detail cache.
+
+        Args:
+            cache_type: Cache type used to name the journal.
+            root: Base cache directory. Uses the platform cache dir if None.
+            flush_batch_size: Buffered entries that trigger a journal append.
+        """
+        self._cache_type = cache_type
+        self._path = (root or get_detail_cache_dir()) / f"{cache_type.value}.ndjson"
+        self._flush_batch_size = flush_batch_size
+        self._entries: Optional[dict[str, tuple[str, dict[str, Any]]]] = None
+        self._pending: list[bytes] = []
+        # Journal ends mid-record, so the next append must start a new line
+        self._torn_tail = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def path(self) -> Path:
+        """Get the journal file backing this cache."""
+        return self._path
+
+    def get(self, object_id: str, version: Optional[str]) -> Optional[dict[str, Any]]:
+        """Get a cached payload if it was stored at the same version.
+
+        Args:
+            object_id: Object ID.
+            version: Version stamp (e.g. modifiedDate). None always misses.
+
+        Returns:
+            Cached payload, or None on a miss.
+        """
+        entry = self._load().get(str(object_id)) if version is not None else None
+
+        if entry is None or entry[0] != version:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry[1]
+
+    def put(self, object_id: str, version: Optional[str], data: dict[str, Any]) -> None:
+        """Store a payload for an object at a version.
+
+        Args:
+            object_id: Object ID.
+            version: Version stamp. Payloads without one are not cached.
+            data: Detail payload to store.
+        """
+        if version is None:
+            return
+
+        object_id = str(object_id)
+        try:
+            record = orjson.dumps({"id": object_id, "version": version, "data": data})
+        except TypeError as e:
+            logger.warning(f"Failed to cache {self._cache_type.value} entry {object_id}: {e}")
+            return
+
+        self._load()[object_id] = (version, data)
+        self._pending.append(record + b"\n")
+        if len(self._pending) >= self._flush_batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered entries to the journal in a single write."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        if self._torn_tail:
+            pending.insert(0, b"\n")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "ab") as f:
+                f.write(b"".join(pending))
+            self._torn_tail = False
+        except OSError as e:
+            logger.warning(f"Failed to write {self._cache_type.value} journal: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss statistics for this cache."""
+        return {
+            "cache_type": self._cache_type.value,
+            "path": str(self._path),
+            "entries": len(self._load()),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def _load(self) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Replay the journal into memory on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            raw = self._path.read_bytes()
+        except FileNotFoundError:
+            return self._entries
+        except OSError as e:
+            logger.warning(f"Failed to read {self._cache_type.value} journal: {e}")
+            return self._entries
+
+        lines = 0
+        for line in raw.splitlines():
+            if not line:
+                continue
+            lines += 1
+            try:
+                record = orjson.loads(line)
+                self._entries[record["id"]] = (record["version"], record["data"])
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                # A torn final line from an interrupted run is expected
+                logger.debug(f"Skipping unreadable {self._cache_type.value} journal line")
+
+        # Rewrite once superseded entries outnumber live ones, or to drop a
+        # torn final line that appends would otherwise run into
+        self._torn_tail = bool(raw) and not raw.endswith(b"\n")
+        if self._torn_tail or lines > 2 * len(self._entries):
+            self._compact()
+
+        logger.debug(
+            f"Loaded {len(self._entries)} {self._cache_type.value} entries from journal"
+        )
+        return self._entries
+
+    def _compact(self) -> None:
+        """Rewrite the journal with only the latest entry per object."""
+        tmp_path = self._path.with_suffix(".ndjson.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(b"".join(
+                    orjson.dumps({"id": object_id, "version": version, "data": data}) + b"\n"
+                    for object_id, (version, data) in self._entries.items()
+                ))
+            os.replace(tmp_path, self._path)
+            self._torn_tail = False
+        except OSError as e:
+            logger.warning(f"Failed to compact {self._cache_type.value} journal: {e}")
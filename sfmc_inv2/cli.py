@@ -15,6 +15,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from . import __version__
+from .cache import get_detail_cache_dir
 from .core.config import get_config, get_config_with_account
 from .extractors import list_extractors, EXTRACTORS
 from .orchestration import (
@@ -111,6 +112,11 @@ def run(
         "--content/--no-content",
         help="Include content (SQL, scripts)",
     ),
+    detail_cache: bool = typer.Option(
+        False,
+        "--detail-cache/--no-detail-cache",
+        help="Reuse journey details from previous runs when unchanged (stats may be stale)",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -197,6 +203,7 @@ def run(
                 include_details,
                 include_content,
                 effective_account_id,
+                detail_cache,
             )
         )
     else:
@@ -214,6 +221,7 @@ async def run_cli_extraction(
     include_details: bool,
     include_content: bool,
     account_id: Optional[str] = None,
+    detail_cache: bool = False,
 ) -> None:
     """Run extraction in CLI mode with progress display."""
     if account_id:
@@ -244,6 +252,7 @@ async def run_cli_extraction(
     runner_config = RunnerConfig(
         include_details=include_details,
         include_content=include_content,
+        detail_cache_dir=get_detail_cache_dir() if detail_cache else None,
         progress_callback=progress_callback,
     )
 
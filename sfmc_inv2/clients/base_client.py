@@ -0,0 +1,92 @@
+"""Shared connection handling for the SFMC API clients."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+import httpx
+
+if TYPE_CHECKING:
+    from ..orchestration.rate_limiter import AdaptiveConcurrencyLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class LimitedClientMixin:
+    """Request slot handling for clients gated by a concurrency limiter.
+
+    Clients set ``_limiter`` to an AdaptiveConcurrencyLimiter, or None to
+    send requests unlimited.
+    """
+
+    _limiter: Optional["AdaptiveConcurrencyLimiter"] = None
+
+    def _acquire_slot(self) -> None:
+        """Wait for a request slot when a concurrency limiter is set."""
+        if self._limiter is not None:
+            self._limiter.acquire()
+
+    async def _acquire_slot_async(self) -> None:
+        """Wait for a request slot without blocking the event loop."""
+        if self._limiter is not None:
+            await self._limiter.acquire_async()
+
+    def _release_slot(self, overloaded: bool) -> None:
+        """Return a request slot, reporting whether the API was overloaded."""
+        if self._limiter is not None:
+            self._limiter.release(overloaded)
+
+
+class AsyncHTTPPool:
+    """A pooled httpx.AsyncClient shared by one API client's async requests.
+
+    Async requests share one client, so their keep-alive connections are
+    reused instead of paying a TCP/TLS handshake per request. An
+    AsyncClient's connections belong to the event loop that opened them,
+    so a client left over from an earlier loop (e.g. a previous
+    asyncio.run()) is replaced.
+    """
+
+    def __init__(self, timeout: float):
+        """Initialize the pool.
+
+        Args:
+            timeout: Request timeout in seconds for the pooled client.
+        """
+        self._timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> httpx.AsyncClient:
+        """Get the client for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                self._drop_stale(self._loop)
+            self._client = httpx.AsyncClient(timeout=self._timeout)
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client's connections."""
+        client, loop = self._client, self._loop
+        self._client = self._loop = None
+        if client is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            self._drop_stale(loop)
+
+    def _drop_stale(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Report a client that can't be closed from the current event loop.
+
+        Its connections can only be closed on the loop that opened them,
+        which has usually finished by now, so they are left to be released
+        when the client is garbage-collected.
+        """
+        state = "closed" if loop is None or loop.is_closed() else "still open"
+        logger.warning(
+            f"Dropping an async HTTP client from another event loop ({state}) "
+            "without closing it; call aclose() before that loop finishes"
+        )
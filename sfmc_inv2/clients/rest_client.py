@@ -10,12 +10,17 @@ Provides both synchronous and asynchronous HTTP operations with:
 import asyncio
 import logging
 import time
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import httpx
+import orjson
 
 from ..core.config import SFMCConfig, get_config
 from .auth import TokenManager, get_token_manager
+from .base_client import AsyncHTTPPool, LimitedClientMixin
+
+if TYPE_CHECKING:
+    from ..orchestration.rate_limiter import AdaptiveConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +30,10 @@ RETRY_DELAY = 1.0  # Base delay in seconds
 RETRY_BACKOFF = 2.0  # Exponential backoff multiplier
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 DEFAULT_RATE_LIMIT_DELAY = 60.0  # Default delay for 429 when no Retry-After header
+OVERLOAD_STATUS_CODES = {429, 503}  # Reported to the concurrency limiter
 
 
-class RESTClient:
+class RESTClient(LimitedClientMixin):
     """REST API client for SFMC.
 
     Supports both sync and async operations with automatic retry and token refresh.
@@ -37,22 +43,31 @@ class RESTClient:
         self,
         config: Optional[SFMCConfig] = None,
         token_manager: Optional[TokenManager] = None,
+        limiter: Optional["AdaptiveConcurrencyLimiter"] = None,
     ):
         """Initialize the REST client.
 
         Args:
             config: SFMC configuration. If None, loads from environment.
             token_manager: Token manager instance. If None, uses default.
+            limiter: Concurrency limiter gating each HTTP attempt. If None,
+                requests are not limited.
         """
         self._config = config or get_config()
         self._token_manager = token_manager or get_token_manager(config)
         self._debug = self._config.rest_debug
+        self._async_http = AsyncHTTPPool(timeout=60)
+        self._limiter = limiter
 
     @property
     def base_url(self) -> str:
         """Get the REST API base URL."""
         return self._config.rest_url
 
+    async def aclose(self) -> None:
+        """Close pooled async HTTP connections."""
+        await self._async_http.aclose()
+
     def _log_request(self, method: str, url: str, **kwargs: Any) -> None:
         """Log request details if debug is enabled."""
         if self._debug:
@@ -87,10 +102,11 @@ class RESTClient:
             "status_code": response.status_code,
         }
 
+        # orjson decodes straight from the response bytes, which is noticeably
+        # faster than httpx's stdlib-json path on large journey/asset payloads
         try:
-            data = response.json()
-            result["data"] = data
-        except Exception:
+            result["data"] = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             result["data"] = response.text
 
         if not response.is_success:
@@ -140,12 +156,18 @@ class RESTClient:
 
             try:
                 with httpx.Client(timeout=60) as client:
-                    response = client.request(
-                        method,
-                        url,
-                        headers=headers,
-                        **kwargs,
-                    )
+                    self._acquire_slot()
+                    overloaded = True
+                    try:
+                        response = client.request(
+                            method,
+                            url,
+                            headers=headers,
+                            **kwargs,
+                        )
+                        overloaded = response.status_code in OVERLOAD_STATUS_CODES
+                    finally:
+                        self._release_slot(overloaded)
 
                     # Handle 401 - token expired
                     if response.status_code == 401:
@@ -208,31 +230,37 @@ class RESTClient:
             headers = self._build_headers(token)
 
             try:
-                async with httpx.AsyncClient(timeout=60) as client:
+                client = self._async_http.get()
+                await self._acquire_slot_async()
+                overloaded = True
+                try:
                     response = await client.request(
                         method,
                         url,
                         headers=headers,
                         **kwargs,
                     )
+                    overloaded = response.status_code in OVERLOAD_STATUS_CODES
+                finally:
+                    self._release_slot(overloaded)
+
+                # Handle 401 - token expired
+                if response.status_code == 401:
+                    logger.debug("Got 401, refreshing token")
+                    self._token_manager.force_refresh()
+                    continue
+
+                # Handle retryable errors
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    delay = self._get_retry_delay(response, attempt)
+                    logger.debug(
+                        f"Got {response.status_code}, retrying in {delay}s "
+                        f"(attempt {attempt + 1}/{MAX_RETRIES})"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
 
-                    # Handle 401 - token expired
-                    if response.status_code == 401:
-                        logger.debug("Got 401, refreshing token")
-                        self._token_manager.force_refresh()
-                        continue
-
-                    # Handle retryable errors
-                    if response.status_code in RETRYABLE_STATUS_CODES:
-                        delay = self._get_retry_delay(response, attempt)
-                        logger.debug(
-                            f"Got {response.status_code}, retrying in {delay}s "
-                            f"(attempt {attempt + 1}/{MAX_RETRIES})"
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-
-                    return self._handle_response(response)
+                return self._handle_response(response)
 
             except httpx.TimeoutException as e:
                 last_error = e
@@ -7,8 +7,9 @@ for SFMC's SOAP API endpoints.
 import asyncio
 import logging
 import os
+import threading
 import time
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Collection, Iterator, Optional, Sequence
 from xml.etree import ElementTree as ET
 from xml.etree.ElementTree import Element
 
@@ -16,6 +17,10 @@ import httpx
 
 from ..core.config import SFMCConfig, get_config
 from .auth import TokenManager, get_token_manager
+from .base_client import AsyncHTTPPool, LimitedClientMixin
+
+if TYPE_CHECKING:
+    from ..orchestration.rate_limiter import AdaptiveConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,7 @@ MAX_RETRIES = 3
 RETRY_DELAY = 1.0
 RETRY_BACKOFF = 2.0
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+OVERLOAD_STATUS_CODES = {429, 503}  # Reported to the concurrency limiter
 
 # Default maximum pages for pagination safety (can be overridden via config)
 DEFAULT_MAX_PAGES = 100
@@ -63,7 +69,7 @@ def env_with_oauth(access_token: str) -> Element:
 
 def build_retrieve_request(
     object_type: str,
-    properties: list[str],
+    properties: Sequence[str],
     filter_xml: Optional[Element] = None,
     query_all_accounts: bool = False,
 ) -> Element:
@@ -71,7 +77,7 @@ def build_retrieve_request(
 
     Args:
         object_type: SFMC object type (e.g., "Automation", "DataExtension")
-        properties: List of property names to retrieve
+        properties: Property names to retrieve
         filter_xml: Optional Filter element for the request
         query_all_accounts: If True, adds QueryAllAccounts option to retrieve
             objects from all Business Units (requires parent BU credentials)
@@ -207,13 +213,18 @@ def parse_soap_response(response_xml: str) -> dict[str, Any]:
     return result
 
 
-def parse_retrieve_response(response_xml: str) -> dict[str, Any]:
+def parse_retrieve_response(
+    response_xml: str, nested_fields: Collection[str] = ()
+) -> dict[str, Any]:
     """Parse a SOAP RetrieveResponse specifically.
 
     Optimized for Retrieve operations with object list extraction.
 
     Args:
         response_xml: Raw XML response string.
+        nested_fields: Names of nested object fields (e.g. "Email" for an
+            "Email.ID" property). Each object gets a dict for every one of
+            these, empty when the response omitted it or gave a scalar.
 
     Returns:
         Dict with ok, overall_status, request_id, objects list.
@@ -268,7 +279,11 @@ def parse_retrieve_response(response_xml: str) -> dict[str, Any]:
             if not objects:
                 objects = response_msg.findall("Results")
             for obj in objects:
-                result["objects"].append(_element_to_dict(obj))
+                item = _element_to_dict(obj)
+                for field in nested_fields:
+                    if type(item.get(field)) is not dict:
+                        item[field] = {}
+                result["objects"].append(item)
 
     except ET.ParseError as e:
         result["error"] = f"XML parse error: {e}"
@@ -276,6 +291,18 @@ def parse_retrieve_response(response_xml: str) -> dict[str, Any]:
     return result
 
 
+def nested_object_fields(properties: Sequence[str]) -> frozenset[str]:
+    """Get the nested object field names requested by a property list.
+
+    Args:
+        properties: Retrieve properties, e.g. ["Name", "Email.ID"].
+
+    Returns:
+        Top-level names of dotted properties, e.g. {"Email"}.
+    """
+    return frozenset(prop.split(".", 1)[0] for prop in properties if "." in prop)
+
+
 def _element_to_dict(element: Element) -> dict[str, Any]:
     """Convert an XML element to a dictionary recursively.
 
@@ -316,7 +343,7 @@ def _element_to_dict(element: Element) -> dict[str, Any]:
     return result
 
 
-class SOAPClient:
+class SOAPClient(LimitedClientMixin):
     """SOAP API client for SFMC.
 
     Provides methods for making SOAP requests with automatic retry,
@@ -327,23 +354,81 @@ class SOAPClient:
         self,
         config: Optional[SFMCConfig] = None,
         token_manager: Optional[TokenManager] = None,
+        limiter: Optional["AdaptiveConcurrencyLimiter"] = None,
     ):
         """Initialize the SOAP client.
 
         Args:
             config: SFMC configuration. If None, loads from environment.
             token_manager: Token manager instance. If None, uses default.
+            limiter: Concurrency limiter gating each HTTP attempt. If None,
+                requests are not limited.
         """
         self._config = config or get_config()
         self._token_manager = token_manager or get_token_manager(config)
         self._debug = self._config.soap_debug
         self._max_pages = self._config.soap_max_pages
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+        self._async_http = AsyncHTTPPool(timeout=120)
+        self._limiter = limiter
 
     @property
     def endpoint(self) -> str:
         """Get the SOAP API endpoint URL."""
         return self._config.soap_url
 
+    def _get_http_client(self) -> httpx.Client:
+        """Get the pooled HTTP client, creating it on first use.
+
+        One client is shared by every request, including those made from
+        extractor worker threads, so keep-alive connections to the SOAP
+        endpoint are reused instead of opening a new TCP/TLS connection
+        for each page.
+        """
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httpx.Client(timeout=120)
+        return self._http
+
+    def close(self) -> None:
+        """Close pooled sync HTTP connections.
+
+        The async client can only be closed from its event loop; use aclose().
+        """
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    async def aclose(self) -> None:
+        """Close all pooled HTTP connections, including async ones."""
+        self.close()
+        await self._async_http.aclose()
+
+    def _send(self, xml_bytes: bytes) -> httpx.Response:
+        """POST a request envelope over the pooled client.
+
+        Holds a limiter slot for the duration of the HTTP call only, so
+        retry backoff doesn't occupy one.
+        """
+        self._acquire_slot()
+        overloaded = True
+        try:
+            response = self._get_http_client().post(
+                self.endpoint,
+                content=xml_bytes,
+                headers={
+                    "Content-Type": "text/xml; charset=utf-8",
+                    "SOAPAction": "Retrieve",
+                },
+            )
+            overloaded = response.status_code in OVERLOAD_STATUS_CODES
+            return response
+        finally:
+            self._release_slot(overloaded)
+
     def _log_request(self, xml: str) -> None:
         """Log request XML if debug is enabled."""
         if self._debug:
@@ -371,29 +456,21 @@ class SOAPClient:
 
         for attempt in range(MAX_RETRIES):
             try:
-                with httpx.Client(timeout=120) as client:
-                    response = client.post(
-                        self.endpoint,
-                        content=xml_bytes,
-                        headers={
-                            "Content-Type": "text/xml; charset=utf-8",
-                            "SOAPAction": "Retrieve",
-                        },
-                    )
+                response = self._send(xml_bytes)
 
-                    self._log_response(response.text)
+                self._log_response(response.text)
 
-                    # Handle retryable HTTP errors
-                    if response.status_code in RETRYABLE_STATUS_CODES:
-                        delay = RETRY_DELAY * (RETRY_BACKOFF**attempt)
-                        logger.debug(
-                            f"Got {response.status_code}, retrying in {delay}s "
-                            f"(attempt {attempt + 1}/{MAX_RETRIES})"
-                        )
-                        time.sleep(delay)
-                        continue
+                # Handle retryable HTTP errors
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    delay = RETRY_DELAY * (RETRY_BACKOFF**attempt)
+                    logger.debug(
+                        f"Got {response.status_code}, retrying in {delay}s "
+                        f"(attempt {attempt + 1}/{MAX_RETRIES})"
+                    )
+                    time.sleep(delay)
+                    continue
 
-                    return parse_soap_response(response.text)
+                return parse_soap_response(response.text)
 
             except httpx.TimeoutException as e:
                 last_error = e
@@ -427,7 +504,10 @@ class SOAPClient:
 
         for attempt in range(MAX_RETRIES):
             try:
-                async with httpx.AsyncClient(timeout=120) as client:
+                client = self._async_http.get()
+                await self._acquire_slot_async()
+                overloaded = True
+                try:
                     response = await client.post(
                         self.endpoint,
                         content=xml_bytes,
@@ -436,20 +516,23 @@ class SOAPClient:
                             "SOAPAction": "Retrieve",
                         },
                     )
+                    overloaded = response.status_code in OVERLOAD_STATUS_CODES
+                finally:
+                    self._release_slot(overloaded)
+
+                self._log_response(response.text)
+
+                # Handle retryable HTTP errors
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    delay = RETRY_DELAY * (RETRY_BACKOFF**attempt)
+                    logger.debug(
+                        f"Got {response.status_code}, retrying in {delay}s "
+                        f"(attempt {attempt + 1}/{MAX_RETRIES})"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
 
-                    self._log_response(response.text)
-
-                    # Handle retryable HTTP errors
-                    if response.status_code in RETRYABLE_STATUS_CODES:
-                        delay = RETRY_DELAY * (RETRY_BACKOFF**attempt)
-                        logger.debug(
-                            f"Got {response.status_code}, retrying in {delay}s "
-                            f"(attempt {attempt + 1}/{MAX_RETRIES})"
-                        )
-                        await asyncio.sleep(delay)
-                        continue
-
-                    return parse_soap_response(response.text)
+                return parse_soap_response(response.text)
 
             except httpx.TimeoutException as e:
                 last_error = e
@@ -469,7 +552,7 @@ class SOAPClient:
     def retrieve(
         self,
         object_type: str,
-        properties: list[str],
+        properties: Sequence[str],
         filter_xml: Optional[Element] = None,
         query_all_accounts: bool = False,
     ) -> dict[str, Any]:
@@ -477,13 +560,15 @@ class SOAPClient:
 
         Args:
             object_type: SFMC object type to retrieve.
-            properties: List of properties to retrieve.
+            properties: Properties to retrieve.
             filter_xml: Optional filter element.
             query_all_accounts: If True, retrieve from all Business Units.
 
         Returns:
-            Parsed response with objects list.
+            Parsed response with objects list. Nested object fields named
+            by dotted properties are always dicts (empty if not returned).
         """
+        nested = nested_object_fields(properties)
         token = self._token_manager.get_token()
         envelope = env_with_oauth(token)
         body = envelope.find(f".//{{{SOAP_ENV}}}Body")
@@ -500,36 +585,28 @@ class SOAPClient:
 
         for attempt in range(MAX_RETRIES):
             try:
-                with httpx.Client(timeout=120) as client:
-                    response = client.post(
-                        self.endpoint,
-                        content=xml_bytes,
-                        headers={
-                            "Content-Type": "text/xml; charset=utf-8",
-                            "SOAPAction": "Retrieve",
-                        },
-                    )
+                response = self._send(xml_bytes)
 
-                    self._log_response(response.text)
+                self._log_response(response.text)
 
-                    if response.status_code == 401:
-                        self._token_manager.force_refresh()
-                        # Rebuild envelope with new token
-                        token = self._token_manager.get_token()
-                        envelope = env_with_oauth(token)
-                        body = envelope.find(f".//{{{SOAP_ENV}}}Body")
-                        body.append(build_retrieve_request(
-                            object_type, properties, filter_xml, query_all_accounts
-                        ))  # type: ignore
-                        xml_bytes = ET.tostring(envelope, encoding="utf-8", xml_declaration=True)
-                        continue
+                if response.status_code == 401:
+                    self._token_manager.force_refresh()
+                    # Rebuild envelope with new token
+                    token = self._token_manager.get_token()
+                    envelope = env_with_oauth(token)
+                    body = envelope.find(f".//{{{SOAP_ENV}}}Body")
+                    body.append(build_retrieve_request(
+                        object_type, properties, filter_xml, query_all_accounts
+                    ))  # type: ignore
+                    xml_bytes = ET.tostring(envelope, encoding="utf-8", xml_declaration=True)
+                    continue
 
-                    if response.status_code in RETRYABLE_STATUS_CODES:
-                        delay = RETRY_DELAY * (RETRY_BACKOFF**attempt)
-                        time.sleep(delay)
-                        continue
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    delay = RETRY_DELAY * (RETRY_BACKOFF**attempt)
+                    time.sleep(delay)
+                    continue
 
-                    return parse_retrieve_response(response.text)
+                return parse_retrieve_response(response.text, nested)
 
             except (httpx.TimeoutException, httpx.RequestError) as e:
                 last_error = e
@@ -544,7 +621,7 @@ class SOAPClient:
     def retrieve_all_pages(
         self,
         object_type: str,
-        properties: list[str],
+        properties: Sequence[str],
         filter_xml: Optional[Element] = None,
         max_pages: Optional[int] = None,
         query_all_accounts: bool = False,
@@ -553,7 +630,7 @@ class SOAPClient:
 
         Args:
             object_type: SFMC object type to retrieve.
-            properties: List of properties to retrieve.
+            properties: Properties to retrieve.
             filter_xml: Optional filter element.
             max_pages: Maximum number of pages to retrieve. Defaults to config value.
             query_all_accounts: If True, retrieve from all Business Units.
@@ -561,19 +638,60 @@ class SOAPClient:
         Returns:
             Combined response with all objects.
         """
+        all_objects: list[dict[str, Any]] = []
+        pages = 0
+
+        for result in self.iter_retrieve_pages(
+            object_type, properties, filter_xml, max_pages, query_all_accounts
+        ):
+            if not result.get("ok"):
+                return result
+            all_objects.extend(result.get("objects", []))
+            pages += 1
+
+        return {
+            "ok": True,
+            "objects": all_objects,
+            "pages_retrieved": pages,
+        }
+
+    def iter_retrieve_pages(
+        self,
+        object_type: str,
+        properties: Sequence[str],
+        filter_xml: Optional[Element] = None,
+        max_pages: Optional[int] = None,
+        query_all_accounts: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """Retrieve objects one page at a time.
+
+        Each page is requested only when the previous one has been consumed,
+        so callers can process a page before the next is fetched. A failed
+        first request is yielded so its error can be reported; a failed
+        continuation request ends iteration.
+
+        Args:
+            object_type: SFMC object type to retrieve.
+            properties: Properties to retrieve.
+            filter_xml: Optional filter element.
+            max_pages: Maximum number of pages to retrieve. Defaults to config value.
+            query_all_accounts: If True, retrieve from all Business Units.
+
+        Yields:
+            Parsed response for each page, with its objects list.
+        """
         if max_pages is None:
             max_pages = self._max_pages
-        all_objects: list[dict[str, Any]] = []
+        nested = nested_object_fields(properties)
         page = 1
 
         # First request
         result = self.retrieve(
             object_type, properties, filter_xml, query_all_accounts
         )
+        yield result
         if not result.get("ok"):
-            return result
-
-        all_objects.extend(result.get("objects", []))
+            return
 
         # Pagination loop
         while result.get("overall_status") == "MoreDataAvailable" and page < max_pages:
@@ -590,31 +708,17 @@ class SOAPClient:
             xml_bytes = ET.tostring(envelope, encoding="utf-8", xml_declaration=True)
 
             try:
-                with httpx.Client(timeout=120) as client:
-                    response = client.post(
-                        self.endpoint,
-                        content=xml_bytes,
-                        headers={
-                            "Content-Type": "text/xml; charset=utf-8",
-                            "SOAPAction": "Retrieve",
-                        },
-                    )
-                    result = parse_retrieve_response(response.text)
-
-                    if result.get("ok"):
-                        all_objects.extend(result.get("objects", []))
-                    else:
-                        break
+                response = self._send(xml_bytes)
+                result = parse_retrieve_response(response.text, nested)
 
             except Exception as e:
                 logger.error(f"Pagination error on page {page}: {e}")
                 break
 
-        return {
-            "ok": True,
-            "objects": all_objects,
-            "pages_retrieved": page,
-        }
+            if not result.get("ok"):
+                break
+
+            yield result
 
 
 # Module-level convenience functions
@@ -632,4 +736,6 @@ def get_soap_client(config: Optional[SFMCConfig] = None) -> SOAPClient:
 def reset_soap_client() -> None:
     """Reset the default SOAP client singleton."""
     global _default_client
+    if _default_client is not None:
+        _default_client.close()
     _default_client = None
@@ -149,7 +149,7 @@ class AutomationExtractor(BaseExtractor):
         self._pages_fetched = 0
 
         while page <= options.max_pages:
-            result = self._rest.get(
+            result = await self._rest.get_async(
                 f"/automation/v1/automations?$page={page}&$pageSize={options.page_size}"
             )
 
@@ -215,7 +215,7 @@ class AutomationExtractor(BaseExtractor):
         self, automation_id: str
     ) -> Optional[dict[str, Any]]:
         """Fetch detailed automation info including steps."""
-        result = self._rest.get(f"/automation/v1/automations/{automation_id}")
+        result = await self._rest.get_async(f"/automation/v1/automations/{automation_id}")
 
         if result.get("ok"):
             return result.get("data", {})
@@ -6,10 +6,14 @@ consistent fetch -> enrich -> transform pipeline.
 
 import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Generic, Optional, TypeVar
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Generic, Iterable, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -24,6 +28,21 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+def coerce_soap_bool(value: Any) -> Any:
+    """Convert a SOAP "true"/"false" string to bool.
+
+    Non-string values (already-parsed bools, None, defaults) pass through
+    unchanged.
+
+    Args:
+        value: Raw field value from a SOAP response.
+
+    Returns:
+        True/False for string input, otherwise the value itself.
+    """
+    return value == "true" if isinstance(value, str) else value
+
+
 @dataclass
 class ExtractorOptions:
     """Options for configuring extractor behavior."""
@@ -36,10 +55,21 @@ class ExtractorOptions:
     max_concurrent: int = 5
     delay_between_requests: float = 0.0
 
+    # Worker threads for this extractor's blocking HTTP calls. Each extract()
+    # gets its own pool so concurrent (e.g. multi-BU) runs don't contend for
+    # the event loop's small default executor.
+    http_workers: int = 32
+
     # Filtering
     include_details: bool = True
     include_content: bool = False
 
+    # Persistent detail cache directory (None disables cross-run caching)
+    detail_cache_dir: Optional[Path] = None
+
+    # Relationship types to extract (None extracts all; empty set skips)
+    relationship_types: Optional[set[RelationshipType]] = None
+
     # Progress
     progress_callback: Optional[Callable[[str, int, int], None]] = None
 
@@ -108,6 +138,15 @@ class ExtractorResult:
             )
         )
 
+    def add_relationships(self, edges: Iterable[RelationshipEdge]) -> None:
+        """Add already-built relationship edges to the result in one step.
+
+        Args:
+            edges: Relationship edges, e.g. collected for one source object
+                or yielded lazily by a generator.
+        """
+        self.relationships.extend(edges)
+
     @property
     def duration_seconds(self) -> float:
         """Get extraction duration in seconds."""
@@ -166,29 +205,32 @@ class BaseExtractor(ABC, Generic[T]):
         """
         options = options or ExtractorOptions()
         result = ExtractorResult(extractor_name=self.name)
+        self._breadcrumb_memo: dict[tuple[CacheType, Optional[str]], str] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=options.http_workers,
+            thread_name_prefix=f"{self.name}-fetch",
+        )
 
         try:
             # Warm required caches
             await self._warm_caches(options)
 
-            # Fetch raw data
+            # Fetch raw data, running each batch through the rest of the
+            # pipeline before the next one is pulled
             self._report_progress(options, "Fetching", 0, 0)
-            raw_items = await self.fetch_data(options)
-            result.pages_fetched = getattr(self, "_pages_fetched", 1)
-
-            # Enrich data
-            self._report_progress(options, "Enriching", 0, len(raw_items))
-            enriched_items = await self.enrich_data(raw_items, options, result)
+            async for raw_items in self.iter_batches(options):
+                # Enrich data
+                self._report_progress(options, "Enriching", 0, len(raw_items))
+                enriched_items = await self.enrich_data(raw_items, options, result)
+
+                # Transform to output format and extract relationships
+                result.items.extend(
+                    await self.transform_and_extract(enriched_items, options, result)
+                )
 
-            # Transform to output format
-            self._report_progress(options, "Transforming", 0, len(enriched_items))
-            result.items = self.transform_data(enriched_items, options)
+            result.pages_fetched = getattr(self, "_pages_fetched", 1)
             result.item_count = len(result.items)
 
-            # Extract relationships
-            self._report_progress(options, "Analyzing relationships", 0, 0)
-            await self.extract_relationships(enriched_items, result)
-
             result.success = True
 
         except Exception as e:
@@ -196,6 +238,10 @@ class BaseExtractor(ABC, Generic[T]):
             result.add_error("ExtractionError", str(e))
             result.success = False
 
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
         result.completed_at = datetime.now()
         return result
 
@@ -224,6 +270,25 @@ class BaseExtractor(ABC, Generic[T]):
         """
         ...
 
+    async def iter_batches(
+        self, options: ExtractorOptions
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield raw items in batches for pipelined processing.
+
+        Each batch is enriched, transformed, and analyzed for relationships
+        before the next batch is requested, so only one batch of raw items
+        is held at a time. Default implementation yields the full
+        fetch_data() result as a single batch. Override to stream pages
+        when relationships can be extracted per item.
+
+        Args:
+            options: Extraction options.
+
+        Yields:
+            Lists of raw object dictionaries.
+        """
+        yield await self.fetch_data(options)
+
     async def enrich_data(
         self,
         items: list[dict[str, Any]],
@@ -243,6 +308,10 @@ class BaseExtractor(ABC, Generic[T]):
         Returns:
             List of enriched items.
         """
+        # Nothing to do per item; skip a no-op await for every one
+        if type(self).enrich_item is BaseExtractor.enrich_item:
+            return items
+
         enriched = []
         for i, item in enumerate(items):
             try:
@@ -300,6 +369,43 @@ class BaseExtractor(ABC, Generic[T]):
         """
         return items
 
+    async def transform_and_extract(
+        self,
+        items: list[dict[str, Any]],
+        options: ExtractorOptions,
+        result: ExtractorResult,
+    ) -> list[dict[str, Any]]:
+        """Transform items and extract their relationships.
+
+        Default implementation runs transform_data, then
+        extract_relationships, keeping only edges whose type is in
+        options.relationship_types when set. Override to do both in a
+        single pass.
+
+        Args:
+            items: Enriched items.
+            options: Extraction options.
+            result: Result object to add relationships to.
+
+        Returns:
+            List of transformed items.
+        """
+        self._report_progress(options, "Transforming", 0, len(items))
+        transformed = self.transform_data(items, options)
+
+        wanted = options.relationship_types
+        if wanted is None or wanted:
+            self._report_progress(options, "Analyzing relationships", 0, 0)
+            start = len(result.relationships)
+            await self.extract_relationships(items, result)
+            if wanted is not None:
+                result.relationships[start:] = [
+                    edge for edge in result.relationships[start:]
+                    if edge.relationship_type in wanted
+                ]
+
+        return transformed
+
     async def extract_relationships(
         self,
         items: list[dict[str, Any]],
@@ -323,12 +429,168 @@ class BaseExtractor(ABC, Generic[T]):
         self._report_progress(options, "Warming caches", 0, len(self.required_caches))
 
         # Cache warming is synchronous, run in thread pool
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            self._cache.warm,
-            self.required_caches,
-        )
+        await self._run_blocking(self._cache.warm, self.required_caches)
+
+    async def _run_blocking(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run a blocking call on this extractor's thread pool.
+
+        Falls back to the event loop's default executor when called outside
+        extract() (e.g. from tests driving a single pipeline stage).
+
+        Args:
+            func: Blocking callable, typically a sync client method.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The callable's return value.
+        """
+        if kwargs:
+            func = partial(func, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(getattr(self, "_executor", None), func, *args)
+
+    async def _iter_rest_pages(
+        self,
+        url_prefix: str,
+        label: str,
+        options: ExtractorOptions,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the items of a paginated REST collection one page at a time.
+
+        After the first page, up to ``options.max_concurrent`` pages are
+        requested at once and yielded in page order. Pagination stops at
+        the first failed, empty, or short page; any later pages already
+        fetched in the same window are discarded.
+
+        Args:
+            url_prefix: Request URL up to and including ``$page=``.
+            label: Collection name for log and progress messages.
+            options: Extraction options.
+
+        Yields:
+            Non-empty lists of items, one per page.
+        """
+        fetched = 0
+        self._pages_fetched = 0
+
+        async def fetch_page(page: int) -> Optional[dict[str, Any]]:
+            result = await self._run_blocking(self._rest.get, url_prefix + str(page))
+            if not result.get("ok"):
+                logger.error(f"Failed to fetch {label} page {page}: {result.get('error')}")
+                return None
+            return result.get("data") or {}
+
+        # The first page tells us whether there's more, and how much
+        data = await fetch_page(1)
+        if data is None:
+            return
+
+        last_page = options.max_pages
+        total = data.get("count")
+        if isinstance(total, int) and total > 0:
+            last_page = min(last_page, -(-total // options.page_size))
+
+        page = 1
+        window: list[Optional[dict[str, Any]]] = []
+        while True:
+            items = data.get("items") or []
+            if not items:
+                return
+
+            fetched += len(items)
+            self._pages_fetched = page
+
+            self._report_progress(options, "Fetching", fetched, 0)
+
+            yield items
+
+            if len(items) < options.page_size or page >= last_page:
+                return
+
+            # Fetch the next window of pages concurrently; one is yielded per
+            # loop pass and the rest are held until their turn
+            if not window:
+                window_end = min(page + max(options.max_concurrent, 1), last_page)
+                window = list(await asyncio.gather(*(
+                    fetch_page(next_page)
+                    for next_page in range(page + 1, window_end + 1)
+                )))
+
+            page += 1
+            data = window.pop(0)
+            if data is None:
+                return
+
+    async def _iter_soap_pages(
+        self,
+        label: str,
+        options: ExtractorOptions,
+        **retrieve_kwargs: Any,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield SOAP Retrieve results one page at a time.
+
+        Each continuation request runs on this extractor's thread pool and
+        is only sent once the previous page has been yielded, so a page is
+        transformed and released before the next arrives.
+
+        Args:
+            label: Collection name for log and progress messages.
+            options: Extraction options.
+            **retrieve_kwargs: Arguments for SOAPClient.iter_retrieve_pages().
+
+        Yields:
+            Non-empty lists of objects, one per page.
+        """
+        pages = self._soap.iter_retrieve_pages(**retrieve_kwargs)
+        fetched = 0
+        self._pages_fetched = 0
+
+        # A generator can't be closed while a worker is inside next(), which
+        # happens if this task is cancelled mid-request
+        pages_lock = threading.Lock()
+
+        def next_page() -> Optional[dict[str, Any]]:
+            with pages_lock:
+                return next(pages, None)
+
+        def close_pages() -> None:
+            with pages_lock:
+                pages.close()
+
+        try:
+            while True:
+                result = await self._run_blocking(next_page)
+                if result is None:
+                    break
+
+                if not result.get("ok"):
+                    logger.error(f"Failed to fetch {label}: {result.get('error')}")
+                    break
+
+                objects = result.get("objects", [])
+                fetched += len(objects)
+                self._pages_fetched += 1
+
+                self._report_progress(options, "Fetching", fetched, 0)
+
+                if objects:
+                    yield objects
+        finally:
+            if pages_lock.acquire(blocking=False):
+                try:
+                    pages.close()
+                finally:
+                    pages_lock.release()
+            else:
+                # Close once the in-flight page request returns
+                threading.Thread(
+                    target=close_pages, name=f"{self.name}-close", daemon=True
+                ).start()
+
+        logger.info(f"Retrieved {fetched} {label}")
 
     def _report_progress(
         self,
@@ -346,5 +608,18 @@ class BaseExtractor(ABC, Generic[T]):
         folder_id: Optional[str],
         cache_type: CacheType,
     ) -> str:
-        """Get breadcrumb path for a folder ID."""
-        return self._cache.get_breadcrumb(folder_id, cache_type)
+        """Get breadcrumb path for a folder ID.
+
+        Paths are memoized for the current extract() run, since most items
+        share a handful of folders and each cache manager lookup takes its
+        lock and re-checks missing folders.
+        """
+        memo = getattr(self, "_breadcrumb_memo", None)
+        if memo is None:
+            memo = self._breadcrumb_memo = {}
+
+        key = (cache_type, folder_id)
+        path = memo.get(key)
+        if path is None:
+            path = memo[key] = self._cache.get_breadcrumb(folder_id, cache_type)
+        return path
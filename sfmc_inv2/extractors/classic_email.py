@@ -8,7 +8,7 @@ import logging
 from typing import Any
 
 from ..cache.cache_manager import CacheType
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult, coerce_soap_bool
 
 logger = logging.getLogger(__name__)
 
@@ -112,9 +112,9 @@ class ClassicEmailExtractor(BaseExtractor):
                 # Email properties
                 "subject": item.get("Subject"),
                 "status": item.get("Status"),
-                "isHTMLPaste": item.get("IsHTMLPaste") == "true" if isinstance(item.get("IsHTMLPaste"), str) else item.get("IsHTMLPaste"),
+                "isHTMLPaste": coerce_soap_bool(item.get("IsHTMLPaste")),
                 "characterSet": item.get("CharacterSet"),
-                "hasDynamicSubjectLine": item.get("HasDynamicSubjectLine") == "true" if isinstance(item.get("HasDynamicSubjectLine"), str) else item.get("HasDynamicSubjectLine"),
+                "hasDynamicSubjectLine": coerce_soap_bool(item.get("HasDynamicSubjectLine")),
                 "preHeader": item.get("PreHeader"),
                 "hasPreheader": bool(item.get("PreHeader")),
                 # Folder
@@ -206,9 +206,7 @@ class DataExtensionExtractor(BaseExtractor):
         Endpoint: GET /data/v1/customobjects/{id}/fields
         """
         # Run sync request in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
+        result = await self._run_blocking(
             self._rest.get,
             f"/data/v1/customobjects/{de_id}/fields",
         )
@@ -31,7 +31,7 @@ class EventDefinitionExtractor(BaseExtractor):
         self._pages_fetched = 0
 
         while page <= options.max_pages:
-            result = self._rest.get(
+            result = await self._rest.get_async(
                 f"/interaction/v1/eventDefinitions?$page={page}&$pageSize={options.page_size}"
             )
 
@@ -8,7 +8,7 @@ from typing import Any
 
 from ..clients.soap_client import build_simple_filter
 from ..types.relationships import RelationshipType
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult, coerce_soap_bool
 
 logger = logging.getLogger(__name__)
 
@@ -110,9 +110,9 @@ class FolderExtractor(BaseExtractor):
                 "contentType": item.get("ContentType") or item.get("_contentType"),
                 "parentId": parent_folder.get("ID") if isinstance(parent_folder, dict) else None,
                 "parentName": parent_folder.get("Name") if isinstance(parent_folder, dict) else None,
-                "isActive": item.get("IsActive") == "true" if isinstance(item.get("IsActive"), str) else item.get("IsActive", True),
-                "isEditable": item.get("IsEditable") == "true" if isinstance(item.get("IsEditable"), str) else item.get("IsEditable", True),
-                "allowChildren": item.get("AllowChildren") == "true" if isinstance(item.get("AllowChildren"), str) else item.get("AllowChildren", True),
+                "isActive": coerce_soap_bool(item.get("IsActive", True)),
+                "isEditable": coerce_soap_bool(item.get("IsEditable", True)),
+                "allowChildren": coerce_soap_bool(item.get("AllowChildren", True)),
                 "createdDate": item.get("CreatedDate"),
                 "modifiedDate": item.get("ModifiedDate"),
             }
@@ -6,10 +6,15 @@ Identifies relationships to DEs, emails, and automations.
 
 import asyncio
 import logging
-from typing import Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping, Optional
 
 from ..cache.cache_manager import CacheType
-from ..types.relationships import RelationshipType
+from ..cache.detail_cache import DetailCache
+from ..types.relationships import RelationshipEdge, RelationshipType
 from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,320 @@ JOURNEY_STATUS_MAP = {
     "Deleted": "Deleted",
 }
 
+# Shared relationship metadata for fixed-usage edges. RelationshipEdge copies
+# metadata on validation, so these are never mutated through the edge; callers
+# must still treat them as read-only.
+_META_ENTRY_EVENT = {"usage": "entry_event"}
+_META_PUBLICATION = {"usage": "publication_list"}
+_META_SUPPRESSION = {"usage": "suppression_list"}
+_META_DOMAIN_EXCL = {"usage": "domain_exclusion"}
+_META_HIGH_THROUGHPUT = {"usage": "high_throughput"}
+_META_UPDATE_CONTACT = {"usage": "update_contact"}
+_META_DATA_EXT_UPDATE = {"usage": "data_extension_update"}
+
+# Read-only stand-in for absent nested objects, so lookups on missing
+# configurationArguments/triggeredSend don't allocate a fresh {} each time
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
+
+# Nested output rows. Slotted dataclasses are much smaller than per-row dicts
+# for journeys with many activities; orjson serializes them natively and the
+# CSV exporter skips these nested columns.
+@dataclass(slots=True)
+class JourneyTriggerRow:
+    """Transformed journey trigger."""
+
+    id: Optional[str]
+    key: Optional[str]
+    name: Optional[str]
+    type: Optional[str]
+    eventDefinitionId: Optional[str]
+    eventDefinitionKey: Optional[str]
+
+
+@dataclass(slots=True)
+class JourneyActivityRow:
+    """Transformed journey activity."""
+
+    id: Optional[str]
+    key: Optional[str]
+    name: Optional[str]
+    type: Optional[str]
+    configurationUrl: Optional[str]
+    outcomeCount: int
+
+
+@dataclass(slots=True)
+class JourneyGoalRow:
+    """Transformed journey goal."""
+
+    name: Optional[str]
+    description: Optional[str]
+    metric: Optional[str]
+    target: Any
+
+
+# Activity relationship handlers. Each receives the journey's emit() callback
+# and the activity's configurationArguments, and emits only its own edges.
+_EmitFn = Callable[..., None]
+_ActivityHandler = Callable[[_EmitFn, Mapping[str, Any]], None]
+
+
+def _email_activity_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit email, asset, profile, and list references of an email activity.
+
+    Based on mcdev dependencyGraph paths for Journey type.
+    """
+    triggered_send = config_args.get("triggeredSend") or _EMPTY
+
+    # Email reference (classic email ID)
+    email_id = triggered_send.get("emailId")
+    if email_id:
+        emit(
+            target_id=str(email_id),
+            target_type="email",
+            relationship_type=RelationshipType.JOURNEY_USES_EMAIL,
+        )
+
+    # Asset reference (Content Builder email)
+    # mcdev path: activities.configurationArguments.triggeredSend.r__asset_key
+    asset_id = triggered_send.get("assetId")
+    asset_key = triggered_send.get("assetKey")
+    if asset_id or asset_key:
+        emit(
+            target_id=str(asset_id or asset_key),
+            target_type="asset",
+            relationship_type=RelationshipType.JOURNEY_USES_ASSET,
+            metadata={"assetKey": asset_key},
+        )
+
+    # Sender profile reference
+    sender_profile_id = triggered_send.get("senderProfileId")
+    if sender_profile_id:
+        emit(
+            target_id=str(sender_profile_id),
+            target_type="sender_profile",
+            relationship_type=RelationshipType.JOURNEY_USES_SENDER_PROFILE,
+        )
+
+    # Delivery profile reference
+    delivery_profile_id = triggered_send.get("deliveryProfileId")
+    if delivery_profile_id:
+        emit(
+            target_id=str(delivery_profile_id),
+            target_type="delivery_profile",
+            relationship_type=RelationshipType.JOURNEY_USES_DELIVERY_PROFILE,
+        )
+
+    # Send classification reference
+    send_classification_id = triggered_send.get("sendClassificationId")
+    if send_classification_id:
+        emit(
+            target_id=str(send_classification_id),
+            target_type="send_classification",
+            relationship_type=RelationshipType.JOURNEY_USES_SEND_CLASSIFICATION,
+        )
+
+    # Publication list reference
+    # mcdev path: activities.configurationArguments.triggeredSend.r__list_PathName.publicationList
+    publication_list_id = triggered_send.get("publicationListId")
+    if publication_list_id:
+        emit(
+            target_id=str(publication_list_id),
+            target_type="list",
+            relationship_type=RelationshipType.JOURNEY_USES_LIST,
+            metadata=_META_PUBLICATION,
+        )
+
+    # Suppression lists reference
+    # mcdev path: activities.configurationArguments.triggeredSend.r__list_PathName.suppressionLists
+    for supp_list in triggered_send.get("suppressionLists") or ():
+        list_id = supp_list.get("id") if isinstance(supp_list, dict) else supp_list
+        if list_id:
+            emit(
+                target_id=str(list_id),
+                target_type="list",
+                relationship_type=RelationshipType.JOURNEY_USES_LIST,
+                metadata=_META_SUPPRESSION,
+            )
+
+    # Domain exclusions DE reference
+    # mcdev path: activities.configurationArguments.triggeredSend.r__dataExtension_key.domainExclusions
+    for excl in triggered_send.get("domainExclusions") or ():
+        de_id = excl.get("id") if isinstance(excl, dict) else excl
+        if de_id:
+            emit(
+                target_id=str(de_id),
+                target_type="data_extension",
+                relationship_type=RelationshipType.JOURNEY_USES_DE,
+                metadata=_META_DOMAIN_EXCL,
+            )
+
+
+def _sms_activity_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit SMS definition, message, keyword, and code references.
+
+    Based on mcdev dependencyGraph paths for Journey type.
+    """
+    # Application extension key for SMS
+    app_ext_key = config_args.get("applicationExtensionKey")
+    if app_ext_key:
+        emit(
+            target_id=app_ext_key,
+            target_type="sms_definition",
+            relationship_type=RelationshipType.JOURNEY_USES_SMS,
+            metadata={"applicationExtensionKey": app_ext_key},
+        )
+
+    # Mobile message reference
+    # mcdev path: activities.configurationArguments.r__mobileMessage_key
+    mobile_message_id = config_args.get("mobileMessageId")
+    mobile_message_key = config_args.get("mobileMessageKey")
+    if mobile_message_id or mobile_message_key:
+        emit(
+            target_id=str(mobile_message_id or mobile_message_key),
+            target_type="mobile_message",
+            relationship_type=RelationshipType.JOURNEY_USES_MOBILE_MESSAGE,
+        )
+
+    # Mobile keyword references (current and next)
+    # mcdev paths: activities.configurationArguments.r__mobileKeyword_key.current/next
+    for kw_field in ("keywordId", "keywordKey", "currentKeywordId", "nextKeywordId"):
+        kw_value = config_args.get(kw_field)
+        if kw_value:
+            emit(
+                target_id=str(kw_value),
+                target_type="mobile_keyword",
+                relationship_type=RelationshipType.JOURNEY_USES_MOBILE_KEYWORD,
+                metadata={"field": kw_field},
+            )
+
+    # Mobile code reference
+    # mcdev path: activities.configurationArguments.r__mobileCode_key
+    mobile_code = config_args.get("mobileCode") or config_args.get("code")
+    if mobile_code:
+        emit(
+            target_id=str(mobile_code),
+            target_type="mobile_code",
+            relationship_type=RelationshipType.JOURNEY_USES_MOBILE_CODE,
+        )
+
+
+def _push_activity_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit the asset referenced by a push notification activity."""
+    # Push may reference an asset (jsonmessage subtype)
+    push_asset_id = config_args.get("assetId")
+    if push_asset_id:
+        emit(
+            target_id=str(push_asset_id),
+            target_type="asset",
+            relationship_type=RelationshipType.JOURNEY_USES_PUSH,
+            metadata={"assetType": "push"},
+        )
+
+
+def _filter_activity_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit the filter referenced by a filter/decision activity."""
+    filter_id = config_args.get("filterId")
+    if filter_id:
+        emit(
+            target_id=str(filter_id),
+            target_type="filter",
+            relationship_type=RelationshipType.JOURNEY_USES_FILTER,
+        )
+
+
+def _update_contact_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit the DE written by an Update Contact Data activity."""
+    de_key = config_args.get("deKey")
+    if de_key:
+        emit(
+            target_id=de_key,
+            target_type="data_extension",
+            relationship_type=RelationshipType.JOURNEY_USES_DE,
+            metadata=_META_UPDATE_CONTACT,
+        )
+
+
+def _de_update_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit the DE referenced by a DataExtensionUpdate activity."""
+    # May have dataExtensionId at activity level
+    de_id = config_args.get("dataExtensionId")
+    if de_id:
+        emit(
+            target_id=str(de_id),
+            target_type="data_extension",
+            relationship_type=RelationshipType.JOURNEY_USES_DE,
+            metadata=_META_DATA_EXT_UPDATE,
+        )
+
+
+def _fire_automation_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit the automation started by a Fire Automation activity."""
+    automation_id_ref = config_args.get("automationId")
+    if automation_id_ref:
+        emit(
+            target_id=str(automation_id_ref),
+            target_type="automation",
+            relationship_type=RelationshipType.JOURNEY_USES_AUTOMATION,
+        )
+
+
+def _rest_activity_relationships(emit: _EmitFn, config_args: Mapping[str, Any]) -> None:
+    """Emit the API event referenced by a REST activity."""
+    app_ext_key = config_args.get("applicationExtensionKey")
+    if app_ext_key:
+        emit(
+            target_id=app_ext_key,
+            target_type="api_event",
+            relationship_type=RelationshipType.REFERENCES,
+            metadata={
+                "usage": "rest_activity",
+                "applicationExtensionKey": app_ext_key,
+            },
+        )
+
+
+# Email activity types; their asset reference comes from triggeredSend
+_EMAIL_ACTIVITY_TYPES = frozenset({"EMAILV2", "EMAIL"})
+
+# Handlers for known activity types, dispatched by exact type
+_ACTIVITY_HANDLERS: dict[str, tuple[_ActivityHandler, ...]] = {
+    "EMAILV2": (_email_activity_relationships,),
+    "EMAIL": (_email_activity_relationships,),
+    "SMSSYNC": (_sms_activity_relationships,),
+    "SMS": (_sms_activity_relationships,),
+    "PUSH": (_push_activity_relationships,),
+    "ENGAGMENTSPLIT": (_filter_activity_relationships,),
+    "UPDATECONTACTDATA": (_update_contact_relationships,),
+    "DATAEXTENSIONUPDATE": (_de_update_relationships,),
+    "FIREAUTOMATION": (_fire_automation_relationships,),
+    "REST": (_rest_activity_relationships,),
+    "RESTACTIVITY": (_rest_activity_relationships,),
+}
+
+# Fallback handlers for other types, matched by lowercase substring
+_ACTIVITY_SUBSTRING_HANDLERS: tuple[tuple[str, _ActivityHandler], ...] = (
+    ("email", _email_activity_relationships),
+    ("push", _push_activity_relationships),
+    ("filter", _filter_activity_relationships),
+)
+
+
+@lru_cache(maxsize=256)
+def _match_activity_handlers(activity_type: str) -> tuple[_ActivityHandler, ...]:
+    """Get handlers for an activity type missing from _ACTIVITY_HANDLERS.
+
+    Activity types come from a small fixed vocabulary, so the lowercase
+    substring scan is cached per distinct type.
+    """
+    activity_type_lower = activity_type.lower()
+    return tuple(
+        handler
+        for substring, handler in _ACTIVITY_SUBSTRING_HANDLERS
+        if substring in activity_type_lower
+    )
+
 
 class JourneyExtractor(BaseExtractor):
     """Extractor for SFMC Journeys."""
@@ -38,37 +357,71 @@ class JourneyExtractor(BaseExtractor):
 
     required_caches = [CacheType.DE_FOLDERS]
 
-    async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
-        """Fetch journeys via REST API with pagination."""
-        journeys = []
-        page = 1
-        self._pages_fetched = 0
-
-        while page <= options.max_pages:
-            result = self._rest.get(
-                f"/interaction/v1/interactions?$page={page}&$pageSize={options.page_size}"
-            )
-
-            if not result.get("ok"):
-                logger.error(f"Failed to fetch journeys page {page}: {result.get('error')}")
-                break
+    async def extract(self, options: Optional[ExtractorOptions] = None) -> ExtractorResult:
+        """Run the extraction, then persist any buffered detail cache entries."""
+        self._reset_detail_memo()
+        try:
+            return await super().extract(options)
+        finally:
+            # Don't hold every journey's detail past the run
+            self._reset_detail_memo()
+            detail_cache = getattr(self, "_detail_cache", None)
+            if detail_cache is not None:
+                detail_cache.flush()
 
-            data = result.get("data", {})
-            items = data.get("items", [])
-
-            if not items:
-                break
-
-            journeys.extend(items)
-            self._pages_fetched = page
-
-            self._report_progress(options, "Fetching", len(journeys), 0)
+    async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
+        """Fetch all journeys via REST API with pagination."""
+        return [item async for page in self.iter_batches(options) for item in page]
+
+    async def iter_batches(
+        self, options: ExtractorOptions
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield journeys one REST page at a time.
+
+        Journey relationships are self-contained per item, so each page can
+        be enriched and transformed before the next one is fetched.
+        """
+        async for items in self._iter_rest_pages(
+            f"/interaction/v1/interactions?$pageSize={options.page_size}&$page=",
+            "journeys",
+            options,
+        ):
+            yield items
+
+    async def enrich_data(
+        self,
+        items: list[dict[str, Any]],
+        options: ExtractorOptions,
+        result: ExtractorResult,
+    ) -> list[dict[str, Any]]:
+        """Enrich journeys with details, using parallel requests.
+
+        Results keep the order of the input page.
+        """
+        # Create semaphore for concurrency control
+        semaphore = asyncio.Semaphore(options.max_concurrent)
+        completed = 0
+
+        async def enrich_single(item: dict[str, Any]) -> dict[str, Any]:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    enriched_item = await self.enrich_item(item, options)
+                except Exception as e:
+                    logger.warning(f"Failed to enrich journey: {e}")
+                    result.add_error(
+                        "EnrichmentError",
+                        str(e),
+                        {"item_id": item.get("id", "unknown")},
+                    )
+                    enriched_item = item  # Keep unenriched
 
-            if len(items) < options.page_size:
-                break
-            page += 1
+            completed += 1
+            if options.progress_callback and completed % 50 == 0:
+                self._report_progress(options, "Enriching", completed, len(items))
+            return enriched_item
 
-        return journeys
+        return list(await asyncio.gather(*(enrich_single(item) for item in items)))
 
     async def enrich_item(
         self,
@@ -80,7 +433,9 @@ class JourneyExtractor(BaseExtractor):
 
         # Fetch detailed info if requested
         if options.include_details and journey_id:
-            detail = await self._fetch_journey_detail(journey_id)
+            detail = await self._get_journey_detail(
+                journey_id, item.get("modifiedDate"), options
+            )
             if detail:
                 item.update({
                     "triggers": detail.get("triggers", []),
@@ -99,17 +454,73 @@ class JourneyExtractor(BaseExtractor):
 
         return item
 
+    async def _get_journey_detail(
+        self,
+        journey_id: str,
+        modified_date: Optional[str],
+        options: ExtractorOptions,
+    ) -> Optional[dict[str, Any]]:
+        """Get a journey's detail, requesting each version at most once.
+
+        Details are memoized per (journey ID, modifiedDate) for this run, so
+        a journey seen twice (e.g. shifted across a page boundary) reuses the
+        first response; concurrent lookups of the same key wait on one lock
+        instead of each issuing a request. Misses fall through to the
+        persistent detail cache, if enabled, and then to the API.
+        """
+        memo = getattr(self, "_detail_memo", None)
+        if memo is None:
+            self._reset_detail_memo()
+            memo = self._detail_memo
+
+        key = (journey_id, modified_date)
+        if key in memo:
+            return memo[key]
+
+        async with self._detail_locks[key]:
+            if key in memo:
+                return memo[key]
+
+            # Reuse a previous run's detail if the journey hasn't changed since
+            detail_cache = self._get_detail_cache(options)
+            detail = detail_cache.get(journey_id, modified_date) if detail_cache else None
+            if detail is None:
+                detail = await self._fetch_journey_detail(journey_id)
+                if detail and detail_cache:
+                    detail_cache.put(journey_id, modified_date, detail)
+
+            memo[key] = detail
+            # Later lookups hit the memo; waiters already hold this lock
+            self._detail_locks.pop(key, None)
+
+        return detail
+
+    def _reset_detail_memo(self) -> None:
+        """Start an empty per-run journey detail memo."""
+        self._detail_memo: dict[tuple[str, Optional[str]], Optional[dict[str, Any]]] = {}
+        self._detail_locks: defaultdict[
+            tuple[str, Optional[str]], asyncio.Lock
+        ] = defaultdict(asyncio.Lock)
+
+    def _get_detail_cache(self, options: ExtractorOptions) -> Optional[DetailCache]:
+        """Get the persistent journey detail cache, if enabled."""
+        if options.detail_cache_dir is None:
+            return None
+        detail_cache = getattr(self, "_detail_cache", None)
+        if detail_cache is None:
+            detail_cache = DetailCache(CacheType.JOURNEY_DETAILS, options.detail_cache_dir)
+            self._detail_cache = detail_cache
+        return detail_cache
+
     async def _fetch_journey_detail(
         self, journey_id: str
     ) -> Optional[dict[str, Any]]:
-        """Fetch detailed journey info including activities."""
-        # Run sync request in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._rest.get,
-            f"/interaction/v1/interactions/{journey_id}",
-        )
+        """Fetch detailed journey info including activities.
+
+        Uses the async client so in-flight requests are bounded only by the
+        enrich_data semaphore, not by thread pool workers.
+        """
+        result = await self._rest.get_async(f"/interaction/v1/interactions/{journey_id}")
 
         if result.get("ok"):
             return result.get("data", {})
@@ -117,19 +528,58 @@ class JourneyExtractor(BaseExtractor):
         logger.debug(f"Failed to fetch journey detail {journey_id}: {result.get('error')}")
         return None
 
+    async def transform_and_extract(
+        self,
+        items: list[dict[str, Any]],
+        options: ExtractorOptions,
+        result: ExtractorResult,
+    ) -> list[dict[str, Any]]:
+        """Transform journeys and extract their relationships in one pass.
+
+        Each journey's nested triggers and activities are walked for edges
+        right after its output row is built, instead of in a second loop.
+        """
+        self._report_progress(options, "Transforming", 0, len(items))
+        wanted = options.relationship_types
+        if wanted is not None and not wanted:
+            return self.transform_data(items, options)
+
+        transformed = []
+        add_relationships = self._add_journey_relationships
+
+        for item, output in self._iter_transformed(items, options):
+            transformed.append(output)
+            add_relationships(item, result, wanted)
+
+        return transformed
+
     def transform_data(
         self,
         items: list[dict[str, Any]],
         options: ExtractorOptions,
     ) -> list[dict[str, Any]]:
         """Transform journey data for output."""
-        transformed = []
+        return [output for _, output in self._iter_transformed(items, options)]
+
+    def _iter_transformed(
+        self,
+        items: list[dict[str, Any]],
+        options: ExtractorOptions,
+    ) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+        """Yield (source item, output row) pairs for journeys."""
+        # Bound once rather than looked up on self for every journey
+        transform_triggers = self._transform_triggers
+        transform_activities = self._transform_activities
+        transform_goals = self._transform_goals
+        include_details = options.include_details
 
         for item in items:
             activities = item.get("activities", [])
             triggers = item.get("triggers", [])
             goals = item.get("goals", [])
 
+            # A literal with direct .get() calls outperforms key-tuple
+            # comprehensions, zip/map and fromkeys-template copies here
             output = {
                 "id": item.get("id"),
                 "name": item.get("name"),
@@ -147,65 +597,63 @@ class JourneyExtractor(BaseExtractor):
                 "createdBy": item.get("createdBy"),
                 "modifiedBy": item.get("modifiedBy"),
                 "lastPublishedDate": item.get("lastPublishedDate"),
-                "triggers": self._transform_triggers(triggers),
+                "triggers": transform_triggers(triggers),
                 "triggerCount": len(triggers),
-                "activities": self._transform_activities(activities) if options.include_details else [],
+                "activities": transform_activities(activities) if include_details else [],
                 "activityCount": len(activities),
-                "goals": self._transform_goals(goals),
+                "goals": transform_goals(goals),
                 "goalCount": len(goals),
                 "stats": item.get("stats"),
             }
-            transformed.append(output)
-
-        return transformed
+            yield item, output
 
     def _transform_triggers(
         self, triggers: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
+    ) -> list[JourneyTriggerRow]:
         """Transform trigger data."""
         transformed = []
         for trigger in triggers:
             # eventDefinitionKey/Id are nested in metaData
-            meta = trigger.get("metaData", {})
-            transformed.append({
-                "id": trigger.get("id"),
-                "key": trigger.get("key"),
-                "name": trigger.get("name"),
-                "type": trigger.get("type"),
-                "eventDefinitionId": meta.get("eventDefinitionId"),
-                "eventDefinitionKey": meta.get("eventDefinitionKey"),
-            })
+            meta = trigger.get("metaData") or _EMPTY
+            transformed.append(JourneyTriggerRow(
+                id=trigger.get("id"),
+                key=trigger.get("key"),
+                name=trigger.get("name"),
+                type=trigger.get("type"),
+                eventDefinitionId=meta.get("eventDefinitionId"),
+                eventDefinitionKey=meta.get("eventDefinitionKey"),
+            ))
         return transformed
 
     def _transform_activities(
         self, activities: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
+    ) -> list[JourneyActivityRow]:
         """Transform activity data."""
-        transformed = []
-        for activity in activities:
-            transformed.append({
-                "id": activity.get("id"),
-                "key": activity.get("key"),
-                "name": activity.get("name"),
-                "type": activity.get("type"),
-                "configurationUrl": activity.get("configurationUrl"),
-                "outcomeCount": len(activity.get("outcomes", [])),
-            })
-        return transformed
+        return [
+            JourneyActivityRow(
+                id=activity.get("id"),
+                key=activity.get("key"),
+                name=activity.get("name"),
+                type=activity.get("type"),
+                configurationUrl=activity.get("configurationUrl"),
+                outcomeCount=len(activity.get("outcomes") or ()),
+            )
+            for activity in activities
+        ]
 
     def _transform_goals(
         self, goals: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
+    ) -> list[JourneyGoalRow]:
         """Transform goal data."""
-        transformed = []
-        for goal in goals:
-            transformed.append({
-                "name": goal.get("name"),
-                "description": goal.get("description"),
-                "metric": goal.get("metric"),
-                "target": goal.get("target"),
-            })
-        return transformed
+        return [
+            JourneyGoalRow(
+                name=goal.get("name"),
+                description=goal.get("description"),
+                metric=goal.get("metric"),
+                target=goal.get("target"),
+            )
+            for goal in goals
+        ]
 
     async def extract_relationships(
         self,
@@ -214,340 +662,135 @@ class JourneyExtractor(BaseExtractor):
     ) -> None:
         """Extract relationships from journeys to other objects."""
         for item in items:
-            journey_id = item.get("id")
-            journey_name = item.get("name")
-
-            if not journey_id:
-                continue
-
-            # Process triggers for event definition and DE relationships
-            for trigger in item.get("triggers", []):
-                # Event definition relationship (from metaData)
-                meta = trigger.get("metaData", {})
-                event_def_id = meta.get("eventDefinitionId")
-                event_def_key = meta.get("eventDefinitionKey")
-
-                if event_def_id:
-                    result.add_relationship(
-                        source_id=str(journey_id),
-                        source_type="journey",
-                        source_name=journey_name,
-                        target_id=str(event_def_id),
-                        target_type="event_definition",
-                        target_name=trigger.get("name"),
-                        relationship_type=RelationshipType.JOURNEY_USES_EVENT,
-                        metadata={"eventDefinitionKey": event_def_key},
-                    )
+            self._add_journey_relationships(item, result)
 
-                # Event-triggered journeys may also reference a DE directly
-                config_args = trigger.get("configurationArguments", {})
-                de_key = config_args.get("eventDataConfig", {}).get("deKey")
-
-                if de_key:
-                    result.add_relationship(
-                        source_id=str(journey_id),
-                        source_type="journey",
-                        source_name=journey_name,
-                        target_id=de_key,
-                        target_type="data_extension",
-                        target_name=de_key,
-                        relationship_type=RelationshipType.JOURNEY_USES_DE,
-                        metadata={"usage": "entry_event"},
-                    )
+    def _add_journey_relationships(
+        self,
+        item: dict[str, Any],
+        result: ExtractorResult,
+        wanted: Optional[set[RelationshipType]] = None,
+    ) -> None:
+        """Add one journey's relationships to the result.
 
-            # Process activities for various relationships
-            for activity in item.get("activities", []):
-                activity_type = activity.get("type", "")
-                config_args = activity.get("configurationArguments", {})
-
-                # Email activities (EMAILV2)
-                # Based on mcdev dependencyGraph paths for Journey type
-                if "email" in activity_type.lower() or activity_type == "EMAILV2":
-                    triggered_send = config_args.get("triggeredSend", {})
-
-                    # Email reference (classic email ID)
-                    email_id = triggered_send.get("emailId")
-                    if email_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(email_id),
-                            target_type="email",
-                            relationship_type=RelationshipType.JOURNEY_USES_EMAIL,
-                        )
-
-                    # Asset reference (Content Builder email)
-                    # mcdev path: activities.configurationArguments.triggeredSend.r__asset_key
-                    asset_id = triggered_send.get("assetId")
-                    asset_key = triggered_send.get("assetKey")
-                    if asset_id or asset_key:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(asset_id or asset_key),
-                            target_type="asset",
-                            relationship_type=RelationshipType.JOURNEY_USES_ASSET,
-                            metadata={"assetKey": asset_key},
-                        )
-
-                    # Sender profile reference
-                    sender_profile_id = triggered_send.get("senderProfileId")
-                    if sender_profile_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(sender_profile_id),
-                            target_type="sender_profile",
-                            relationship_type=RelationshipType.JOURNEY_USES_SENDER_PROFILE,
-                        )
-
-                    # Delivery profile reference
-                    delivery_profile_id = triggered_send.get("deliveryProfileId")
-                    if delivery_profile_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(delivery_profile_id),
-                            target_type="delivery_profile",
-                            relationship_type=RelationshipType.JOURNEY_USES_DELIVERY_PROFILE,
-                        )
-
-                    # Send classification reference
-                    send_classification_id = triggered_send.get("sendClassificationId")
-                    if send_classification_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(send_classification_id),
-                            target_type="send_classification",
-                            relationship_type=RelationshipType.JOURNEY_USES_SEND_CLASSIFICATION,
-                        )
-
-                    # Publication list reference
-                    # mcdev path: activities.configurationArguments.triggeredSend.r__list_PathName.publicationList
-                    publication_list_id = triggered_send.get("publicationListId")
-                    if publication_list_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(publication_list_id),
-                            target_type="list",
-                            relationship_type=RelationshipType.JOURNEY_USES_LIST,
-                            metadata={"usage": "publication_list"},
-                        )
-
-                    # Suppression lists reference
-                    # mcdev path: activities.configurationArguments.triggeredSend.r__list_PathName.suppressionLists
-                    suppression_lists = triggered_send.get("suppressionLists", [])
-                    for supp_list in suppression_lists:
-                        list_id = supp_list.get("id") if isinstance(supp_list, dict) else supp_list
-                        if list_id:
-                            result.add_relationship(
-                                source_id=str(journey_id),
-                                source_type="journey",
-                                source_name=journey_name,
-                                target_id=str(list_id),
-                                target_type="list",
-                                relationship_type=RelationshipType.JOURNEY_USES_LIST,
-                                metadata={"usage": "suppression_list"},
-                            )
-
-                    # Domain exclusions DE reference
-                    # mcdev path: activities.configurationArguments.triggeredSend.r__dataExtension_key.domainExclusions
-                    domain_exclusions = triggered_send.get("domainExclusions", [])
-                    for excl in domain_exclusions:
-                        de_id = excl.get("id") if isinstance(excl, dict) else excl
-                        if de_id:
-                            result.add_relationship(
-                                source_id=str(journey_id),
-                                source_type="journey",
-                                source_name=journey_name,
-                                target_id=str(de_id),
-                                target_type="data_extension",
-                                relationship_type=RelationshipType.JOURNEY_USES_DE,
-                                metadata={"usage": "domain_exclusion"},
-                            )
-
-                # High throughput DE reference from activity metaData
-                # mcdev path: activities.metaData.highThroughput.r__dataExtension_key
-                activity_meta = activity.get("metaData", {})
-                high_throughput = activity_meta.get("highThroughput", {})
+        Args:
+            item: Enriched journey.
+            result: Result object to add relationships to.
+            wanted: Relationship types to keep; None keeps all.
+        """
+        journey_id = item.get("id")
+        triggers = item.get("triggers")
+        activities = item.get("activities")
+
+        # Draft/list-only journeys commonly have neither; skip them before
+        # setting up the per-journey dedup state
+        if not journey_id or not (triggers or activities):
+            return
+
+        source_id = str(journey_id)
+        journey_name = item.get("name")
+
+        # Activities frequently point at the same target (e.g. one DE via
+        # several update-contact steps); emit each distinct edge once.
+        # Edges are collected per journey and added to the result together.
+        seen: set[tuple[Any, ...]] = set()
+        edges: list[RelationshipEdge] = []
+
+        def emit(
+            target_id: str,
+            target_type: str,
+            relationship_type: RelationshipType,
+            target_name: Optional[str] = None,
+            metadata: Optional[dict[str, Any]] = None,
+        ) -> None:
+            if wanted is not None and relationship_type not in wanted:
+                return
+            usage = metadata.get("usage") if metadata else None
+            edge_key = (target_type, target_id, relationship_type, usage)
+            if edge_key in seen:
+                return
+            seen.add(edge_key)
+            edges.append(RelationshipEdge(
+                source_id=source_id,
+                source_type="journey",
+                source_name=journey_name,
+                target_id=target_id,
+                target_type=target_type,
+                target_name=target_name,
+                relationship_type=relationship_type,
+                metadata=metadata,
+            ))
+
+        # Process triggers for event definition and DE relationships
+        for trigger in triggers or ():
+            # Event definition relationship (from metaData)
+            meta = trigger.get("metaData") or _EMPTY
+            event_def_id = meta.get("eventDefinitionId")
+            event_def_key = meta.get("eventDefinitionKey")
+
+            if event_def_id:
+                emit(
+                    target_id=str(event_def_id),
+                    target_type="event_definition",
+                    target_name=trigger.get("name"),
+                    relationship_type=RelationshipType.JOURNEY_USES_EVENT,
+                    metadata={"eventDefinitionKey": event_def_key},
+                )
+
+            # Event-triggered journeys may also reference a DE directly
+            de_key = None
+            if (config_args := trigger.get("configurationArguments")) and (
+                event_data_config := config_args.get("eventDataConfig")
+            ):
+                de_key = event_data_config.get("deKey")
+
+            if de_key:
+                emit(
+                    target_id=de_key,
+                    target_type="data_extension",
+                    target_name=de_key,
+                    relationship_type=RelationshipType.JOURNEY_USES_DE,
+                    metadata=_META_ENTRY_EVENT,
+                )
+
+        # Process activities for various relationships
+        for activity in activities or ():
+            activity_type = activity.get("type") or ""
+            config_args = activity.get("configurationArguments") or _EMPTY
+
+            # Type-specific references
+            handlers = _ACTIVITY_HANDLERS.get(activity_type)
+            if handlers is None:
+                handlers = _match_activity_handlers(activity_type)
+            for handler in handlers:
+                handler(emit, config_args)
+
+            # High throughput DE reference from activity metaData
+            # mcdev path: activities.metaData.highThroughput.r__dataExtension_key
+            ht_de_key = None
+            if (activity_meta := activity.get("metaData")) and (
+                high_throughput := activity_meta.get("highThroughput")
+            ):
                 ht_de_key = high_throughput.get("dataExtensionKey") or high_throughput.get("deKey")
-                if ht_de_key:
-                    result.add_relationship(
-                        source_id=str(journey_id),
-                        source_type="journey",
-                        source_name=journey_name,
-                        target_id=str(ht_de_key),
-                        target_type="data_extension",
-                        relationship_type=RelationshipType.JOURNEY_USES_DE,
-                        metadata={"usage": "high_throughput"},
+            if ht_de_key:
+                emit(
+                    target_id=str(ht_de_key),
+                    target_type="data_extension",
+                    relationship_type=RelationshipType.JOURNEY_USES_DE,
+                    metadata=_META_HIGH_THROUGHPUT,
+                )
+
+            # Direct asset reference (non-email activities)
+            # mcdev path: activities.configurationArguments.r__asset_key
+            direct_asset_id = config_args.get("assetId")
+            direct_asset_key = config_args.get("assetKey")
+            if direct_asset_id or direct_asset_key:
+                # Avoid duplicating email asset relationships
+                if activity_type not in _EMAIL_ACTIVITY_TYPES:
+                    emit(
+                        target_id=str(direct_asset_id or direct_asset_key),
+                        target_type="asset",
+                        relationship_type=RelationshipType.JOURNEY_USES_ASSET,
+                        metadata={"assetKey": direct_asset_key, "activityType": activity_type},
                     )
 
-                # Direct asset reference (non-email activities)
-                # mcdev path: activities.configurationArguments.r__asset_key
-                direct_asset_id = config_args.get("assetId")
-                direct_asset_key = config_args.get("assetKey")
-                if direct_asset_id or direct_asset_key:
-                    # Avoid duplicating email asset relationships
-                    if activity_type not in ("EMAILV2", "EMAIL"):
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(direct_asset_id or direct_asset_key),
-                            target_type="asset",
-                            relationship_type=RelationshipType.JOURNEY_USES_ASSET,
-                            metadata={"assetKey": direct_asset_key, "activityType": activity_type},
-                        )
-
-                # SMS activities (SMSSYNC)
-                # Based on mcdev dependencyGraph paths for Journey type
-                if activity_type == "SMSSYNC" or activity_type == "SMS":
-                    # Application extension key for SMS
-                    app_ext_key = config_args.get("applicationExtensionKey")
-                    if app_ext_key:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=app_ext_key,
-                            target_type="sms_definition",
-                            relationship_type=RelationshipType.JOURNEY_USES_SMS,
-                            metadata={"applicationExtensionKey": app_ext_key},
-                        )
-
-                    # Mobile message reference
-                    # mcdev path: activities.configurationArguments.r__mobileMessage_key
-                    mobile_message_id = config_args.get("mobileMessageId")
-                    mobile_message_key = config_args.get("mobileMessageKey")
-                    if mobile_message_id or mobile_message_key:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(mobile_message_id or mobile_message_key),
-                            target_type="mobile_message",
-                            relationship_type=RelationshipType.JOURNEY_USES_MOBILE_MESSAGE,
-                        )
-
-                    # Mobile keyword references (current and next)
-                    # mcdev paths: activities.configurationArguments.r__mobileKeyword_key.current/next
-                    for kw_field in ["keywordId", "keywordKey", "currentKeywordId", "nextKeywordId"]:
-                        kw_value = config_args.get(kw_field)
-                        if kw_value:
-                            result.add_relationship(
-                                source_id=str(journey_id),
-                                source_type="journey",
-                                source_name=journey_name,
-                                target_id=str(kw_value),
-                                target_type="mobile_keyword",
-                                relationship_type=RelationshipType.JOURNEY_USES_MOBILE_KEYWORD,
-                                metadata={"field": kw_field},
-                            )
-
-                    # Mobile code reference
-                    # mcdev path: activities.configurationArguments.r__mobileCode_key
-                    mobile_code = config_args.get("mobileCode") or config_args.get("code")
-                    if mobile_code:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(mobile_code),
-                            target_type="mobile_code",
-                            relationship_type=RelationshipType.JOURNEY_USES_MOBILE_CODE,
-                        )
-
-                # Push notification activities
-                if activity_type == "PUSH" or "push" in activity_type.lower():
-                    # Push may reference an asset (jsonmessage subtype)
-                    push_asset_id = config_args.get("assetId")
-                    if push_asset_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(push_asset_id),
-                            target_type="asset",
-                            relationship_type=RelationshipType.JOURNEY_USES_PUSH,
-                            metadata={"assetType": "push"},
-                        )
-
-                # Filter/Decision activities
-                if activity_type == "ENGAGMENTSPLIT" or "filter" in activity_type.lower():
-                    filter_id = config_args.get("filterId")
-                    if filter_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(filter_id),
-                            target_type="filter",
-                            relationship_type=RelationshipType.JOURNEY_USES_FILTER,
-                        )
-
-                # Update Contact Data activities (write to DE)
-                if activity_type == "UPDATECONTACTDATA":
-                    de_key = config_args.get("deKey")
-                    if de_key:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=de_key,
-                            target_type="data_extension",
-                            relationship_type=RelationshipType.JOURNEY_USES_DE,
-                            metadata={"usage": "update_contact"},
-                        )
-
-                # DataExtensionUpdate activities (per-field DE references)
-                if activity_type == "DATAEXTENSIONUPDATE":
-                    # May have dataExtensionId at activity level
-                    de_id = config_args.get("dataExtensionId")
-                    if de_id:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(de_id),
-                            target_type="data_extension",
-                            relationship_type=RelationshipType.JOURNEY_USES_DE,
-                            metadata={"usage": "data_extension_update"},
-                        )
-
-                # Fire Automation activities
-                if activity_type == "FIREAUTOMATION":
-                    automation_id_ref = config_args.get("automationId")
-                    if automation_id_ref:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=str(automation_id_ref),
-                            target_type="automation",
-                            relationship_type=RelationshipType.JOURNEY_USES_AUTOMATION,
-                        )
-
-                # Rest/API activities
-                if activity_type == "REST" or activity_type == "RESTACTIVITY":
-                    app_ext_key = config_args.get("applicationExtensionKey")
-                    if app_ext_key:
-                        result.add_relationship(
-                            source_id=str(journey_id),
-                            source_type="journey",
-                            source_name=journey_name,
-                            target_id=app_ext_key,
-                            target_type="api_event",
-                            relationship_type=RelationshipType.REFERENCES,
-                            metadata={
-                                "usage": "rest_activity",
-                                "applicationExtensionKey": app_ext_key,
-                            },
-                        )
+        result.add_relationships(edges)
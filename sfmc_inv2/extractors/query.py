@@ -4,68 +4,104 @@ Extracts SQL Query Activities with their SQL text and targets.
 Analyzes SQL to identify Data Extension dependencies.
 """
 
-import asyncio
 import logging
 import re
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterator
 
 from ..cache.cache_manager import CacheType
-from ..types.relationships import RelationshipType
+from ..types.relationships import RelationshipEdge, RelationshipType
 from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
 
 logger = logging.getLogger(__name__)
 
 # Regex patterns for SQL parsing
-# Comprehensive pattern matching FROM and all JOIN types with optional schema prefix
+# Pattern matching FROM and all JOIN types with optional schema prefix
 # Captures: group 1 = schema prefix (e.g., 'ENT'), group 2 = table name
 # Handles: FROM, LEFT JOIN, RIGHT JOIN, INNER JOIN, OUTER JOIN, CROSS JOIN, FULL OUTER JOIN
-DE_TABLE_PATTERN = re.compile(
-    r'\b(?:FROM|(?:LEFT|RIGHT|INNER|OUTER|CROSS|FULL\s+OUTER)?\s*JOIN)\s+'
+# The join type words are deliberately not matched: they capture nothing, and
+# an optional prefix before JOIN makes the engine attempt a match at almost
+# every position, roughly doubling scan time on long queries.
+DE_TABLE_PATTERN: re.Pattern[str] = re.compile(
+    r'\b(?:FROM|JOIN)\s+'
     r'\[?(?:(\w+)\.)?\[?([A-Za-z_][A-Za-z0-9_]*)\]?',
     re.IGNORECASE
 )
 
+# System tables/views never treated as Data Extension references
+SYSTEM_TABLE_PREFIXES: tuple[str, ...] = ("sys", "information_schema")
+SYSTEM_TABLE_NAMES: frozenset[str] = frozenset({"dual", "subscribers", "subscriberattributes"})
 
-class QueryExtractor(BaseExtractor):
-    """Extractor for SFMC Query Activities."""
 
-    name = "queries"
-    description = "SFMC SQL Query Activities"
-    object_type = "QueryDefinition"
+@lru_cache(maxsize=4096)
+def _scan_de_references(sql: str) -> tuple[tuple[str, bool], ...]:
+    """Scan SQL for referenced DE names and whether each is shared.
 
-    required_caches = [CacheType.QUERY_FOLDERS]
+    Cached by SQL text, since the same query body is often deployed to
+    several BUs or copied between automations. Returns immutable tuples so
+    cached results can't be modified by callers.
 
-    async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
-        """Fetch queries via REST API with pagination."""
-        queries = []
-        page = 1
-        self._pages_fetched = 0
+    Args:
+        sql: SQL query text.
 
-        while page <= options.max_pages:
-            result = self._rest.get(
-                f"/automation/v1/queries?$page={page}&$pageSize={options.page_size}"
-            )
+    Returns:
+        Tuple of (name, isShared) pairs sorted by name.
+    """
+    # Track references by name to avoid duplicates (prefer isShared=True
+    # if seen both ways)
+    references: dict[str, bool] = {}
 
-            if not result.get("ok"):
-                logger.error(f"Failed to fetch queries page {page}: {result.get('error')}")
-                break
+    # Find all FROM and JOIN clause references with optional schema prefix
+    for match in DE_TABLE_PATTERN.finditer(sql):
+        schema_prefix = match.group(1)  # e.g., 'ENT', '_ENT', or None
+        de_name = match.group(2)
 
-            data = result.get("data", {})
-            items = data.get("items", [])
+        # The name group is a bare identifier, never empty or padded
+        if _is_system_table(de_name):
+            continue
 
-            if not items:
-                break
+        # Determine if this is a shared/enterprise DE (cross-BU reference)
+        is_shared = bool(schema_prefix) and schema_prefix.upper() in ("ENT", "_ENT")
 
-            queries.extend(items)
-            self._pages_fetched = page
+        # Repeat local references (the common case) need no write
+        if is_shared or de_name not in references:
+            references[de_name] = is_shared
 
-            self._report_progress(options, "Fetching", len(queries), 0)
+    # Return sorted by name
+    return tuple(sorted(references.items()))
 
-            if len(items) < options.page_size:
-                break
-            page += 1
 
-        return queries
+def _is_system_table(name: str) -> bool:
+    """Check if a table name is a system table."""
+    # Data views (_Sent, _Open, ...) are the most common system references
+    # and need no lowercased copy to detect
+    if name.startswith("_"):
+        return True
+
+    name_lower = name.lower()
+    return (
+        name_lower in SYSTEM_TABLE_NAMES
+        or name_lower.startswith(SYSTEM_TABLE_PREFIXES)
+    )
+
+
+class QueryExtractor(BaseExtractor):
+    """Extractor for SFMC Query Activities."""
+
+    name = "queries"
+    description = "SFMC SQL Query Activities"
+    object_type = "QueryDefinition"
+
+    required_caches = [CacheType.QUERY_FOLDERS]
+
+    async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
+        """Fetch queries via REST API with pagination."""
+        pages = self._iter_rest_pages(
+            f"/automation/v1/queries?$pageSize={options.page_size}&$page=",
+            "queries",
+            options,
+        )
+        return [item async for page in pages for item in page]
 
     async def enrich_item(
         self,
@@ -99,57 +135,10 @@ class QueryExtractor(BaseExtractor):
         Returns:
             List of DE reference dicts with name and isShared flag.
         """
-        # Track references by name to avoid duplicates while preserving metadata
-        references: dict[str, dict[str, Any]] = {}
-
-        # Find all FROM and JOIN clause references with optional schema prefix
-        for match in DE_TABLE_PATTERN.finditer(sql):
-            schema_prefix = match.group(1)  # e.g., 'ENT', '_ENT', or None
-            de_name = match.group(2)
-
-            if not de_name or self._is_system_table(de_name):
-                continue
-
-            de_name = de_name.strip()
-
-            # Determine if this is a shared/enterprise DE (cross-BU reference)
-            is_shared = False
-            if schema_prefix:
-                schema_upper = schema_prefix.upper()
-                if schema_upper in ("ENT", "_ENT"):
-                    is_shared = True
-
-            # Store or update reference (prefer isShared=True if seen both ways)
-            if de_name in references:
-                if is_shared:
-                    references[de_name]["isShared"] = True
-            else:
-                references[de_name] = {
-                    "name": de_name,
-                    "isShared": is_shared,
-                }
-
-        # Return sorted by name
-        return sorted(references.values(), key=lambda x: x["name"])
-
-    def _is_system_table(self, name: str) -> bool:
-        """Check if a table name is a system table."""
-        system_prefixes = (
-            "_",
-            "sys",
-            "information_schema",
-        )
-        system_names = {
-            "dual",
-            "subscribers",
-            "subscriberattributes",
-        }
-
-        name_lower = name.lower()
-        return (
-            name_lower.startswith(system_prefixes)
-            or name_lower in system_names
-        )
+        return [
+            {"name": name, "isShared": is_shared}
+            for name, is_shared in _scan_de_references(sql)
+        ]
 
     def transform_data(
         self,
@@ -160,6 +149,7 @@ class QueryExtractor(BaseExtractor):
         transformed = []
 
         for item in items:
+            de_refs = item.get("referencedDataExtensions", [])
             output = {
                 "id": item.get("queryDefinitionId"),
                 "name": item.get("name"),
@@ -179,11 +169,9 @@ class QueryExtractor(BaseExtractor):
                 "modifiedDate": item.get("modifiedDate"),
                 "createdBy": item.get("createdBy"),
                 "modifiedBy": item.get("modifiedBy"),
-                "referencedDataExtensions": item.get("referencedDataExtensions", []),
+                "referencedDataExtensions": de_refs,
                 # Convenience field: list of DE names for simpler queries
-                "referencedDataExtensionNames": [
-                    ref["name"] for ref in item.get("referencedDataExtensions", [])
-                ],
+                "referencedDataExtensionNames": [ref["name"] for ref in de_refs],
             }
             transformed.append(output)
 
@@ -195,6 +183,15 @@ class QueryExtractor(BaseExtractor):
         result: ExtractorResult,
     ) -> None:
         """Extract relationships from queries to Data Extensions."""
+        result.add_relationships(self._iter_relationship_edges(items))
+
+    def _iter_relationship_edges(
+        self, items: list[dict[str, Any]]
+    ) -> Iterator[RelationshipEdge]:
+        """Yield write and read edges from each query to Data Extensions."""
+        writes_de = RelationshipType.QUERY_WRITES_DE
+        reads_de = RelationshipType.QUERY_READS_DE
+
         for item in items:
             query_id = item.get("queryDefinitionId")
             query_name = item.get("name")
@@ -202,19 +199,21 @@ class QueryExtractor(BaseExtractor):
             if not query_id:
                 continue
 
+            source_id = str(query_id)
+
             # Target DE relationship (writes)
             target_id = item.get("targetId")
             target_name = item.get("targetName")
 
             if target_id:
-                result.add_relationship(
-                    source_id=str(query_id),
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="query",
                     source_name=query_name,
                     target_id=str(target_id),
                     target_type="data_extension",
                     target_name=target_name,
-                    relationship_type=RelationshipType.QUERY_WRITES_DE,
+                    relationship_type=writes_de,
                 )
 
             # Source DE relationships (reads)
@@ -222,14 +221,14 @@ class QueryExtractor(BaseExtractor):
                 de_name = de_ref.get("name") if isinstance(de_ref, dict) else de_ref
                 is_shared = de_ref.get("isShared", False) if isinstance(de_ref, dict) else False
 
-                result.add_relationship(
-                    source_id=str(query_id),
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="query",
                     source_name=query_name,
                     target_id=de_name,  # Use name as we don't have ID
                     target_type="data_extension",
                     target_name=de_name,
-                    relationship_type=RelationshipType.QUERY_READS_DE,
+                    relationship_type=reads_de,
                     metadata={
                         "resolved_by_name": True,
                         "isShared": is_shared,
@@ -7,7 +7,7 @@ import logging
 from typing import Any
 
 from ..cache.cache_manager import CacheType
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from .base_extractor import BaseExtractor, ExtractorOptions
 
 logger = logging.getLogger(__name__)
 
@@ -23,35 +23,12 @@ class ScriptExtractor(BaseExtractor):
 
     async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
         """Fetch scripts via REST API with pagination."""
-        scripts = []
-        page = 1
-        self._pages_fetched = 0
-
-        while page <= options.max_pages:
-            result = self._rest.get(
-                f"/automation/v1/scripts?$page={page}&$pageSize={options.page_size}"
-            )
-
-            if not result.get("ok"):
-                logger.error(f"Failed to fetch scripts page {page}: {result.get('error')}")
-                break
-
-            data = result.get("data", {})
-            items = data.get("items", [])
-
-            if not items:
-                break
-
-            scripts.extend(items)
-            self._pages_fetched = page
-
-            self._report_progress(options, "Fetching", len(scripts), 0)
-
-            if len(items) < options.page_size:
-                break
-            page += 1
-
-        return scripts
+        pages = self._iter_rest_pages(
+            f"/automation/v1/scripts?$pageSize={options.page_size}&$page=",
+            "scripts",
+            options,
+        )
+        return [item async for page in pages for item in page]
 
     async def enrich_item(
         self,
@@ -5,10 +5,10 @@ Identifies relationships to sender and delivery profiles.
 """
 
 import logging
-from typing import Any
+from typing import Any, Iterator
 
-from ..types.relationships import RelationshipType
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from ..types.relationships import RelationshipEdge, RelationshipType
+from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult, coerce_soap_bool
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +87,7 @@ class SendClassificationExtractor(BaseExtractor):
                 "deliveryProfileKey": delivery_profile.get("CustomerKey") if isinstance(delivery_profile, dict) else None,
                 "deliveryProfileName": delivery_profile.get("Name") if isinstance(delivery_profile, dict) else None,
                 # Settings
-                "honorPublicationListOptOuts": item.get("HonorPublicationListOptOutsForTransactionalSends") == "true" if isinstance(item.get("HonorPublicationListOptOutsForTransactionalSends"), str) else item.get("HonorPublicationListOptOutsForTransactionalSends"),
+                "honorPublicationListOptOuts": coerce_soap_bool(item.get("HonorPublicationListOptOutsForTransactionalSends")),
                 "sendPriority": item.get("SendPriority"),
                 # Audit
                 "createdDate": item.get("CreatedDate"),
@@ -103,6 +103,15 @@ class SendClassificationExtractor(BaseExtractor):
         result: ExtractorResult,
     ) -> None:
         """Extract relationships from send classifications to profiles."""
+        result.add_relationships(self._iter_relationship_edges(items))
+
+    def _iter_relationship_edges(
+        self, items: list[dict[str, Any]]
+    ) -> Iterator[RelationshipEdge]:
+        """Yield edges from each send classification to its profiles."""
+        uses_sender_profile = RelationshipType.SEND_CLASSIFICATION_USES_SENDER_PROFILE
+        uses_delivery_profile = RelationshipType.SEND_CLASSIFICATION_USES_DELIVERY_PROFILE
+
         for item in items:
             sc_id = item.get("ObjectID")
             sc_name = item.get("Name")
@@ -110,20 +119,22 @@ class SendClassificationExtractor(BaseExtractor):
             if not sc_id:
                 continue
 
+            source_id = str(sc_id)
+
             # Sender profile relationship
             sender_profile = item.get("SenderProfile", {})
             if isinstance(sender_profile, dict):
                 sp_key = sender_profile.get("CustomerKey")
                 sp_name = sender_profile.get("Name")
                 if sp_key:
-                    result.add_relationship(
-                        source_id=str(sc_id),
+                    yield RelationshipEdge(
+                        source_id=source_id,
                         source_type="send_classification",
                         source_name=sc_name,
                         target_id=sp_key,
                         target_type="sender_profile",
                         target_name=sp_name,
-                        relationship_type=RelationshipType.SEND_CLASSIFICATION_USES_SENDER_PROFILE,
+                        relationship_type=uses_sender_profile,
                     )
 
             # Delivery profile relationship
@@ -132,12 +143,12 @@ class SendClassificationExtractor(BaseExtractor):
                 dp_key = delivery_profile.get("CustomerKey")
                 dp_name = delivery_profile.get("Name")
                 if dp_key:
-                    result.add_relationship(
-                        source_id=str(sc_id),
+                    yield RelationshipEdge(
+                        source_id=source_id,
                         source_type="send_classification",
                         source_name=sc_name,
                         target_id=dp_key,
                         target_type="delivery_profile",
                         target_name=dp_name,
-                        relationship_type=RelationshipType.SEND_CLASSIFICATION_USES_DELIVERY_PROFILE,
+                        relationship_type=uses_delivery_profile,
                     )
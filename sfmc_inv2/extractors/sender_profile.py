@@ -6,7 +6,7 @@ Extracts Sender Profile definitions via SOAP API.
 import logging
 from typing import Any
 
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from .base_extractor import BaseExtractor, ExtractorOptions, coerce_soap_bool
 
 logger = logging.getLogger(__name__)
 
@@ -87,12 +87,12 @@ class SenderProfileExtractor(BaseExtractor):
                 "fromName": item.get("FromName"),
                 "fromAddress": item.get("FromAddress"),
                 # Reply management
-                "useDefaultRMMRules": item.get("UseDefaultRMMRules") == "true" if isinstance(item.get("UseDefaultRMMRules"), str) else item.get("UseDefaultRMMRules"),
+                "useDefaultRMMRules": coerce_soap_bool(item.get("UseDefaultRMMRules")),
                 "autoForwardToEmailAddress": item.get("AutoForwardToEmailAddress"),
                 "autoForwardToName": item.get("AutoForwardToName"),
-                "directForward": item.get("DirectForward") == "true" if isinstance(item.get("DirectForward"), str) else item.get("DirectForward"),
+                "directForward": coerce_soap_bool(item.get("DirectForward")),
                 "autoForwardTriggeredSendKey": auto_forward_ts.get("CustomerKey") if isinstance(auto_forward_ts, dict) else None,
-                "autoReply": item.get("AutoReply") == "true" if isinstance(item.get("AutoReply"), str) else item.get("AutoReply"),
+                "autoReply": coerce_soap_bool(item.get("AutoReply")),
                 "autoReplyTriggeredSendKey": auto_reply_ts.get("CustomerKey") if isinstance(auto_reply_ts, dict) else None,
                 # Sender header
                 "senderHeaderEmailAddress": item.get("SenderHeaderEmailAddress"),
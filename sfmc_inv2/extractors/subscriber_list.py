@@ -5,7 +5,7 @@ Note: This extracts list metadata only, not subscriber data.
 """
 
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 from ..cache.cache_manager import CacheType
 from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
@@ -26,7 +26,7 @@ class ListExtractor(BaseExtractor):
 
     SOAP_OBJECT_TYPE = "List"
 
-    SOAP_PROPERTIES = [
+    SOAP_PROPERTIES = (
         "ID",
         "ObjectID",
         "CustomerKey",
@@ -38,42 +38,26 @@ class ListExtractor(BaseExtractor):
         "AutomatedEmail.ID",
         "CreatedDate",
         "ModifiedDate",
-    ]
+    )
 
     required_caches = [CacheType.LIST_FOLDERS]
 
     async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
         """Fetch lists via SOAP API."""
-        self._pages_fetched = 0
-
-        result = self._soap.retrieve_all_pages(
+        return [item async for batch in self.iter_batches(options) for item in batch]
+
+    async def iter_batches(
+        self, options: ExtractorOptions
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield lists one SOAP page at a time."""
+        async for objects in self._iter_soap_pages(
+            "lists",
+            options,
             object_type=self.SOAP_OBJECT_TYPE,
             properties=self.SOAP_PROPERTIES,
             max_pages=options.max_pages,
-        )
-
-        if not result.get("ok"):
-            logger.error(f"Failed to fetch lists: {result.get('error')}")
-            return []
-
-        self._pages_fetched = result.get("pages_retrieved", 1)
-        objects = result.get("objects", [])
-        logger.info(f"Retrieved {len(objects)} lists")
-
-        return objects
-
-    async def enrich_item(
-        self,
-        item: dict[str, Any],
-        options: ExtractorOptions,
-    ) -> dict[str, Any]:
-        """Enrich list with breadcrumb path."""
-        category = item.get("Category")
-        if category:
-            item["folderPath"] = self.get_breadcrumb(
-                str(category), CacheType.LIST_FOLDERS
-            )
-        return item
+        ):
+            yield objects
 
     def transform_data(
         self,
@@ -84,6 +68,13 @@ class ListExtractor(BaseExtractor):
         transformed = []
 
         for item in items:
+            category = item.get("Category")
+            folder_path = None
+            if category:
+                folder_path = self.get_breadcrumb(
+                    str(category), CacheType.LIST_FOLDERS
+                )
+
             automated_email = item.get("AutomatedEmail", {})
 
             output = {
@@ -95,10 +86,10 @@ class ListExtractor(BaseExtractor):
                 "type": item.get("Type"),
                 "listClassification": item.get("ListClassification"),
                 # Folder
-                "category": item.get("Category"),
-                "folderPath": item.get("folderPath"),
+                "category": category,
+                "folderPath": folder_path,
                 # Automated email (if linked)
-                "automatedEmailId": automated_email.get("ID") if isinstance(automated_email, dict) else None,
+                "automatedEmailId": automated_email.get("ID"),
                 # Audit
                 "createdDate": item.get("CreatedDate"),
                 "modifiedDate": item.get("ModifiedDate"),
@@ -4,10 +4,10 @@ Extracts classic email template definitions via SOAP API.
 """
 
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 from ..cache.cache_manager import CacheType
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult, coerce_soap_bool
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ class TemplateExtractor(BaseExtractor):
 
     SOAP_OBJECT_TYPE = "Template"
 
-    SOAP_PROPERTIES = [
+    SOAP_PROPERTIES = (
         "ID",
         "ObjectID",
         "CustomerKey",
@@ -40,54 +40,41 @@ class TemplateExtractor(BaseExtractor):
         "IsTemplateSubjectLocked",
         # "CreatedDate",  # Fails at enterprise level
         # "ModifiedDate",  # Fails at enterprise level
-    ]
+    )
 
     # Additional properties when include_content is True
-    CONTENT_PROPERTIES = [
+    CONTENT_PROPERTIES = (
         "LayoutHTML",
         "HeaderContent.ID",
         "HeaderContent.Content",
-    ]
+    )
+
+    # Property lists per include_content setting, built once
+    _PROPS_NO_CONTENT = SOAP_PROPERTIES
+    _PROPS_WITH_CONTENT = SOAP_PROPERTIES + CONTENT_PROPERTIES
 
     required_caches = [CacheType.TEMPLATE_FOLDERS]
 
     async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
         """Fetch templates via SOAP API."""
-        self._pages_fetched = 0
-
-        # Determine which properties to retrieve
-        properties = list(self.SOAP_PROPERTIES)
-        if options.include_content:
-            properties.extend(self.CONTENT_PROPERTIES)
+        return [item async for batch in self.iter_batches(options) for item in batch]
+
+    async def iter_batches(
+        self, options: ExtractorOptions
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield templates one SOAP page at a time."""
+        properties = (
+            self._PROPS_WITH_CONTENT if options.include_content else self._PROPS_NO_CONTENT
+        )
 
-        result = self._soap.retrieve_all_pages(
+        async for objects in self._iter_soap_pages(
+            "templates",
+            options,
             object_type=self.SOAP_OBJECT_TYPE,
             properties=properties,
             max_pages=options.max_pages,
-        )
-
-        if not result.get("ok"):
-            logger.error(f"Failed to fetch templates: {result.get('error')}")
-            return []
-
-        self._pages_fetched = result.get("pages_retrieved", 1)
-        objects = result.get("objects", [])
-        logger.info(f"Retrieved {len(objects)} templates")
-
-        return objects
-
-    async def enrich_item(
-        self,
-        item: dict[str, Any],
-        options: ExtractorOptions,
-    ) -> dict[str, Any]:
-        """Enrich template with breadcrumb path."""
-        category_id = item.get("CategoryID")
-        if category_id:
-            item["folderPath"] = self.get_breadcrumb(
-                str(category_id), CacheType.TEMPLATE_FOLDERS
-            )
-        return item
+        ):
+            yield objects
 
     def transform_data(
         self,
@@ -98,6 +85,13 @@ class TemplateExtractor(BaseExtractor):
         transformed = []
 
         for item in items:
+            category_id = item.get("CategoryID")
+            folder_path = None
+            if category_id:
+                folder_path = self.get_breadcrumb(
+                    str(category_id), CacheType.TEMPLATE_FOLDERS
+                )
+
             header_content = item.get("HeaderContent", {})
 
             output = {
@@ -106,9 +100,9 @@ class TemplateExtractor(BaseExtractor):
                 "templateName": item.get("TemplateName"),
                 "customerKey": item.get("CustomerKey"),
                 "templateSubject": item.get("TemplateSubject"),
-                "isActive": item.get("ActiveFlag") == "true" if isinstance(item.get("ActiveFlag"), str) else item.get("ActiveFlag"),
-                "isBlank": item.get("IsBlank") == "true" if isinstance(item.get("IsBlank"), str) else item.get("IsBlank"),
-                "isTemplateSubjectLocked": item.get("IsTemplateSubjectLocked") == "true" if isinstance(item.get("IsTemplateSubjectLocked"), str) else item.get("IsTemplateSubjectLocked"),
+                "isActive": coerce_soap_bool(item.get("ActiveFlag")),
+                "isBlank": coerce_soap_bool(item.get("IsBlank")),
+                "isTemplateSubjectLocked": coerce_soap_bool(item.get("IsTemplateSubjectLocked")),
                 # Layout settings
                 "align": item.get("Align"),
                 "backgroundColor": item.get("BackgroundColor"),
@@ -118,11 +112,11 @@ class TemplateExtractor(BaseExtractor):
                 "cellspacing": item.get("Cellspacing"),
                 "width": item.get("Width"),
                 # Folder
-                "categoryId": item.get("CategoryID"),
-                "folderPath": item.get("folderPath"),
+                "categoryId": category_id,
+                "folderPath": folder_path,
                 # Content (if requested)
                 "layoutHTML": item.get("LayoutHTML") if options.include_content else None,
-                "headerContentId": header_content.get("ID") if isinstance(header_content, dict) else None,
+                "headerContentId": header_content.get("ID"),
                 # Audit
                 "createdDate": item.get("CreatedDate"),
                 "modifiedDate": item.get("ModifiedDate"),
@@ -5,14 +5,51 @@ Identifies relationships to emails, lists, and profiles.
 """
 
 import logging
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
 from ..cache.cache_manager import CacheType
-from ..types.relationships import RelationshipType
-from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult
+from ..types.relationships import RelationshipEdge, RelationshipType
+from .base_extractor import BaseExtractor, ExtractorOptions, ExtractorResult, coerce_soap_bool
 
 logger = logging.getLogger(__name__)
 
+# Output fields, in column order. Rows are filled in from a copy of a
+# pre-sized template: a dict literal this long is built one key at a time,
+# resizing the table as it grows.
+_OUTPUT_KEYS = (
+    "id",
+    "objectId",
+    "name",
+    "customerKey",
+    "description",
+    "status",
+    "emailId",
+    "emailName",
+    "listId",
+    "listName",
+    "sendClassificationKey",
+    "sendClassificationName",
+    "senderProfileKey",
+    "senderProfileName",
+    "deliveryProfileKey",
+    "deliveryProfileName",
+    "fromName",
+    "fromAddress",
+    "bccEmail",
+    "emailSubject",
+    "dynamicEmailSubject",
+    "isMultipart",
+    "isWrapped",
+    "autoAddSubscribers",
+    "autoUpdateSubscribers",
+    "priority",
+    "categoryId",
+    "folderPath",
+    "createdDate",
+    "modifiedDate",
+)
+_OUTPUT_TEMPLATE = dict.fromkeys(_OUTPUT_KEYS)
+
 
 class TriggeredSendExtractor(BaseExtractor):
     """Extractor for SFMC Triggered Send Definitions."""
@@ -26,7 +63,7 @@ class TriggeredSendExtractor(BaseExtractor):
 
     SOAP_OBJECT_TYPE = "TriggeredSendDefinition"
 
-    SOAP_PROPERTIES = [
+    SOAP_PROPERTIES = (
         "ObjectID",
         "CustomerKey",
         "Name",
@@ -55,42 +92,26 @@ class TriggeredSendExtractor(BaseExtractor):
         "Priority",
         "CreatedDate",
         "ModifiedDate",
-    ]
+    )
 
     required_caches = [CacheType.TRIGGERED_SEND_FOLDERS]
 
     async def fetch_data(self, options: ExtractorOptions) -> list[dict[str, Any]]:
         """Fetch triggered send definitions via SOAP API."""
-        self._pages_fetched = 0
+        return [item async for batch in self.iter_batches(options) for item in batch]
 
-        result = self._soap.retrieve_all_pages(
+    async def iter_batches(
+        self, options: ExtractorOptions
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield triggered send definitions one SOAP page at a time."""
+        async for objects in self._iter_soap_pages(
+            "triggered send definitions",
+            options,
             object_type=self.SOAP_OBJECT_TYPE,
             properties=self.SOAP_PROPERTIES,
             max_pages=options.max_pages,
-        )
-
-        if not result.get("ok"):
-            logger.error(f"Failed to fetch triggered sends: {result.get('error')}")
-            return []
-
-        self._pages_fetched = result.get("pages_retrieved", 1)
-        objects = result.get("objects", [])
-        logger.info(f"Retrieved {len(objects)} triggered send definitions")
-
-        return objects
-
-    async def enrich_item(
-        self,
-        item: dict[str, Any],
-        options: ExtractorOptions,
-    ) -> dict[str, Any]:
-        """Enrich triggered send with breadcrumb path."""
-        category_id = item.get("CategoryID")
-        if category_id:
-            item["folderPath"] = self.get_breadcrumb(
-                str(category_id), CacheType.TRIGGERED_SEND_FOLDERS
-            )
-        return item
+        ):
+            yield objects
 
     def transform_data(
         self,
@@ -101,53 +122,59 @@ class TriggeredSendExtractor(BaseExtractor):
         transformed = []
 
         for item in items:
-            # Extract nested objects
+            category_id = item.get("CategoryID")
+            folder_path = None
+            if category_id:
+                folder_path = self.get_breadcrumb(
+                    str(category_id), CacheType.TRIGGERED_SEND_FOLDERS
+                )
+
+            # Extract nested objects (the SOAP client normalizes these to dicts)
             email = item.get("Email", {})
             list_obj = item.get("List", {})
             send_class = item.get("SendClassification", {})
             sender_profile = item.get("SenderProfile", {})
             delivery_profile = item.get("DeliveryProfile", {})
 
-            output = {
-                "id": item.get("ObjectID"),
-                "objectId": item.get("ObjectID"),
-                "name": item.get("Name"),
-                "customerKey": item.get("CustomerKey"),
-                "description": item.get("Description"),
-                "status": item.get("TriggeredSendStatus"),
-                # Email reference
-                "emailId": email.get("ID") if isinstance(email, dict) else None,
-                "emailName": email.get("Name") if isinstance(email, dict) else None,
-                # List reference
-                "listId": list_obj.get("ID") if isinstance(list_obj, dict) else None,
-                "listName": list_obj.get("ListName") if isinstance(list_obj, dict) else None,
-                # Send classification
-                "sendClassificationKey": send_class.get("CustomerKey") if isinstance(send_class, dict) else None,
-                "sendClassificationName": send_class.get("Name") if isinstance(send_class, dict) else None,
-                # Sender profile
-                "senderProfileKey": sender_profile.get("CustomerKey") if isinstance(sender_profile, dict) else None,
-                "senderProfileName": sender_profile.get("Name") if isinstance(sender_profile, dict) else None,
-                # Delivery profile
-                "deliveryProfileKey": delivery_profile.get("CustomerKey") if isinstance(delivery_profile, dict) else None,
-                "deliveryProfileName": delivery_profile.get("Name") if isinstance(delivery_profile, dict) else None,
-                # Send settings
-                "fromName": item.get("FromName"),
-                "fromAddress": item.get("FromAddress"),
-                "bccEmail": item.get("BccEmail"),
-                "emailSubject": item.get("EmailSubject"),
-                "dynamicEmailSubject": item.get("DynamicEmailSubject"),
-                "isMultipart": item.get("IsMultipart") == "true" if isinstance(item.get("IsMultipart"), str) else item.get("IsMultipart"),
-                "isWrapped": item.get("IsWrapped") == "true" if isinstance(item.get("IsWrapped"), str) else item.get("IsWrapped"),
-                "autoAddSubscribers": item.get("AutoAddSubscribers") == "true" if isinstance(item.get("AutoAddSubscribers"), str) else item.get("AutoAddSubscribers"),
-                "autoUpdateSubscribers": item.get("AutoUpdateSubscribers") == "true" if isinstance(item.get("AutoUpdateSubscribers"), str) else item.get("AutoUpdateSubscribers"),
-                "priority": item.get("Priority"),
-                # Folder
-                "categoryId": item.get("CategoryID"),
-                "folderPath": item.get("folderPath"),
-                # Audit
-                "createdDate": item.get("CreatedDate"),
-                "modifiedDate": item.get("ModifiedDate"),
-            }
+            output = _OUTPUT_TEMPLATE.copy()
+            output["id"] = item.get("ObjectID")
+            output["objectId"] = item.get("ObjectID")
+            output["name"] = item.get("Name")
+            output["customerKey"] = item.get("CustomerKey")
+            output["description"] = item.get("Description")
+            output["status"] = item.get("TriggeredSendStatus")
+            # Email reference
+            output["emailId"] = email.get("ID")
+            output["emailName"] = email.get("Name")
+            # List reference
+            output["listId"] = list_obj.get("ID")
+            output["listName"] = list_obj.get("ListName")
+            # Send classification
+            output["sendClassificationKey"] = send_class.get("CustomerKey")
+            output["sendClassificationName"] = send_class.get("Name")
+            # Sender profile
+            output["senderProfileKey"] = sender_profile.get("CustomerKey")
+            output["senderProfileName"] = sender_profile.get("Name")
+            # Delivery profile
+            output["deliveryProfileKey"] = delivery_profile.get("CustomerKey")
+            output["deliveryProfileName"] = delivery_profile.get("Name")
+            # Send settings
+            output["fromName"] = item.get("FromName")
+            output["fromAddress"] = item.get("FromAddress")
+            output["bccEmail"] = item.get("BccEmail")
+            output["emailSubject"] = item.get("EmailSubject")
+            output["dynamicEmailSubject"] = item.get("DynamicEmailSubject")
+            output["isMultipart"] = coerce_soap_bool(item.get("IsMultipart"))
+            output["isWrapped"] = coerce_soap_bool(item.get("IsWrapped"))
+            output["autoAddSubscribers"] = coerce_soap_bool(item.get("AutoAddSubscribers"))
+            output["autoUpdateSubscribers"] = coerce_soap_bool(item.get("AutoUpdateSubscribers"))
+            output["priority"] = item.get("Priority")
+            # Folder
+            output["categoryId"] = category_id
+            output["folderPath"] = folder_path
+            # Audit
+            output["createdDate"] = item.get("CreatedDate")
+            output["modifiedDate"] = item.get("ModifiedDate")
             transformed.append(output)
 
         return transformed
@@ -158,6 +185,19 @@ class TriggeredSendExtractor(BaseExtractor):
         result: ExtractorResult,
     ) -> None:
         """Extract relationships from triggered sends to other objects."""
+        result.add_relationships(self._iter_relationship_edges(items))
+
+    def _iter_relationship_edges(
+        self, items: list[dict[str, Any]]
+    ) -> Iterator[RelationshipEdge]:
+        """Yield edges from each triggered send to the objects it uses."""
+        # Enum member lookups are comparatively slow; bind them once per call
+        uses_email = RelationshipType.TRIGGERED_SEND_USES_EMAIL
+        uses_list = RelationshipType.TRIGGERED_SEND_USES_LIST
+        uses_sender_profile = RelationshipType.TRIGGERED_SEND_USES_SENDER_PROFILE
+        uses_delivery_profile = RelationshipType.TRIGGERED_SEND_USES_DELIVERY_PROFILE
+        uses_send_classification = RelationshipType.TRIGGERED_SEND_USES_SEND_CLASSIFICATION
+
         for item in items:
             ts_id = item.get("ObjectID")
             ts_name = item.get("Name")
@@ -165,67 +205,74 @@ class TriggeredSendExtractor(BaseExtractor):
             if not ts_id:
                 continue
 
+            source_id = str(ts_id)
+
             # Email relationship
             email = item.get("Email", {})
-            if isinstance(email, dict) and email.get("ID"):
-                result.add_relationship(
-                    source_id=str(ts_id),
+            email_id = email.get("ID")
+            if email_id:
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="triggered_send",
                     source_name=ts_name,
-                    target_id=str(email.get("ID")),
+                    target_id=str(email_id),
                     target_type="email",
                     target_name=email.get("Name"),
-                    relationship_type=RelationshipType.TRIGGERED_SEND_USES_EMAIL,
+                    relationship_type=uses_email,
                 )
 
             # List relationship
             list_obj = item.get("List", {})
-            if isinstance(list_obj, dict) and list_obj.get("ID"):
-                result.add_relationship(
-                    source_id=str(ts_id),
+            list_id = list_obj.get("ID")
+            if list_id:
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="triggered_send",
                     source_name=ts_name,
-                    target_id=str(list_obj.get("ID")),
+                    target_id=str(list_id),
                     target_type="list",
                     target_name=list_obj.get("ListName"),
-                    relationship_type=RelationshipType.TRIGGERED_SEND_USES_LIST,
+                    relationship_type=uses_list,
                 )
 
             # Sender profile relationship
             sender_profile = item.get("SenderProfile", {})
-            if isinstance(sender_profile, dict) and sender_profile.get("CustomerKey"):
-                result.add_relationship(
-                    source_id=str(ts_id),
+            sp_key = sender_profile.get("CustomerKey")
+            if sp_key:
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="triggered_send",
                     source_name=ts_name,
-                    target_id=sender_profile.get("CustomerKey"),
+                    target_id=sp_key,
                     target_type="sender_profile",
                     target_name=sender_profile.get("Name"),
-                    relationship_type=RelationshipType.TRIGGERED_SEND_USES_SENDER_PROFILE,
+                    relationship_type=uses_sender_profile,
                 )
 
             # Delivery profile relationship
             delivery_profile = item.get("DeliveryProfile", {})
-            if isinstance(delivery_profile, dict) and delivery_profile.get("CustomerKey"):
-                result.add_relationship(
-                    source_id=str(ts_id),
+            dp_key = delivery_profile.get("CustomerKey")
+            if dp_key:
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="triggered_send",
                     source_name=ts_name,
-                    target_id=delivery_profile.get("CustomerKey"),
+                    target_id=dp_key,
                     target_type="delivery_profile",
                     target_name=delivery_profile.get("Name"),
-                    relationship_type=RelationshipType.TRIGGERED_SEND_USES_DELIVERY_PROFILE,
+                    relationship_type=uses_delivery_profile,
                 )
 
             # Send classification relationship
             send_class = item.get("SendClassification", {})
-            if isinstance(send_class, dict) and send_class.get("CustomerKey"):
-                result.add_relationship(
-                    source_id=str(ts_id),
+            sc_key = send_class.get("CustomerKey")
+            if sc_key:
+                yield RelationshipEdge(
+                    source_id=source_id,
                     source_type="triggered_send",
                     source_name=ts_name,
-                    target_id=send_class.get("CustomerKey"),
+                    target_id=sc_key,
                     target_type="send_classification",
                     target_name=send_class.get("Name"),
-                    relationship_type=RelationshipType.TRIGGERED_SEND_USES_SEND_CLASSIFICATION,
+                    relationship_type=uses_send_classification,
                 )
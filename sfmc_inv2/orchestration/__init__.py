@@ -1,26 +1,59 @@
-"""Execution orchestration for extractors."""
-
-from .extractor_runner import (
-    ExtractorRunner,
-    RunnerConfig,
-    RunnerResult,
-    PRESETS,
-    get_preset,
-    list_presets,
-    run_with_planner,
-    get_extraction_order,
-)
-from .extraction_planner import (
-    ExtractionPlanner,
-    ExtractionPlan,
-    ExtractionStep,
-    plan_extraction,
-)
-from .rate_limiter import (
-    AdaptiveRateLimiter,
-    RateLimitContext,
-    AsyncRateLimitContext,
-)
+"""Execution orchestration for extractors.
+
+Names are imported lazily on first access, so that using only the planner
+or rate limiter (including importing one of their submodules) doesn't load
+the runner and every extractor and API client behind it.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .extractor_runner import (
+        ExtractorRunner,
+        RunnerConfig,
+        RunnerResult,
+        PRESETS,
+        get_preset,
+        list_presets,
+        run_with_planner,
+        get_extraction_order,
+    )
+    from .extraction_planner import (
+        ExtractionPlanner,
+        ExtractionPlan,
+        ExtractionStep,
+        plan_extraction,
+    )
+    from .rate_limiter import (
+        AdaptiveRateLimiter,
+        AdaptiveConcurrencyLimiter,
+        RateLimitContext,
+        AsyncRateLimitContext,
+    )
+
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    # Runner
+    "ExtractorRunner": "extractor_runner",
+    "RunnerConfig": "extractor_runner",
+    "RunnerResult": "extractor_runner",
+    "PRESETS": "extractor_runner",
+    "get_preset": "extractor_runner",
+    "list_presets": "extractor_runner",
+    "run_with_planner": "extractor_runner",
+    "get_extraction_order": "extractor_runner",
+    # Planner
+    "ExtractionPlanner": "extraction_planner",
+    "ExtractionPlan": "extraction_planner",
+    "ExtractionStep": "extraction_planner",
+    "plan_extraction": "extraction_planner",
+    # Rate Limiter
+    "AdaptiveRateLimiter": "rate_limiter",
+    "AdaptiveConcurrencyLimiter": "rate_limiter",
+    "RateLimitContext": "rate_limiter",
+    "AsyncRateLimitContext": "rate_limiter",
+}
 
 __all__ = [
     # Runner
@@ -39,6 +72,23 @@ __all__ = [
     "plan_extraction",
     # Rate Limiter
     "AdaptiveRateLimiter",
+    "AdaptiveConcurrencyLimiter",
     "RateLimitContext",
     "AsyncRateLimitContext",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including not-yet-imported public names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
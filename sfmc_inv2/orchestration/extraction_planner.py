@@ -4,18 +4,51 @@ Provides topological sorting of extractors based on type dependencies
 to ensure dependencies are extracted before dependents.
 """
 
+import heapq
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from ..types.type_registry import (
     TYPE_REGISTRY,
-    get_type_by_extractor,
-    get_type_definition,
+    get_extractor_to_type_map,
     get_type_to_extractor_map,
 )
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _dependency_map() -> dict[str, tuple[str, ...]]:
+    """Snapshot each registered type's dependencies.
+
+    The registry doesn't change at runtime, so this is built once and
+    shared by all planners instead of re-reading type definitions for
+    every graph built.
+    """
+    return {
+        name: tuple(type_def.dependencies)
+        for name, type_def in TYPE_REGISTRY.items()
+    }
+
+
+@lru_cache(maxsize=1)
+def _extractor_dependency_map() -> dict[str, tuple[str, ...]]:
+    """Map each extractor to the extractors of its dependency types.
+
+    Dependencies without a registered type are left out, and the
+    registry's dependency order is kept.
+    """
+    return {
+        type_def.extractor_name: tuple(
+            TYPE_REGISTRY[dep].extractor_name
+            for dep in type_def.dependencies
+            if dep in TYPE_REGISTRY
+        )
+        for type_def in TYPE_REGISTRY.values()
+    }
+
+
+@dataclass(slots=True)
 class ExtractionStep:
     """A single step in the extraction plan."""
 
@@ -25,7 +58,7 @@ class ExtractionStep:
     reason: str = ""  # Why this step was added (for debugging)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionPlan:
     """Complete extraction plan with ordered steps."""
 
@@ -65,6 +98,8 @@ class ExtractionPlanner:
         """
         self._include_dependencies = include_dependencies
         self._type_to_extractor = get_type_to_extractor_map()
+        self._extractor_to_type = get_extractor_to_type_map()
+        self._dependencies = _dependency_map()
 
     def plan(
         self,
@@ -97,57 +132,54 @@ class ExtractionPlanner:
             11. triggered_send (cache_only=True)
             12. journeys (cache_only=False)
         """
-        exclude_cache_only = exclude_cache_only or []
+        excluded_types = frozenset(exclude_cache_only or ())
         plan = ExtractionPlan()
 
-        # Convert extractor names to type names
-        requested_types = set()
-        for extractor_name in requested_extractors:
-            type_def = get_type_by_extractor(extractor_name)
-            if type_def:
-                requested_types.add(type_def.name)
-            else:
-                # Unknown extractor, skip
-                continue
+        # Convert extractor names to type names, skipping unknown extractors
+        extractor_to_type = self._extractor_to_type
+        requested_types = {
+            extractor_to_type[name]
+            for name in requested_extractors
+            if name in extractor_to_type
+        }
 
         plan.requested_types = list(requested_types)
 
-        # Collect all dependencies
-        all_types = set(requested_types)
-        dependency_types = set()
-
         if self._include_dependencies:
-            to_process = list(requested_types)
-            processed = set()
+            # Collect all dependencies, building the graph on the way: every
+            # dependency of a collected type is collected too, so edges need
+            # no filtering and the sort can start straight away
+            in_degree: dict[str, int] = {}
+            graph: dict[str, list[str]] = {}
+            to_process = deque(requested_types)
 
             while to_process:
-                type_name = to_process.pop(0)
-                if type_name in processed:
+                type_name = to_process.popleft()
+                if type_name in in_degree:
                     continue
-                processed.add(type_name)
 
-                type_def = get_type_definition(type_name)
-                if type_def:
-                    for dep in type_def.dependencies:
-                        all_types.add(dep)
-                        if dep not in requested_types:
-                            dependency_types.add(dep)
-                        if dep not in processed:
-                            to_process.append(dep)
+                dependencies = self._dependencies.get(type_name, ())
+                in_degree[type_name] = len(dependencies)
+                graph.setdefault(type_name, [])
 
-        plan.dependency_types = list(dependency_types)
+                for dep in dependencies:
+                    graph.setdefault(dep, []).append(type_name)
+                    if dep not in in_degree:
+                        to_process.append(dep)
 
-        # Topological sort
-        sorted_types = self._topological_sort(all_types)
+            plan.dependency_types = [t for t in in_degree if t not in requested_types]
+            sorted_types = self._kahn_sort(in_degree, graph)
+        else:
+            sorted_types = self._topological_sort(requested_types)
 
         # Build plan steps
         for type_name in sorted_types:
-            type_def = get_type_definition(type_name)
-            if not type_def:
+            extractor_name = self._type_to_extractor.get(type_name)
+            if extractor_name is None:
                 continue
 
             is_requested = type_name in requested_types
-            is_excluded = type_name in exclude_cache_only
+            is_excluded = type_name in excluded_types
 
             if is_requested:
                 reason = "Requested by user"
@@ -162,7 +194,7 @@ class ExtractionPlanner:
             plan.steps.append(
                 ExtractionStep(
                     type_name=type_name,
-                    extractor_name=type_def.extractor_name,
+                    extractor_name=extractor_name,
                     cache_only=cache_only,
                     reason=reason,
                 )
@@ -195,25 +227,21 @@ class ExtractionPlanner:
                 ["automation"]                 # Layer 3: depends on query, etc.
             ]
         """
-        # Build adjacency list and in-degree count
-        in_degree: dict[str, int] = {t: 0 for t in types}
-        graph: dict[str, list[str]] = {t: [] for t in types}
+        # Nothing to order for a single type (e.g. one requested extractor)
+        if len(types) <= 1:
+            return [list(types)] if types else []
 
-        for type_name in types:
-            type_def = get_type_definition(type_name)
-            if type_def:
-                for dep in type_def.dependencies:
-                    if dep in types:
-                        graph[dep].append(type_name)
-                        in_degree[type_name] += 1
+        in_degree, graph = self._build_graph(types)
 
         layers: list[list[str]] = []
+        layered_count = 0
 
         # Start with types that have no dependencies (in-degree 0)
         current_layer = sorted([t for t in types if in_degree[t] == 0])
 
         while current_layer:
             layers.append(current_layer)
+            layered_count += len(current_layer)
 
             # Find next layer: types whose deps are now all processed
             next_layer = []
@@ -227,67 +255,139 @@ class ExtractionPlanner:
             current_layer = sorted(next_layer)
 
         # Handle any remaining types (cycles - shouldn't happen)
-        processed = {t for layer in layers for t in layer}
-        remaining = sorted([t for t in types if t not in processed])
-        if remaining:
-            layers.append(remaining)
+        if layered_count < len(types):
+            processed = {t for layer in layers for t in layer}
+            layers.append(sorted([t for t in types if t not in processed]))
 
         return layers
 
-    def _topological_sort(self, types: set[str]) -> list[str]:
-        """Perform topological sort on types based on dependencies.
+    def get_extractor_layers(self, plan: ExtractionPlan) -> list[list[str]]:
+        """Group a plan's extractors into dependency layers.
 
-        Uses Kahn's algorithm for topological sorting.
+        Extractors in a layer depend only on extractors in earlier layers,
+        so each layer can run concurrently once the previous one is done.
 
         Args:
-            types: Set of type names to sort.
+            plan: Extraction plan to organize.
 
         Returns:
-            List of type names in dependency order (dependencies first).
+            List of layers, each a list of extractor names from the plan.
+
+        Example:
+            planner = ExtractionPlanner()
+            plan = planner.plan(["queries"])
+            for layer in planner.get_extractor_layers(plan):
+                await asyncio.gather(*(run(name) for name in layer))
+        """
+        type_to_extractor = {step.type_name: step.extractor_name for step in plan.steps}
+        return [
+            [type_to_extractor[type_name] for type_name in layer]
+            for layer in self.get_dependency_layers(set(type_to_extractor))
+        ]
+
+    def get_extractor_graph(
+        self, plan: ExtractionPlan
+    ) -> tuple[dict[str, int], dict[str, list[str]]]:
+        """Get the dependency graph between a plan's extractors.
+
+        Lets callers start each extractor as soon as the extractors it
+        depends on have finished, instead of waiting for a whole layer.
+
+        Args:
+            plan: Extraction plan to organize.
+
+        Returns:
+            Tuple of (dependency count per extractor, dependents per
+            extractor), keyed by the plan's extractor names.
+        """
+        type_to_extractor = {step.type_name: step.extractor_name for step in plan.steps}
+        in_degree, graph = self._build_graph(set(type_to_extractor))
+        return (
+            {type_to_extractor[t]: count for t, count in in_degree.items()},
+            {
+                type_to_extractor[t]: [type_to_extractor[d] for d in dependents]
+                for t, dependents in graph.items()
+            },
+        )
+
+    def _build_graph(
+        self, types: set[str]
+    ) -> tuple[dict[str, int], dict[str, list[str]]]:
+        """Build the dependency graph restricted to the given types.
+
+        Args:
+            types: Set of type names to include.
+
+        Returns:
+            Tuple of (in-degree per type, dependents per type). An edge from
+            A to B means B depends on A.
         """
-        # Build adjacency list and in-degree count
-        # Edge from A to B means B depends on A
         in_degree: dict[str, int] = {t: 0 for t in types}
         graph: dict[str, list[str]] = {t: [] for t in types}
 
         for type_name in types:
-            type_def = get_type_definition(type_name)
-            if type_def:
-                for dep in type_def.dependencies:
-                    if dep in types:
-                        graph[dep].append(type_name)
-                        in_degree[type_name] += 1
+            for dep in self._dependencies.get(type_name, ()):
+                if dep in types:
+                    graph[dep].append(type_name)
+                    in_degree[type_name] += 1
+
+        return in_degree, graph
+
+    def _topological_sort(self, types: set[str]) -> list[str]:
+        """Perform topological sort on types based on dependencies.
+
+        Args:
+            types: Set of type names to sort.
+
+        Returns:
+            List of type names in dependency order (dependencies first).
+        """
+        if len(types) <= 1:
+            return list(types)
+
+        in_degree, graph = self._build_graph(types)
+        return self._kahn_sort(in_degree, graph)
+
+    @staticmethod
+    def _kahn_sort(
+        in_degree: dict[str, int], graph: dict[str, list[str]]
+    ) -> list[str]:
+        """Sort a dependency graph with Kahn's algorithm.
+
+        Uses a min-heap of ready types, so ties are always broken by name
+        for deterministic output. Consumes the in-degree counts.
+
+        Args:
+            in_degree: Number of unsorted dependencies per type.
+            graph: Dependents per type.
+
+        Returns:
+            List of type names in dependency order (dependencies first).
+        """
+        types = in_degree.keys()
 
         # Start with types that have no dependencies
-        queue = [t for t in types if in_degree[t] == 0]
-        # Sort for deterministic output
-        queue.sort()
+        ready = [t for t in types if in_degree[t] == 0]
+        heapq.heapify(ready)
 
         result = []
 
-        while queue:
-            # Process in sorted order for determinism
-            current = queue.pop(0)
+        while ready:
+            # Always take the smallest ready name for determinism
+            current = heapq.heappop(ready)
             result.append(current)
 
-            # Add new items with 0 in-degree
-            new_items = []
+            # Queue dependents whose dependencies are now all sorted
             for dependent in graph[current]:
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
-                    new_items.append(dependent)
-
-            # Sort new items for determinism
-            new_items.sort()
-            queue.extend(new_items)
-            queue.sort()
+                    heapq.heappush(ready, dependent)
 
         # Handle any cycles (shouldn't happen with valid registry)
-        remaining = [t for t in types if t not in result]
-        if remaining:
+        if len(result) < len(types):
             # Add remaining in sorted order (cycle detected)
-            remaining.sort()
-            result.extend(remaining)
+            sorted_set = set(result)
+            result.extend(sorted([t for t in types if t not in sorted_set]))
 
         return result
 
@@ -324,30 +424,69 @@ class ExtractionPlanner:
         missing: dict[str, list[str]] = {}
 
         extractor_set = set(extractor_names)
+        dependency_map = _extractor_dependency_map()
 
         for extractor_name in extractor_names:
-            type_def = get_type_by_extractor(extractor_name)
-            if not type_def:
-                continue
-
-            missing_deps = []
-            for dep_type in type_def.dependencies:
-                dep_def = get_type_definition(dep_type)
-                if dep_def and dep_def.extractor_name not in extractor_set:
-                    missing_deps.append(dep_def.extractor_name)
-
+            missing_deps = [
+                dep
+                for dep in dependency_map.get(extractor_name, ())
+                if dep not in extractor_set
+            ]
             if missing_deps:
                 missing[extractor_name] = missing_deps
 
         return missing
 
 
+@lru_cache(maxsize=128)
+def _cached_plan(
+    requested_extractors: frozenset[str],
+    include_dependencies: bool,
+) -> ExtractionPlan:
+    """Plan a distinct set of requested extractors once.
+
+    The returned plan is shared; callers must copy it before handing it out.
+    """
+    planner = ExtractionPlanner(include_dependencies=include_dependencies)
+    return planner.plan(sorted(requested_extractors))
+
+
+def _copy_plan(plan: ExtractionPlan) -> ExtractionPlan:
+    """Copy a plan so the caller can modify it freely."""
+    return ExtractionPlan(
+        steps=[
+            ExtractionStep(
+                type_name=step.type_name,
+                extractor_name=step.extractor_name,
+                cache_only=step.cache_only,
+                reason=step.reason,
+            )
+            for step in plan.steps
+        ],
+        requested_types=list(plan.requested_types),
+        dependency_types=list(plan.dependency_types),
+    )
+
+
+def clear_plan_cache() -> None:
+    """Clear cached plans and dependency snapshots.
+
+    Only needed if the type registry is modified at runtime (e.g. in tests).
+    """
+    _cached_plan.cache_clear()
+    _dependency_map.cache_clear()
+    _extractor_dependency_map.cache_clear()
+
+
 def plan_extraction(
     requested_extractors: list[str],
     include_dependencies: bool = True,
 ) -> ExtractionPlan:
     """Convenience function to create an extraction plan.
 
+    Plans are cached per distinct set of requested extractors; each call
+    returns its own copy.
+
     Args:
         requested_extractors: List of extractor names to run.
         include_dependencies: If True, include dependency types.
@@ -355,8 +494,9 @@ def plan_extraction(
     Returns:
         ExtractionPlan with topologically sorted steps.
     """
-    planner = ExtractionPlanner(include_dependencies=include_dependencies)
-    return planner.plan(requested_extractors)
+    return _copy_plan(
+        _cached_plan(frozenset(requested_extractors), include_dependencies)
+    )
 
 
 def get_extraction_order(requested_extractors: list[str]) -> list[str]:
@@ -368,5 +508,4 @@ def get_extraction_order(requested_extractors: list[str]) -> list[str]:
     Returns:
         Ordered list of extractor names.
     """
-    planner = ExtractionPlanner(include_dependencies=True)
-    return planner.get_extraction_order(requested_extractors)
+    return _cached_plan(frozenset(requested_extractors), True).all_extractor_names
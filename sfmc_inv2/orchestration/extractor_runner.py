@@ -8,24 +8,82 @@ to ensure dependencies are extracted before dependents.
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Callable, Optional
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
 
 from ..core.config import SFMCConfig, get_config, get_config_with_account
 from ..clients.rest_client import RESTClient
 from ..clients.soap_client import SOAPClient
-from ..clients.auth import TokenManager
+from ..clients.auth import TokenManager, get_token_manager
 from ..extractors import EXTRACTORS, ExtractorOptions, ExtractorResult, get_extractor
 from ..extractors.base_extractor import BaseExtractor
 from ..types.inventory import InventoryStatistics, ExtractorStats as StatsModel
 from ..types.relationships import RelationshipGraph
 from .extraction_planner import ExtractionPlan, ExtractionPlanner, plan_extraction
-from .rate_limiter import AdaptiveRateLimiter
+from .rate_limiter import AdaptiveConcurrencyLimiter
 
 logger = logging.getLogger(__name__)
 
+# Process-wide extraction results: cache key -> (monotonic store time, result)
+_result_cache: dict[str, tuple[float, ExtractorResult]] = {}
+
+
+def _result_cache_key(
+    name: str,
+    subdomain: str,
+    account_id: Optional[str],
+    default_bu: bool,
+    options: ExtractorOptions,
+) -> str:
+    """Build a stable cache key for an extraction's inputs.
+
+    Default-BU and per-BU runs on the same account are kept apart, since
+    per-BU results are tagged with their source BU. The progress callback
+    doesn't affect what is extracted, so it's left out.
+    """
+    option_values = {}
+    for option in fields(options):
+        if option.name == "progress_callback":
+            continue
+        value = getattr(options, option.name)
+        if isinstance(value, (set, frozenset)):
+            value = sorted(str(v) for v in value)
+        option_values[option.name] = value
+
+    payload = json.dumps(
+        {
+            "extractor": name,
+            "subdomain": subdomain,
+            "account_id": account_id,
+            "default_bu": default_bu,
+            "options": option_values,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _copy_result(result: ExtractorResult) -> ExtractorResult:
+    """Deep-copy a result so cached and returned results share no objects.
+
+    Items and relationship edges are mutated downstream (e.g. BU tagging,
+    orphan detection), which must not leak into later cache hits.
+    """
+    return copy.deepcopy(result)
+
+
+def clear_result_cache() -> None:
+    """Drop all cached extraction results."""
+    _result_cache.clear()
+
 
 @dataclass
 class RunnerConfig:
@@ -41,7 +99,11 @@ class RunnerConfig:
     include_details: bool = True
     include_content: bool = False
 
-    # Rate limiting
+    # Reuse unchanged object details from previous runs (None disables)
+    detail_cache_dir: Optional[Path] = None
+
+    # Deprecated: accepted for compatibility but ignored. Request pacing is
+    # now set by the concurrency limiter (max_concurrent_requests).
     base_delay: float = 0.3
     max_delay: float = 60.0
 
@@ -56,6 +118,11 @@ class RunnerConfig:
     # Multi-BU support: run extractors with supports_multi_bu=True across all child BUs
     enable_multi_bu: bool = True  # Enable multi-BU aggregation
     child_bu_ids: list[str] = field(default_factory=list)  # Override child BUs (or use config)
+    max_concurrent_bus: int = 4  # BUs extracted at once, across all extractors
+
+    # Reuse successful results of identical extractions within this many
+    # seconds, across runners in this process (0 disables)
+    cache_ttl_seconds: float = 0.0
 
 
 @dataclass
@@ -133,16 +200,21 @@ class ExtractorRunner:
             config: Runner configuration.
         """
         self._config = config or RunnerConfig()
-        self._rate_limiter = AdaptiveRateLimiter(
-            max_concurrent=self._config.max_concurrent_requests,
-            base_delay=self._config.base_delay,
-            max_delay=self._config.max_delay,
+        # Sizes in-flight API requests to SFMC's load, shared by all BU clients
+        self._limiter = AdaptiveConcurrencyLimiter(
+            initial=self._config.max_concurrent_requests,
+            max_limit=self._config.max_concurrent_requests * 4,
         )
         self._planner = ExtractionPlanner(
             include_dependencies=self._config.include_dependencies
         )
         self._current_plan: Optional[ExtractionPlan] = None
         self._base_config = get_config()
+        # BU MID -> (REST client, SOAP client) sharing one TokenManager
+        self._bu_clients: dict[str, tuple[RESTClient, SOAPClient]] = {}
+        self._default_clients: Optional[tuple[RESTClient, SOAPClient]] = None
+        # Shared by all multi-BU extractors during run(); None outside it
+        self._bu_semaphore: Optional[asyncio.Semaphore] = None
 
     def _get_child_bu_ids(self) -> list[str]:
         """Get child BU IDs to use for multi-BU extraction."""
@@ -151,6 +223,125 @@ class ExtractorRunner:
             return self._config.child_bu_ids
         return self._base_config.child_account_ids
 
+    def _get_bu_clients(self, account_id: str) -> tuple[RESTClient, SOAPClient]:
+        """Get the API clients for a Business Unit, creating them on first use.
+
+        Clients are shared by every extractor run against the BU, so each BU
+        authenticates once and reuses its pooled SOAP connections. All BUs'
+        clients draw on the runner's adaptive request limit. Creation never
+        awaits, so concurrent tasks can't race to build a BU's clients.
+
+        Args:
+            account_id: Target BU MID.
+
+        Returns:
+            Tuple of (RESTClient, SOAPClient) for the BU.
+        """
+        clients = self._bu_clients.get(account_id)
+        if clients is None:
+            bu_config = get_config_with_account(account_id)
+            token_manager = TokenManager(bu_config)
+            clients = (
+                RESTClient(bu_config, token_manager, limiter=self._limiter),
+                SOAPClient(bu_config, token_manager, limiter=self._limiter),
+            )
+            self._bu_clients[account_id] = clients
+        return clients
+
+    def _get_default_clients(self) -> tuple[RESTClient, SOAPClient]:
+        """Get the API clients for the default BU, creating them on first use.
+
+        They share the process-wide token manager, and so its account and
+        cached token, but draw on the runner's adaptive request limit like
+        the per-BU clients.
+
+        Returns:
+            Tuple of (RESTClient, SOAPClient) for the default BU.
+        """
+        if self._default_clients is None:
+            token_manager = get_token_manager()
+            self._default_clients = (
+                RESTClient(token_manager.config, token_manager, limiter=self._limiter),
+                SOAPClient(token_manager.config, token_manager, limiter=self._limiter),
+            )
+        return self._default_clients
+
+    def _create_extractor(
+        self, name: str, account_id: Optional[str] = None
+    ) -> BaseExtractor:
+        """Create an extractor that uses the runner's clients for a BU.
+
+        Args:
+            name: Extractor name.
+            account_id: Target BU MID, or None for the default BU.
+
+        Returns:
+            Extractor instance.
+        """
+        if account_id is None:
+            rest_client, soap_client = self._get_default_clients()
+        else:
+            rest_client, soap_client = self._get_bu_clients(account_id)
+        extractor_class = get_extractor(name)
+        return extractor_class(rest_client=rest_client, soap_client=soap_client)
+
+    async def aclose(self) -> None:
+        """Close pooled connections held by the runner's clients.
+
+        The clients stay cached (with their tokens) and reconnect on next use.
+        """
+        clients = list(self._bu_clients.values())
+        if self._default_clients is not None:
+            clients.append(self._default_clients)
+        for rest_client, soap_client in clients:
+            await rest_client.aclose()
+            await soap_client.aclose()
+
+    async def _extract_with_cache(
+        self,
+        name: str,
+        account_id: Optional[str],
+        options: ExtractorOptions,
+        extract: Callable[[], Awaitable[ExtractorResult]],
+    ) -> ExtractorResult:
+        """Run an extraction, reusing a recent result for the same inputs.
+
+        Only successful results are cached, for cache_ttl_seconds. Callers
+        get a copy, so they can't alter the cached result.
+
+        Args:
+            name: Extractor name.
+            account_id: Target BU MID, or None for the configured default BU.
+            options: Extraction options.
+            extract: Performs the extraction on a cache miss.
+
+        Returns:
+            The cached or freshly extracted result.
+        """
+        ttl = self._config.cache_ttl_seconds
+        if ttl <= 0:
+            return await extract()
+
+        default_bu = account_id is None
+        key = _result_cache_key(
+            name,
+            self._base_config.subdomain,
+            self._base_config.account_id if default_bu else account_id,
+            default_bu,
+            options,
+        )
+        cached = _result_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            logger.info(f"Reusing cached {name} result")
+            result = _copy_result(cached[1])
+            result.metadata["cached"] = True
+            return result
+
+        result = await extract()
+        if result.success:
+            _result_cache[key] = (time.monotonic(), _copy_result(result))
+        return result
+
     async def _run_extractor_for_bu(
         self,
         name: str,
@@ -159,7 +350,7 @@ class ExtractorRunner:
     ) -> ExtractorResult:
         """Run an extractor targeting a specific Business Unit.
 
-        Creates BU-specific clients and tags results with source BU.
+        Uses the BU's shared clients and tags results with source BU.
 
         Args:
             name: Extractor name.
@@ -169,23 +360,21 @@ class ExtractorRunner:
         Returns:
             ExtractorResult with items tagged with source BU.
         """
-        # Create BU-specific configuration
-        bu_config = get_config_with_account(account_id)
-
-        # Create BU-specific clients
-        token_manager = TokenManager(bu_config)
-        rest_client = RESTClient(bu_config, token_manager)
-        soap_client = SOAPClient(bu_config, token_manager)
-
-        # Create extractor with BU-specific clients
-        extractor_class = get_extractor(name)
-        extractor = extractor_class(
-            rest_client=rest_client,
-            soap_client=soap_client,
+        return await self._extract_with_cache(
+            name,
+            account_id,
+            options,
+            lambda: self._extract_for_bu(name, account_id, options),
         )
 
-        # Run extraction
-        extractor_result = await extractor.extract(options)
+    async def _extract_for_bu(
+        self,
+        name: str,
+        account_id: str,
+        options: ExtractorOptions,
+    ) -> ExtractorResult:
+        """Extract from a specific Business Unit, bypassing the result cache."""
+        extractor_result = await self._create_extractor(name, account_id).extract(options)
 
         # Tag all items with source BU
         for item in extractor_result.items:
@@ -206,6 +395,9 @@ class ExtractorRunner:
     ) -> ExtractorResult:
         """Run an extractor across all configured BUs and merge results.
 
+        BUs are extracted concurrently, up to max_concurrent_bus at a time.
+        A BU that raises is recorded as an error on the merged result.
+
         Args:
             name: Extractor name.
             options: Extraction options.
@@ -216,24 +408,32 @@ class ExtractorRunner:
         child_bu_ids = self._get_child_bu_ids()
         if not child_bu_ids:
             # No child BUs, run on parent only
-            extractor_class = get_extractor(name)
-            extractor = extractor_class()
-            return await extractor.extract(options)
+            return await self._create_extractor(name).extract(options)
 
-        # Run on all child BUs (skip parent for child-BU-specific objects like journeys)
-        all_results = []
-        for bu_id in child_bu_ids:
-            try:
+        semaphore = self._bu_semaphore or asyncio.Semaphore(self._config.max_concurrent_bus)
+
+        async def run_bu(bu_id: str) -> ExtractorResult:
+            async with semaphore:
                 logger.info(f"Running {name} on BU {bu_id}")
-                bu_result = await self._run_extractor_for_bu(name, bu_id, options)
-                all_results.append(bu_result)
-            except Exception as e:
-                logger.error(f"Failed to run {name} on BU {bu_id}: {e}")
+                return await self._run_extractor_for_bu(name, bu_id, options)
+
+        # Run on all child BUs (skip parent for child-BU-specific objects like journeys)
+        bu_results = await asyncio.gather(
+            *(run_bu(bu_id) for bu_id in child_bu_ids), return_exceptions=True
+        )
 
-        # Merge all results
+        # Merge all results, in BU order
         merged = ExtractorResult(extractor_name=name, success=True)
+        all_results = []
 
-        for bu_result in all_results:
+        for bu_id, bu_result in zip(child_bu_ids, bu_results):
+            if isinstance(bu_result, Exception):
+                logger.error(f"Failed to run {name} on BU {bu_id}: {bu_result}")
+                merged.add_error("BUError", str(bu_result), {"bu_mid": bu_id})
+                merged.success = False
+                continue
+
+            all_results.append(bu_result)
             merged.items.extend(bu_result.items)
             merged.relationships.extend(bu_result.relationships)
             merged.errors.extend(bu_result.errors)
@@ -302,8 +502,9 @@ class ExtractorRunner:
         result = RunnerResult(extractors_run=extractor_names)
         custom_options = custom_options or {}
 
-        # Create semaphore for extractor concurrency
+        # Create semaphores for extractor and multi-BU concurrency
         semaphore = asyncio.Semaphore(self._config.max_concurrent_extractors)
+        self._bu_semaphore = asyncio.Semaphore(self._config.max_concurrent_bus)
 
         async def run_single(name: str) -> tuple[str, ExtractorResult]:
             async with semaphore:
@@ -327,8 +528,12 @@ class ExtractorRunner:
                         extractor_result = await self._run_multi_bu_extractor(name, options)
                     else:
                         # Run on default BU only
-                        extractor = extractor_class()
-                        extractor_result = await extractor.extract(options)
+                        extractor_result = await self._extract_with_cache(
+                            name,
+                            None,
+                            options,
+                            lambda: self._create_extractor(name).extract(options),
+                        )
 
                     status = "Completed" if extractor_result.success else "Failed"
                     self._report_progress(
@@ -345,44 +550,20 @@ class ExtractorRunner:
                     self._report_progress(name, 0, 0, "Error")
                     return name, error_result
 
-        # Run extractors - use dependency layers if planner enabled
-        if self._config.use_extraction_planner and self._current_plan:
-            # Get types from plan steps
-            plan_types = {step.type_name for step in self._current_plan.steps}
-            layers = self._planner.get_dependency_layers(plan_types)
-
-            # Build type-to-extractor mapping for this plan
-            type_to_extractor = {
-                step.type_name: step.extractor_name
-                for step in self._current_plan.steps
-            }
-
-            logger.info(f"Executing {len(layers)} dependency layers")
-
-            completed = []
-            for layer_idx, layer_types in enumerate(layers):
-                # Convert types to extractor names
-                layer_extractors = [
-                    type_to_extractor[t]
-                    for t in layer_types
-                    if t in type_to_extractor
-                ]
-
-                if not layer_extractors:
-                    continue
-
-                logger.debug(
-                    f"Layer {layer_idx}: {layer_extractors}"
+        try:
+            # Run extractors - in dependency order if planner enabled
+            if self._config.use_extraction_planner and self._current_plan:
+                completed = await self._run_in_dependency_order(
+                    self._current_plan, run_single
                 )
-
-                # Run this layer in parallel
-                layer_tasks = [run_single(name) for name in layer_extractors]
-                layer_results = await asyncio.gather(*layer_tasks, return_exceptions=True)
-                completed.extend(layer_results)
-        else:
-            # Non-planner mode: run all concurrently (original behavior)
-            tasks = [run_single(name) for name in ordered_names]
-            completed = await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                # Non-planner mode: run all concurrently (original behavior)
+                tasks = [run_single(name) for name in ordered_names]
+                completed = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # The semaphore belongs to this run's event loop
+            self._bu_semaphore = None
+            await self.aclose()
 
         # Collect results
         for item in completed:
@@ -414,6 +595,69 @@ class ExtractorRunner:
 
         return result
 
+    async def _run_in_dependency_order(
+        self,
+        plan: ExtractionPlan,
+        run_single: Callable[[str], Awaitable[tuple[str, ExtractorResult]]],
+    ) -> list[Any]:
+        """Run a plan's extractors, each as soon as its dependencies finish.
+
+        Unlike running layer by layer, a slow extractor only holds back the
+        extractors that depend on it. Concurrency is still bounded by
+        run_single's semaphore; ready extractors queue in plan order.
+
+        Args:
+            plan: Extraction plan to execute.
+            run_single: Coroutine function running one extractor by name.
+
+        Returns:
+            Outcomes (result tuple or exception) in plan order.
+        """
+        order = plan.all_extractor_names
+        position = {name: idx for idx, name in enumerate(order)}
+        pending_deps, dependents = self._planner.get_extractor_graph(plan)
+
+        outcomes: dict[str, Any] = {}
+        running: dict[asyncio.Future[Any], str] = {}
+
+        def start(names: list[str]) -> None:
+            for name in sorted(names, key=position.__getitem__):
+                running[asyncio.ensure_future(run_single(name))] = name
+
+        logger.info(f"Executing {len(order)} extractors in dependency order")
+        try:
+            start([name for name in order if pending_deps[name] == 0])
+
+            while len(outcomes) < len(order):
+                if not running:
+                    # Only a dependency cycle can leave extractors waiting; run
+                    # them last, as the planner orders them
+                    stuck = [name for name in order if name not in outcomes]
+                    logger.warning(f"Dependency cycle among {stuck}, running them anyway")
+                    for name in stuck:
+                        pending_deps[name] = 0
+                    start(stuck)
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+                ready = []
+                for task in done:
+                    name = running.pop(task)
+                    outcomes[name] = task.exception() or task.result()
+                    for dependent in dependents[name]:
+                        pending_deps[dependent] -= 1
+                        if pending_deps[dependent] == 0:
+                            ready.append(dependent)
+                start(ready)
+        finally:
+            # If the run is cancelled or fails, stop extractors still in flight
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return [outcomes[name] for name in order]
+
     def run_sync(
         self,
         extractor_names: list[str],
@@ -447,34 +691,39 @@ class ExtractorRunner:
         result = RunnerResult(extractors_run=extractor_names)
         custom_options = custom_options or {}
 
-        for name in extractor_names:
-            self._report_progress(name, 0, 0, "Starting")
-
-            try:
-                extractor_class = get_extractor(name)
-                extractor = extractor_class()
+        try:
+            for name in extractor_names:
+                self._report_progress(name, 0, 0, "Starting")
 
-                options = self._build_options(name, custom_options.get(name, {}))
-                extractor_result = await extractor.extract(options)
+                try:
+                    options = self._build_options(name, custom_options.get(name, {}))
+                    extractor_result = await self._extract_with_cache(
+                        name,
+                        None,
+                        options,
+                        lambda: self._create_extractor(name).extract(options),
+                    )
 
-                result.results[name] = extractor_result
+                    result.results[name] = extractor_result
 
-                # Merge relationships
-                for edge in extractor_result.relationships:
-                    result.relationship_graph.edges.append(edge)
+                    # Merge relationships
+                    for edge in extractor_result.relationships:
+                        result.relationship_graph.edges.append(edge)
 
-                status = "Completed" if extractor_result.success else "Failed"
-                self._report_progress(
-                    name, extractor_result.item_count, extractor_result.item_count, status
-                )
+                    status = "Completed" if extractor_result.success else "Failed"
+                    self._report_progress(
+                        name, extractor_result.item_count, extractor_result.item_count, status
+                    )
 
-            except Exception as e:
-                logger.exception(f"Extractor {name} failed with exception")
-                error_result = ExtractorResult(extractor_name=name, success=False)
-                error_result.add_error("RunnerError", str(e))
-                error_result.completed_at = datetime.now()
-                result.results[name] = error_result
-                self._report_progress(name, 0, 0, "Error")
+                except Exception as e:
+                    logger.exception(f"Extractor {name} failed with exception")
+                    error_result = ExtractorResult(extractor_name=name, success=False)
+                    error_result.add_error("RunnerError", str(e))
+                    error_result.completed_at = datetime.now()
+                    result.results[name] = error_result
+                    self._report_progress(name, 0, 0, "Error")
+        finally:
+            await self.aclose()
 
         # Detect orphaned objects
         self._detect_orphans(result)
@@ -498,6 +747,8 @@ class ExtractorRunner:
             max_concurrent=custom.get("max_concurrent", self._config.max_concurrent_requests),
             include_details=custom.get("include_details", self._config.include_details),
             include_content=custom.get("include_content", self._config.include_content),
+            detail_cache_dir=custom.get("detail_cache_dir", self._config.detail_cache_dir),
+            relationship_types=custom.get("relationship_types"),
             progress_callback=progress_wrapper,
             custom=custom,
         )
@@ -664,6 +915,4 @@ def get_extraction_order(extractor_names: list[str]) -> list[str]:
     Returns:
         Ordered list of extractor names (dependencies first).
     """
-    planner = ExtractionPlanner(include_dependencies=True)
-    plan = planner.plan(extractor_names)
-    return plan.all_extractor_names
+    return plan_extraction(extractor_names).all_extractor_names
@@ -1,13 +1,15 @@
 """Adaptive rate limiter for API request management.
 
 Implements progressive backoff on failures and gradual recovery on success,
-with semaphore-based concurrency control.
+with semaphore-based concurrency control, and an AIMD concurrency limiter
+that sizes the number of in-flight requests to the API's current load.
 """
 
 import asyncio
 import logging
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -227,6 +229,140 @@ class AdaptiveRateLimiter:
                 self._global_stress_multiplier = 1.0
 
 
+def _on_event_loop() -> bool:
+    """Check whether the calling thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    """Wake an async waiter unless it was cancelled meanwhile."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit that adapts to API load, like TCP congestion control.
+
+    Additive increase, multiplicative decrease (AIMD): the limit grows by
+    about one for each full window of requests that completes without
+    overload, and is cut by ``decrease_factor`` at most once per window
+    when requests are throttled. The limit is shared by blocking callers on
+    worker threads and coroutines on the event loop.
+    """
+
+    def __init__(
+        self,
+        initial: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        decrease_factor: float = 0.5,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial: Starting number of concurrent requests.
+            min_limit: Lowest the limit can be cut to.
+            max_limit: Highest the limit can grow to.
+            decrease_factor: Multiplier applied to the limit on overload.
+        """
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._decrease_factor = decrease_factor
+        self._limit = float(max(min_limit, min(initial, max_limit)))
+        self._in_flight = 0
+        self._overloads = 0
+        # Requests still in flight from before the last cut; their overload
+        # signals reflect the old limit, so they don't cut it again
+        self._hold_off = 0
+
+        self._condition = threading.Condition()
+        self._async_waiters: deque[
+            tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def _try_acquire(self) -> bool:
+        """Take a slot if one is free. Caller must hold the condition."""
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """Block until a request slot is free, then take it.
+
+        A sync request made on the event loop thread would block the
+        coroutines holding the slots from ever releasing them, so there the
+        slot is taken without waiting, even if that exceeds the limit.
+        """
+        with self._condition:
+            if _on_event_loop():
+                self._in_flight += 1
+                return
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) for a slot, then take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self._try_acquire():
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(self, overloaded: bool = False) -> None:
+        """Return a slot and adjust the limit from the request's outcome.
+
+        Args:
+            overloaded: Whether the API signalled overload (e.g. HTTP 429).
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._overloads += 1
+                if self._hold_off > 0:
+                    self._hold_off -= 1
+                else:
+                    self._limit = max(
+                        float(self._min_limit), self._limit * self._decrease_factor
+                    )
+                    self._hold_off = self._in_flight
+            else:
+                self._hold_off = max(0, self._hold_off - 1)
+                # +1/limit per request adds about one slot per full window
+                self._limit = min(
+                    float(self._max_limit), self._limit + 1 / self._limit
+                )
+
+            waiters = list(self._async_waiters)
+            self._async_waiters.clear()
+            self._condition.notify_all()
+
+        # Waiters re-check for a free slot once woken
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def get_status(self) -> dict[str, Any]:
+        """Get current limiter status."""
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "overloads": self._overloads,
+            }
+
+
 # Context managers for cleaner usage
 class RateLimitContext:
     """Sync context manager for rate limiting."""
@@ -3,7 +3,7 @@
 import pytest
 
 from sfmc_inv2.extractors.asset import AssetExtractor, CLOUDPAGE_ASSET_TYPES
-from sfmc_inv2.extractors.base_extractor import ExtractorResult
+from sfmc_inv2.extractors.base_extractor import ExtractorOptions, ExtractorResult
 from sfmc_inv2.types.relationships import RelationshipType
 
 
@@ -433,3 +433,25 @@ class TestExtractRelationshipsIntegration:
                        if e.relationship_type == RelationshipType.CLOUDPAGE_WRITES_DE]
         assert len(read_edges) == 1
         assert len(write_edges) == 1
+
+    @pytest.mark.asyncio
+    async def test_relationship_types_filter(self, extractor):
+        """Default transform_and_extract should keep only requested edge types."""
+        items = [{
+            "id": "44444",
+            "name": "Read/Write Page",
+            "assetType": {"id": 205},
+            "content": '''
+            %%[
+            SET @v1 = Lookup("Read_Table", "Col1", "Key", @k1)
+            InsertDE("Write_Table", "Col3", @v3)
+            ]%%
+            ''',
+        }]
+
+        result = ExtractorResult(extractor_name="assets")
+        options = ExtractorOptions(relationship_types={RelationshipType.CLOUDPAGE_WRITES_DE})
+        rows = await extractor.transform_and_extract(items, options, result)
+
+        assert len(rows) == 1
+        assert [e.target_id for e in result.relationships] == ["Write_Table"]
@@ -0,0 +1,92 @@
+"""Tests for the persistent detail cache."""
+
+import pytest
+
+from sfmc_inv2.cache import CacheType, DetailCache
+
+
+def _cache(tmp_path, **kwargs):
+    """Create a journey detail cache rooted in a temp dir."""
+    return DetailCache(CacheType.JOURNEY_DETAILS, tmp_path, **kwargs)
+
+
+class TestDetailCache:
+    """Tests for DetailCache."""
+
+    def test_round_trip_after_flush(self, tmp_path):
+        """Flushed entries should be readable by a fresh cache."""
+        cache = _cache(tmp_path)
+        cache.put("j-1", "v1", {"activities": [1]})
+        cache.flush()
+
+        assert _cache(tmp_path).get("j-1", "v1") == {"activities": [1]}
+
+    def test_version_mismatch_misses(self, tmp_path):
+        """A different version stamp should miss."""
+        cache = _cache(tmp_path)
+        cache.put("j-1", "v1", {"a": 1})
+
+        assert cache.get("j-1", "v2") is None
+        assert cache.get("j-1", None) is None
+        assert cache.get_stats()["misses"] == 2
+
+    def test_buffers_until_batch_size(self, tmp_path):
+        """Entries should be appended in batches, not one write per put."""
+        cache = _cache(tmp_path, flush_batch_size=3)
+        cache.put("a", "v", {})
+        cache.put("b", "v", {})
+        assert not cache.path.exists()
+
+        cache.put("c", "v", {})
+        assert len(cache.path.read_bytes().splitlines()) == 3
+
+    def test_later_entries_supersede(self, tmp_path):
+        """Replay should keep the most recent entry per object."""
+        cache = _cache(tmp_path)
+        cache.put("j-1", "v1", {"n": 1})
+        cache.put("j-1", "v2", {"n": 2})
+        cache.flush()
+
+        reloaded = _cache(tmp_path)
+        assert reloaded.get("j-1", "v1") is None
+        assert reloaded.get("j-1", "v2") == {"n": 2}
+
+    def test_skips_torn_lines(self, tmp_path):
+        """An interrupted trailing write should not lose earlier entries."""
+        cache = _cache(tmp_path)
+        cache.put("j-1", "v1", {"n": 1})
+        cache.flush()
+        with open(cache.path, "ab") as f:
+            f.write(b'{"id": "j-2", "vers')
+
+        assert _cache(tmp_path).get("j-1", "v1") == {"n": 1}
+
+    @pytest.mark.parametrize("compacts", [True, False])
+    def test_appends_after_torn_line_survive(self, tmp_path, monkeypatch, compacts):
+        """Entries written after a torn line should not be merged into it."""
+        cache = _cache(tmp_path)
+        cache.put("j-1", "v1", {"n": 1})
+        cache.flush()
+        with open(cache.path, "ab") as f:
+            f.write(b'{"id": "j-2", "vers')
+
+        resumed = _cache(tmp_path)
+        if not compacts:
+            monkeypatch.setattr(resumed, "_compact", lambda: None)
+        resumed.put("j-3", "v1", {"n": 3})
+        resumed.flush()
+
+        reloaded = _cache(tmp_path)
+        assert reloaded.get("j-1", "v1") == {"n": 1}
+        assert reloaded.get("j-3", "v1") == {"n": 3}
+
+    def test_compacts_superseded_entries(self, tmp_path):
+        """Replay should rewrite a journal dominated by stale entries."""
+        cache = _cache(tmp_path)
+        for version in ("v1", "v2", "v3"):
+            cache.put("j-1", version, {"v": version})
+        cache.flush()
+
+        reloaded = _cache(tmp_path)
+        assert reloaded.get("j-1", "v3") == {"v": "v3"}
+        assert len(reloaded.path.read_bytes().splitlines()) == 1
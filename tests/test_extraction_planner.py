@@ -8,6 +8,7 @@ from sfmc_inv2.orchestration.extraction_planner import (
     ExtractionStep,
     plan_extraction,
     get_extraction_order,
+    clear_plan_cache,
 )
 
 
@@ -62,6 +63,27 @@ class TestExtractionPlanner:
         automation_idx = extractors.index("automations")
         assert query_idx < automation_idx
 
+    def test_topological_sort_breaks_ties_by_name(self):
+        """The smallest ready type should always be taken next."""
+        planner = ExtractionPlanner()
+
+        order = planner._topological_sort({
+            "triggered_send", "send_classification", "sender_profile",
+            "delivery_profile", "list", "classic_email", "folder",
+        })
+
+        # classic_email becomes ready after folder and sorts ahead of
+        # the still-waiting sender_profile
+        assert order == [
+            "delivery_profile",
+            "folder",
+            "classic_email",
+            "list",
+            "sender_profile",
+            "send_classification",
+            "triggered_send",
+        ]
+
     def test_plan_multiple_extractors(self):
         """Should handle multiple requested extractors."""
         planner = ExtractionPlanner(include_dependencies=True)
@@ -103,6 +125,27 @@ class TestConvenienceFunctions:
         assert "automations" in order
         assert "queries" in order
 
+    def test_plan_extraction_returns_independent_copies(self):
+        """Cached plans should not leak caller modifications."""
+        first = plan_extraction(["automations", "queries"])
+        first.steps[0].cache_only = not first.steps[0].cache_only
+        first.steps.clear()
+
+        second = plan_extraction(["queries", "automations", "queries"])
+
+        assert second.all_extractor_names == ExtractionPlanner().get_extraction_order(
+            ["automations", "queries"]
+        )
+        assert second.steps[0].cache_only is True
+
+    def test_clear_plan_cache(self):
+        """Clearing the cache should not change subsequent plans."""
+        before = get_extraction_order(["journeys"])
+
+        clear_plan_cache()
+
+        assert get_extraction_order(["journeys"]) == before
+
 
 class TestDependencyLayers:
     """Test dependency layer functionality for phased execution."""
@@ -163,6 +206,41 @@ class TestDependencyLayers:
         assert len(layers) == 1
         assert set(layers[0]) == types
 
+    def test_get_extractor_layers(self):
+        """Plan steps should be layered by dependency, as extractor names."""
+        planner = ExtractionPlanner(include_dependencies=True)
+        plan = planner.plan(["queries"])
+
+        assert planner.get_extractor_layers(plan) == [
+            ["folders"], ["data_extensions"], ["queries"],
+        ]
+
+    def test_get_extractor_layers_skips_excluded(self):
+        """Excluded dependencies should not appear in any layer."""
+        planner = ExtractionPlanner(include_dependencies=True)
+        plan = planner.plan(["queries"], exclude_cache_only=["data_extension"])
+
+        assert planner.get_extractor_layers(plan) == [["folders"], ["queries"]]
+
+    def test_get_extractor_graph(self):
+        """The graph should count in-plan dependencies and list dependents."""
+        planner = ExtractionPlanner(include_dependencies=True)
+        plan = planner.plan(["queries"], exclude_cache_only=["data_extension"])
+
+        pending, dependents = planner.get_extractor_graph(plan)
+
+        assert pending == {"folders": 0, "queries": 1}
+        assert dependents == {"folders": ["queries"], "queries": []}
+
+    def test_cycles_appended_last_in_name_order(self):
+        """Types stuck in a cycle should come after everything sortable."""
+        planner = ExtractionPlanner()
+        planner._dependencies = {"b": ("a",), "a": ("b",), "c": (), "d": ("c",)}
+        types = {"a", "b", "c", "d"}
+
+        assert planner.get_dependency_layers(types) == [["c"], ["d"], ["a", "b"]]
+        assert planner._topological_sort(types) == ["c", "d", "a", "b"]
+
     def test_get_dependency_layers_single_type(self):
         """Single type should return single layer."""
         planner = ExtractionPlanner(include_dependencies=True)
@@ -4,16 +4,22 @@ Includes integration tests for layer-based execution ordering.
 """
 
 import asyncio
+import threading
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sfmc_inv2.orchestration import extractor_runner
 from sfmc_inv2.orchestration.extractor_runner import (
     ExtractorRunner,
     RunnerConfig,
     RunnerResult,
+    clear_result_cache,
 )
+from sfmc_inv2.core.config import SFMCConfig
 from sfmc_inv2.extractors import ExtractorResult
+from sfmc_inv2.extractors.subscriber_list import ListExtractor
+from sfmc_inv2.extractors.template import TemplateExtractor
 
 
 class TestLayerBasedExecution:
@@ -32,6 +38,9 @@ class TestLayerBasedExecution:
             """Create a mock extractor that logs start/end times."""
 
             class MockExtractor:
+                def __init__(self, rest_client=None, soap_client=None):
+                    pass
+
                 async def extract(self, options):
                     start_time = datetime.now()
                     execution_log.append({
@@ -241,6 +250,398 @@ class TestLayerBasedExecution:
                     f"{dep} should complete before automations starts"
                 )
 
+    @pytest.mark.asyncio
+    async def test_straggler_only_delays_its_dependents(
+        self, execution_log, mock_extractor_factory
+    ):
+        """An extractor should start once its own dependencies finish."""
+        # event_definitions depends only on data_extensions, so it shouldn't
+        # wait for file_transfers even though both follow folders
+        mock_extractors = {
+            "folders": mock_extractor_factory("folders"),
+            "data_extensions": mock_extractor_factory("data_extensions"),
+            "file_transfers": mock_extractor_factory("file_transfers", delay=0.1),
+            "event_definitions": mock_extractor_factory("event_definitions"),
+        }
+
+        with patch(
+            "sfmc_inv2.orchestration.extractor_runner.get_extractor",
+            side_effect=lambda name: mock_extractors.get(name),
+        ):
+            config = RunnerConfig(
+                use_extraction_planner=True,
+                include_dependencies=False,
+                max_concurrent_extractors=10,
+            )
+            runner = ExtractorRunner(config)
+
+            result = await runner.run(list(mock_extractors))
+
+        times = {}
+        for entry in execution_log:
+            times.setdefault(entry["name"], {})[entry["event"]] = entry["time"]
+
+        assert times["data_extensions"]["end"] <= times["event_definitions"]["start"]
+        assert times["event_definitions"]["end"] < times["file_transfers"]["end"]
+        # Results are still collected in plan order
+        assert list(result.results) == runner._current_plan.all_extractor_names
+
+    @pytest.mark.asyncio
+    async def test_dependency_cycle_still_runs(self, execution_log, mock_extractor_factory):
+        """Extractors stuck in a dependency cycle should run rather than hang."""
+        mock_extractors = {
+            "folders": mock_extractor_factory("folders"),
+            "data_extensions": mock_extractor_factory("data_extensions"),
+        }
+
+        with patch(
+            "sfmc_inv2.orchestration.extractor_runner.get_extractor",
+            side_effect=lambda name: mock_extractors.get(name),
+        ):
+            config = RunnerConfig(use_extraction_planner=True, include_dependencies=False)
+            runner = ExtractorRunner(config)
+            runner._planner._dependencies = {
+                "folder": ("data_extension",),
+                "data_extension": ("folder",),
+            }
+
+            result = await asyncio.wait_for(runner.run(list(mock_extractors)), 1)
+
+        assert result.success
+        assert set(result.results) == {"folders", "data_extensions"}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_run_cancels_running_extractors(self):
+        """Cancelling run() should not leave extractors running behind it."""
+        started = asyncio.Event()
+        cancelled = []
+
+        class SlowExtractor:
+            def __init__(self, rest_client=None, soap_client=None):
+                pass
+
+            async def extract(self, options):
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append("folders")
+                    raise
+
+        with patch(
+            "sfmc_inv2.orchestration.extractor_runner.get_extractor",
+            side_effect=lambda name: SlowExtractor,
+        ):
+            config = RunnerConfig(use_extraction_planner=True, include_dependencies=False)
+            run = asyncio.ensure_future(ExtractorRunner(config).run(["folders"]))
+            await asyncio.wait_for(started.wait(), 1)
+
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+
+        assert cancelled == ["folders"]
+
+    @pytest.mark.asyncio
+    async def test_soap_extractors_in_layer_page_concurrently(self):
+        """Blocking SOAP paging of same-layer extractors should overlap."""
+        # Each extractor's first page waits until the other is also paging,
+        # which can only happen if neither blocks the event loop.
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierSOAPClient:
+            def iter_retrieve_pages(self, object_type, properties, **kwargs):
+                barrier.wait()
+                yield {"ok": True, "objects": [{"ID": 1, "ObjectID": object_type}]}
+
+        class NoCacheManager:
+            def warm(self, cache_types):
+                pass
+
+            def get_breadcrumb(self, folder_id, cache_type):
+                return None
+
+        def soap_extractor(cls):
+            return lambda **clients: cls(
+                rest_client=object(),
+                soap_client=BarrierSOAPClient(),
+                cache_manager=NoCacheManager(),
+            )
+
+        mock_extractors = {
+            "lists": soap_extractor(ListExtractor),
+            "templates": soap_extractor(TemplateExtractor),
+        }
+
+        with patch(
+            "sfmc_inv2.orchestration.extractor_runner.get_extractor",
+            side_effect=lambda name: mock_extractors.get(name),
+        ):
+            config = RunnerConfig(
+                use_extraction_planner=True,
+                include_dependencies=False,
+                max_concurrent_extractors=10,
+            )
+            runner = ExtractorRunner(config)
+
+            result = await runner.run(["lists", "templates"])
+
+        assert result.success
+        assert result.results["lists"].item_count == 1
+        assert result.results["templates"].item_count == 1
+
+
+class TestBUClientReuse:
+    """Tests for sharing API clients per Business Unit."""
+
+    @pytest.mark.asyncio
+    async def test_clients_created_once_per_bu(self):
+        """Extractors on the same BU should share one set of clients."""
+        seen = []
+
+        def multi_bu_extractor(name):
+            class MultiBUExtractor:
+                supports_multi_bu = True
+
+                def __init__(self, rest_client=None, soap_client=None):
+                    seen.append((name, rest_client, soap_client))
+
+                async def extract(self, options):
+                    return ExtractorResult(extractor_name=name, success=True)
+
+            return MultiBUExtractor
+
+        mock_extractors = {
+            "triggered_sends": multi_bu_extractor("triggered_sends"),
+            "journeys": multi_bu_extractor("journeys"),
+        }
+        module = "sfmc_inv2.orchestration.extractor_runner"
+
+        with patch(f"{module}.get_extractor", side_effect=mock_extractors.get), \
+                patch(f"{module}.get_config_with_account", side_effect=lambda mid: mid), \
+                patch(f"{module}.TokenManager") as token_manager, \
+                patch(f"{module}.RESTClient", side_effect=lambda *a, **kw: AsyncMock()), \
+                patch(f"{module}.SOAPClient", side_effect=lambda *a, **kw: AsyncMock()):
+            config = RunnerConfig(child_bu_ids=["100", "200"])
+            runner = ExtractorRunner(config)
+
+            result = await runner.run(["triggered_sends", "journeys"])
+
+        assert result.success
+        assert token_manager.call_count == 2
+        assert [call.args[0] for call in token_manager.call_args_list] == ["100", "200"]
+        # Four extractor runs (2 extractors x 2 BUs) over two SOAP clients
+        assert len(seen) == 4
+        assert len({id(soap_client) for _, _, soap_client in seen}) == 2
+
+        # Pooled connections are released when the run finishes
+        for rest_client, soap_client in runner._bu_clients.values():
+            rest_client.aclose.assert_awaited_once()
+            soap_client.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_default_bu_clients_share_runner_limiter(self):
+        """Default-BU extractors should get clients gated by the runner's limiter."""
+        seen = []
+
+        class DefaultBUExtractor:
+            def __init__(self, rest_client=None, soap_client=None):
+                seen.append((rest_client, soap_client))
+
+            async def extract(self, options):
+                return ExtractorResult(extractor_name="folders", success=True)
+
+        with patch(
+            "sfmc_inv2.orchestration.extractor_runner.get_extractor",
+            side_effect=lambda name: DefaultBUExtractor,
+        ):
+            runner = ExtractorRunner()
+            await runner.run(["folders", "queries"])
+            await runner.run_sequential(["folders"])
+
+        assert len(seen) == 3
+        assert len({id(rest_client) for rest_client, _ in seen}) == 1
+        rest_client, soap_client = seen[0]
+        assert rest_client._limiter is runner._limiter
+        assert soap_client._limiter is runner._limiter
+
+
+class TestMultiBUExtraction:
+    """Tests for fanning a multi-BU extractor out across child BUs."""
+
+    @pytest.mark.asyncio
+    async def test_bus_run_concurrently_and_merge_in_order(self):
+        """BUs should overlap up to the limit, merge in BU order, and keep errors."""
+        in_flight = 0
+        peak = 0
+
+        async def run_for_bu(name, account_id, options):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later BUs finish first
+            await asyncio.sleep(0.01 * (4 - int(account_id)))
+            in_flight -= 1
+            if account_id == "3":
+                raise RuntimeError("login failed")
+            result = ExtractorResult(extractor_name=name, success=True)
+            result.items.append({"id": account_id, "_sourceBuMid": account_id})
+            return result
+
+        runner = ExtractorRunner(
+            RunnerConfig(child_bu_ids=["1", "2", "3", "4"], max_concurrent_bus=2)
+        )
+
+        with patch.object(runner, "_run_extractor_for_bu", side_effect=run_for_bu):
+            merged = await runner._run_multi_bu_extractor("journeys", MagicMock())
+
+        assert peak == 2
+        assert [item["id"] for item in merged.items] == ["1", "2", "4"]
+        assert merged.item_count == 3
+        assert merged.metadata["bu_count"] == 3
+        assert not merged.success
+        assert len(merged.errors) == 1
+        assert merged.errors[0].error_type == "BUError"
+        assert merged.errors[0].details == {"bu_mid": "3"}
+
+    def test_bu_limit_not_reused_across_event_loops(self):
+        """A later event loop shouldn't inherit the BU semaphore of run()."""
+        class MultiBUExtractor:
+            supports_multi_bu = True
+
+        async def run_for_bu(name, account_id, options):
+            await asyncio.sleep(0.01)
+            return ExtractorResult(extractor_name=name, success=True)
+
+        runner = ExtractorRunner(
+            RunnerConfig(child_bu_ids=["1", "2", "3"], max_concurrent_bus=1)
+        )
+
+        with patch.object(runner, "_run_extractor_for_bu", side_effect=run_for_bu), \
+                patch(
+                    "sfmc_inv2.orchestration.extractor_runner.get_extractor",
+                    side_effect=lambda name: MultiBUExtractor,
+                ):
+            asyncio.run(runner.run(["journeys"]))
+            merged = asyncio.run(runner._run_multi_bu_extractor("journeys", MagicMock()))
+
+        assert merged.success
+        assert merged.metadata["bu_count"] == 3
+
+
+class TestResultCache:
+    """Tests for reusing extraction results across runs."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start and finish each test with an empty result cache."""
+        clear_result_cache()
+        yield
+        clear_result_cache()
+
+    @pytest.fixture
+    def calls(self):
+        """Names of extractors that actually ran."""
+        return []
+
+    @pytest.fixture
+    def get_extractor(self, calls):
+        """Patch the registry with extractors recording each real run."""
+        outcomes = {"folders": True, "queries": False}
+
+        def make(name):
+            class RecordingExtractor:
+                def __init__(self, rest_client=None, soap_client=None):
+                    pass
+
+                async def extract(self, options):
+                    calls.append(name)
+                    result = ExtractorResult(extractor_name=name, success=outcomes[name])
+                    result.items.append({"id": 1})
+                    return result
+
+            return RecordingExtractor
+
+        with patch(
+            "sfmc_inv2.orchestration.extractor_runner.get_extractor", side_effect=make
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_repeat_run_reuses_result(self, calls, get_extractor):
+        """A second runner within the TTL should reuse a copy of the result."""
+        config = RunnerConfig(cache_ttl_seconds=60)
+
+        first = await ExtractorRunner(config).run(["folders"])
+        first.results["folders"].items.append({"id": 2})
+        second = await ExtractorRunner(config).run(["folders"])
+
+        assert calls == ["folders"]
+        assert second.results["folders"].items == [{"id": 1}]
+        assert second.results["folders"].metadata["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_expired_result_is_refetched(self, calls, get_extractor):
+        """Results older than the TTL should not be reused."""
+        runner = ExtractorRunner(RunnerConfig(cache_ttl_seconds=60))
+        await runner.run(["folders"])
+
+        for key, (stored_at, result) in extractor_runner._result_cache.items():
+            extractor_runner._result_cache[key] = (stored_at - 61, result)
+        await runner.run(["folders"])
+
+        assert calls == ["folders", "folders"]
+
+    @pytest.mark.asyncio
+    async def test_options_and_failures_not_reused(self, calls, get_extractor):
+        """Different options miss the cache, and failed results aren't stored."""
+        runner = ExtractorRunner(RunnerConfig(cache_ttl_seconds=60))
+
+        await runner.run(["folders", "queries"])
+        await runner.run(["folders", "queries"], {"folders": {"page_size": 50}})
+
+        assert sorted(calls) == ["folders", "folders", "queries", "queries"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, calls, get_extractor):
+        """With no TTL configured every run should extract."""
+        runner = ExtractorRunner()
+
+        await runner.run_sequential(["folders"])
+        await runner.run_sequential(["folders"])
+
+        assert calls == ["folders", "folders"]
+        assert not extractor_runner._result_cache
+
+    @pytest.mark.asyncio
+    async def test_cached_items_are_not_shared(self, calls, get_extractor):
+        """Mutating a returned item shouldn't change later cache hits."""
+        config = RunnerConfig(cache_ttl_seconds=60)
+
+        first = await ExtractorRunner(config).run(["folders"])
+        first.results["folders"].items[0]["id"] = 99
+        second = await ExtractorRunner(config).run(["folders"])
+        second.results["folders"].items[0]["_sourceBuMid"] = "123"
+        third = await ExtractorRunner(config).run(["folders"])
+
+        assert calls == ["folders"]
+        assert third.results["folders"].items == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_default_bu_keyed_by_configured_account(self, calls, get_extractor):
+        """Default-BU runs against different accounts shouldn't share results."""
+        config = RunnerConfig(cache_ttl_seconds=60)
+
+        for account_id in ("111", "222", "111"):
+            base = SFMCConfig("test", "id", "secret", account_id=account_id)
+            with patch(
+                "sfmc_inv2.orchestration.extractor_runner.get_config",
+                return_value=base,
+            ):
+                await ExtractorRunner(config).run(["folders"])
+
+        assert calls == ["folders", "folders"]
+
 
 class TestRunnerResult:
     """Test RunnerResult statistics and properties."""
@@ -0,0 +1,509 @@
+"""Tests for the Journey extractor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from sfmc_inv2.extractors.base_extractor import ExtractorOptions, ExtractorResult
+from sfmc_inv2.extractors.journey import JourneyActivityRow, JourneyExtractor
+from sfmc_inv2.output.snapshot_writer import ndjson_dumps
+from sfmc_inv2.types.relationships import RelationshipType
+
+
+@pytest.fixture
+def extractor():
+    """Create a JourneyExtractor instance without API clients."""
+    return JourneyExtractor.__new__(JourneyExtractor)
+
+
+class FakeRESTClient:
+    """REST client stub serving journey list pages and details."""
+
+    def __init__(self, journeys, details=None, report_count=False, fail_pages=()):
+        self.journeys = journeys
+        self.details = details or {}
+        self.report_count = report_count
+        self.fail_pages = set(fail_pages)
+        self.paths = []
+
+    def get(self, path, **kwargs):
+        self.paths.append(path)
+        if "?" in path:
+            query = dict(part.split("=") for part in path.split("?", 1)[1].split("&"))
+            page, size = int(query["$page"]), int(query["$pageSize"])
+            if page in self.fail_pages:
+                return {"ok": False, "status_code": 500, "error": "server error"}
+            data = {"items": self.journeys[(page - 1) * size:page * size]}
+            if self.report_count:
+                data["count"] = len(self.journeys)
+            return {"ok": True, "status_code": 200, "data": data}
+        journey_id = path.rsplit("/", 1)[1]
+        if journey_id in self.details:
+            return {"ok": True, "status_code": 200, "data": self.details[journey_id]}
+        return {"ok": False, "status_code": 404, "error": "not found"}
+
+    async def get_async(self, path, **kwargs):
+        return self.get(path, **kwargs)
+
+
+class FakeCacheManager:
+    """Cache manager stub with no-op warming."""
+
+    def warm(self, cache_types):
+        pass
+
+
+def _make_extractor(rest):
+    """Create a JourneyExtractor wired to stub clients."""
+    return JourneyExtractor(
+        rest_client=rest,
+        soap_client=object(),
+        cache_manager=FakeCacheManager(),
+    )
+
+
+def _journey(**overrides):
+    """Build a minimal enriched journey item."""
+    item = {
+        "id": "j-1",
+        "name": "Welcome Journey",
+        "triggers": [],
+        "activities": [],
+        "goals": [],
+    }
+    item.update(overrides)
+    return item
+
+
+class TestTransformData:
+    """Tests for JourneyExtractor.transform_data()."""
+
+    def test_nested_rows_serialize_as_objects(self, extractor):
+        """Nested trigger/activity/goal rows should serialize like dicts."""
+        items = [_journey(
+            triggers=[{"name": "Entry", "metaData": {"eventDefinitionKey": "EVK"}}],
+            activities=[{"id": "a-1", "type": "WAIT", "outcomes": [{}, {}]}],
+            goals=[{"name": "Goal", "target": 10}],
+        )]
+
+        output = extractor.transform_data(items, ExtractorOptions())[0]
+
+        assert output["activities"] == [JourneyActivityRow(
+            id="a-1", key=None, name=None, type="WAIT",
+            configurationUrl=None, outcomeCount=2,
+        )]
+        assert b'"eventDefinitionKey":"EVK"' in ndjson_dumps(output)
+        assert b'"goals":[{"name":"Goal","description":null,' in ndjson_dumps(output)
+
+    @pytest.mark.asyncio
+    async def test_fused_pass_matches_separate_passes(self, extractor):
+        """transform_and_extract should match transform_data + extract_relationships."""
+        options = ExtractorOptions()
+        items = [
+            _journey(id="j-1", activities=[
+                {"type": "FIREAUTOMATION", "configurationArguments": {"automationId": "a-1"}},
+            ]),
+            _journey(id="j-2"),
+        ]
+
+        separate = ExtractorResult(extractor_name="journeys")
+        expected_rows = extractor.transform_data(items, options)
+        await extractor.extract_relationships(items, separate)
+
+        fused = ExtractorResult(extractor_name="journeys")
+        rows = await extractor.transform_and_extract(items, options, fused)
+
+        assert rows == expected_rows
+        assert [e.target_id for e in fused.relationships] == ["a-1"]
+        assert len(fused.relationships) == len(separate.relationships)
+
+    @pytest.mark.asyncio
+    async def test_relationship_types_filter(self, extractor):
+        """Only requested relationship types should be emitted."""
+        items = [_journey(activities=[
+            {"type": "FIREAUTOMATION", "configurationArguments": {"automationId": "a-1"}},
+            {"type": "UPDATECONTACTDATA", "configurationArguments": {"deKey": "Profile"}},
+        ])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.transform_and_extract(
+            items,
+            ExtractorOptions(relationship_types={RelationshipType.JOURNEY_USES_DE}),
+            result,
+        )
+
+        assert [e.target_id for e in result.relationships] == ["Profile"]
+
+    @pytest.mark.asyncio
+    async def test_empty_relationship_types_skips_relationships(self, extractor):
+        """An empty relationship type set should still transform every item."""
+        items = [_journey(activities=[
+            {"type": "FIREAUTOMATION", "configurationArguments": {"automationId": "a-1"}},
+        ])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        rows = await extractor.transform_and_extract(
+            items, ExtractorOptions(relationship_types=set()), result
+        )
+
+        assert len(rows) == 1
+        assert result.relationships == []
+
+
+class TestExtractRelationships:
+    """Tests for JourneyExtractor.extract_relationships()."""
+
+    @pytest.mark.asyncio
+    async def test_entry_event_relationships(self, extractor):
+        """Trigger should produce event definition and entry DE edges."""
+        items = [_journey(triggers=[{
+            "name": "Entry",
+            "metaData": {"eventDefinitionId": "ev-1", "eventDefinitionKey": "EVK"},
+            "configurationArguments": {"eventDataConfig": {"deKey": "Entry_DE"}},
+        }])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert len(result.relationships) == 2
+        event_edge, de_edge = result.relationships
+        assert event_edge.relationship_type == RelationshipType.JOURNEY_USES_EVENT
+        assert event_edge.target_id == "ev-1"
+        assert event_edge.metadata == {"eventDefinitionKey": "EVK"}
+        assert de_edge.relationship_type == RelationshipType.JOURNEY_USES_DE
+        assert de_edge.target_id == "Entry_DE"
+        assert de_edge.metadata == {"usage": "entry_event"}
+
+    @pytest.mark.asyncio
+    async def test_email_activity_relationships(self, extractor):
+        """Email activity should produce email, asset, and list edges."""
+        items = [_journey(activities=[{
+            "type": "EMAILV2",
+            "configurationArguments": {"triggeredSend": {
+                "emailId": 101,
+                "assetId": 202,
+                "publicationListId": 303,
+                "suppressionLists": [{"id": 404}],
+            }},
+        }])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        by_type = {(e.relationship_type, e.target_id) for e in result.relationships}
+        assert (RelationshipType.JOURNEY_USES_EMAIL, "101") in by_type
+        assert (RelationshipType.JOURNEY_USES_ASSET, "202") in by_type
+        assert (RelationshipType.JOURNEY_USES_LIST, "303") in by_type
+        assert (RelationshipType.JOURNEY_USES_LIST, "404") in by_type
+        assert all(e.source_id == "j-1" for e in result.relationships)
+        assert all(e.source_type == "journey" for e in result.relationships)
+
+    @pytest.mark.asyncio
+    async def test_unlisted_types_match_by_substring(self, extractor):
+        """Activity types outside the dispatch table fall back to substring matching."""
+        items = [_journey(activities=[
+            {"type": "EmailActivity", "configurationArguments": {"triggeredSend": {"emailId": 1}}},
+            {"type": "MobilePushNotification", "configurationArguments": {"assetId": 2}},
+            {"type": "FilterSplit", "configurationArguments": {"filterId": 3}},
+        ])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert {(e.relationship_type, e.target_id) for e in result.relationships} >= {
+            (RelationshipType.JOURNEY_USES_EMAIL, "1"),
+            (RelationshipType.JOURNEY_USES_PUSH, "2"),
+            (RelationshipType.JOURNEY_USES_FILTER, "3"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_repeated_targets(self, extractor):
+        """Repeated references to the same target should emit one edge."""
+        update = {"type": "UPDATECONTACTDATA", "configurationArguments": {"deKey": "Profile"}}
+        items = [_journey(activities=[update, dict(update), dict(update)])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert len(result.relationships) == 1
+        assert result.relationships[0].metadata == {"usage": "update_contact"}
+
+    @pytest.mark.asyncio
+    async def test_distinct_usages_are_kept(self, extractor):
+        """Same DE used for different purposes should keep both edges."""
+        items = [_journey(
+            triggers=[{"configurationArguments": {"eventDataConfig": {"deKey": "Profile"}}}],
+            activities=[{"type": "UPDATECONTACTDATA", "configurationArguments": {"deKey": "Profile"}}],
+        )]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        usages = sorted(e.metadata["usage"] for e in result.relationships)
+        assert usages == ["entry_event", "update_contact"]
+
+    @pytest.mark.asyncio
+    async def test_dedup_is_per_journey(self, extractor):
+        """Two journeys referencing the same DE should each get an edge."""
+        update = {"type": "UPDATECONTACTDATA", "configurationArguments": {"deKey": "Profile"}}
+        items = [
+            _journey(id="j-1", activities=[update]),
+            _journey(id="j-2", activities=[dict(update)]),
+        ]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert [e.source_id for e in result.relationships] == ["j-1", "j-2"]
+
+    @pytest.mark.asyncio
+    async def test_tolerates_null_nested_objects(self, extractor):
+        """Null configurationArguments/metaData should not raise."""
+        items = [_journey(
+            triggers=[{"metaData": None, "configurationArguments": None}],
+            activities=[
+                {"type": "EMAILV2", "configurationArguments": {"triggeredSend": None}},
+                {"type": "UPDATECONTACTDATA", "configurationArguments": None, "metaData": None},
+            ],
+        )]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert result.relationships == []
+
+    @pytest.mark.asyncio
+    async def test_skips_journey_without_triggers_or_activities(self, extractor):
+        """Journeys with no (or null) triggers and activities emit nothing."""
+        items = [
+            {"id": "j-1", "name": "List only"},
+            _journey(id="j-2", triggers=None, activities=None),
+        ]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert result.relationships == []
+
+    @pytest.mark.asyncio
+    async def test_skips_journey_without_id(self, extractor):
+        """Journeys without an ID should not produce edges."""
+        items = [_journey(id=None, activities=[
+            {"type": "FIREAUTOMATION", "configurationArguments": {"automationId": "a-1"}},
+        ])]
+
+        result = ExtractorResult(extractor_name="journeys")
+        await extractor.extract_relationships(items, result)
+
+        assert result.relationships == []
+
+
+class TestExtractPipeline:
+    """Tests for the paged journey extraction pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_streams_all_pages(self):
+        """All pages should be fetched, transformed, and counted."""
+        journeys = [{"id": f"j-{i}", "name": f"J{i}", "status": "Draft"} for i in range(5)]
+        rest = FakeRESTClient(journeys)
+        extractor = _make_extractor(rest)
+
+        result = await extractor.extract(
+            ExtractorOptions(page_size=2, include_details=False)
+        )
+
+        assert result.success
+        assert [item["id"] for item in result.items] == [j["id"] for j in journeys]
+        assert result.item_count == 5
+        assert result.pages_fetched == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_pages_keep_order(self):
+        """Pages fetched concurrently should still be yielded in order."""
+        journeys = [{"id": f"j-{i}"} for i in range(9)]
+        extractor = _make_extractor(FakeRESTClient(journeys))
+
+        pages = [
+            [item["id"] for item in page]
+            async for page in extractor.iter_batches(
+                ExtractorOptions(page_size=2, max_concurrent=3)
+            )
+        ]
+
+        assert pages == [["j-0", "j-1"], ["j-2", "j-3"], ["j-4", "j-5"],
+                         ["j-6", "j-7"], ["j-8"]]
+
+    @pytest.mark.asyncio
+    async def test_reported_count_bounds_page_requests(self):
+        """A total count on page 1 should avoid requesting past the end."""
+        journeys = [{"id": f"j-{i}"} for i in range(4)]
+        rest = FakeRESTClient(journeys, report_count=True)
+        extractor = _make_extractor(rest)
+
+        items = await extractor.fetch_data(ExtractorOptions(page_size=2, max_concurrent=8))
+
+        assert len(items) == 4
+        assert len(rest.paths) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_page_stops_pagination(self):
+        """A failed page should end pagination after the pages before it."""
+        journeys = [{"id": f"j-{i}"} for i in range(8)]
+        extractor = _make_extractor(FakeRESTClient(journeys, fail_pages={3}))
+
+        items = await extractor.fetch_data(ExtractorOptions(page_size=2))
+
+        assert [item["id"] for item in items] == ["j-0", "j-1", "j-2", "j-3"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_collects_pages(self):
+        """fetch_data should still return every journey as one list."""
+        journeys = [{"id": f"j-{i}"} for i in range(3)]
+        extractor = _make_extractor(FakeRESTClient(journeys))
+
+        items = await extractor.fetch_data(ExtractorOptions(page_size=2))
+
+        assert [item["id"] for item in items] == ["j-0", "j-1", "j-2"]
+
+    @pytest.mark.asyncio
+    async def test_detail_relationships_per_page(self):
+        """Relationships from detail fetches should be collected across pages."""
+        journeys = [{"id": "j-0"}, {"id": "j-1"}, {"id": "j-2"}]
+        details = {
+            jid: {"activities": [{
+                "type": "FIREAUTOMATION",
+                "configurationArguments": {"automationId": f"auto-{jid}"},
+            }]}
+            for jid in ("j-0", "j-2")
+        }
+        extractor = _make_extractor(FakeRESTClient(journeys, details))
+
+        result = await extractor.extract(ExtractorOptions(page_size=2))
+
+        assert [e.target_id for e in result.relationships] == ["auto-j-0", "auto-j-2"]
+        assert [item["activityCount"] for item in result.items] == [1, 0, 1]
+
+    @pytest.mark.asyncio
+    async def test_detail_requests_run_concurrently(self):
+        """Detail requests within a page should overlap, bounded by max_concurrent."""
+        in_flight = 0
+        peak = 0
+
+        class SlowRESTClient(FakeRESTClient):
+            async def get_async(self, path, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return self.get(path, **kwargs)
+
+        journeys = [{"id": f"j-{i}"} for i in range(6)]
+        details = {j["id"]: {"goals": [{"name": j["id"]}]} for j in journeys}
+        extractor = _make_extractor(SlowRESTClient(journeys, details))
+
+        result = await extractor.extract(ExtractorOptions(max_concurrent=3))
+
+        assert 1 < peak <= 3
+        assert [item["goals"][0].name for item in result.items] == [j["id"] for j in journeys]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_journeys_share_one_detail_request(self):
+        """A journey repeated across pages should be requested once per version."""
+        journeys = [
+            {"id": "j-0", "modifiedDate": "d1"},
+            {"id": "j-1", "modifiedDate": "d1"},
+            {"id": "j-1", "modifiedDate": "d1"},
+        ]
+        rest = FakeRESTClient(journeys, {"j-0": {}, "j-1": {"goals": [{"name": "g"}]}})
+        extractor = _make_extractor(rest)
+
+        result = await extractor.extract(ExtractorOptions(page_size=2))
+
+        assert [path for path in rest.paths if "?" not in path].count(
+            "/interaction/v1/interactions/j-1"
+        ) == 1
+        assert [item["goalCount"] for item in result.items] == [0, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_detail_memo_is_per_run(self):
+        """A reused extractor should refetch details and not keep them afterwards."""
+        journeys = [{"id": "j-0"}]
+        rest = FakeRESTClient(journeys, {"j-0": {}})
+        extractor = _make_extractor(rest)
+
+        await extractor.extract(ExtractorOptions())
+        await extractor.extract(ExtractorOptions())
+
+        assert rest.paths.count("/interaction/v1/interactions/j-0") == 2
+        assert not extractor._detail_memo
+        assert not extractor._detail_locks
+
+    @pytest.mark.asyncio
+    async def test_enrichment_failure_keeps_item(self):
+        """A journey whose enrichment raises should be kept unenriched."""
+        class FailingRESTClient(FakeRESTClient):
+            def get(self, path, **kwargs):
+                if path.endswith("/j-1"):
+                    raise RuntimeError("boom")
+                return super().get(path, **kwargs)
+
+        journeys = [{"id": "j-0"}, {"id": "j-1"}]
+        extractor = _make_extractor(FailingRESTClient(journeys, {"j-0": {}}))
+
+        result = await extractor.extract(ExtractorOptions())
+
+        assert [item["id"] for item in result.items] == ["j-0", "j-1"]
+        assert result.errors[0].error_type == "EnrichmentError"
+
+    @pytest.mark.asyncio
+    async def test_page_requests_use_extractor_pool(self):
+        """Blocking page requests should run on the extractor's own thread pool."""
+        threads = []
+
+        class RecordingRESTClient(FakeRESTClient):
+            def get(self, path, **kwargs):
+                threads.append(threading.current_thread().name)
+                return super().get(path, **kwargs)
+
+        rest = RecordingRESTClient([{"id": "j-0"}])
+        extractor = _make_extractor(rest)
+
+        await extractor.extract(ExtractorOptions(http_workers=2, include_details=False))
+
+        assert threads and all(name.startswith("journeys-fetch") for name in threads)
+        assert extractor._executor is None
+
+
+class TestDetailCache:
+    """Tests for reusing journey details across runs."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_journey_skips_detail_request(self, tmp_path):
+        """A second run with the same modifiedDate should not refetch details."""
+        journeys = [{"id": "j-0", "modifiedDate": "2024-01-01T00:00:00"}]
+        details = {"j-0": {"activities": [{"type": "WAIT"}]}}
+        options = ExtractorOptions(detail_cache_dir=tmp_path)
+
+        await _make_extractor(FakeRESTClient(journeys, details)).extract(options)
+        rest = FakeRESTClient(journeys, {})
+        result = await _make_extractor(rest).extract(options)
+
+        assert not any(path.endswith("/j-0") for path in rest.paths)
+        assert result.items[0]["activityCount"] == 1
+
+    @pytest.mark.asyncio
+    async def test_modified_journey_refetches_detail(self, tmp_path):
+        """A changed modifiedDate should miss the cache and refetch."""
+        details = {"j-0": {"activities": [{"type": "WAIT"}]}}
+        options = ExtractorOptions(detail_cache_dir=tmp_path)
+
+        await _make_extractor(FakeRESTClient(
+            [{"id": "j-0", "modifiedDate": "2024-01-01T00:00:00"}], details
+        )).extract(options)
+        rest = FakeRESTClient([{"id": "j-0", "modifiedDate": "2024-02-01T00:00:00"}], {})
+        result = await _make_extractor(rest).extract(options)
+
+        assert any(path.endswith("/j-0") for path in rest.paths)
+        assert result.items[0]["activityCount"] == 0
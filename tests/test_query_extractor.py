@@ -0,0 +1,223 @@
+"""Tests for the Query Activity extractor."""
+
+import pytest
+
+from sfmc_inv2.extractors.base_extractor import ExtractorOptions, ExtractorResult
+from sfmc_inv2.extractors.query import QueryExtractor
+from sfmc_inv2.types.relationships import RelationshipType
+
+
+class FakeRESTClient:
+    """Minimal REST client serving canned query pages."""
+
+    def __init__(self, pages, count=None, fail_pages=()):
+        self.pages = pages
+        self.count = count
+        self.fail_pages = set(fail_pages)
+        self.requested = []
+
+    def get(self, url):
+        page = int(url.rsplit("$page=", 1)[1])
+        self.requested.append(page)
+        if page in self.fail_pages:
+            return {"ok": False, "error": "boom"}
+        if page > len(self.pages):
+            return {"ok": True, "data": {"items": []}}
+        data = self.pages[page - 1]
+        if data is not None and self.count is not None:
+            data = {**data, "count": self.count}
+        return {"ok": True, "data": data}
+
+
+@pytest.fixture
+def extractor():
+    """Create a QueryExtractor instance without API clients."""
+    return QueryExtractor.__new__(QueryExtractor)
+
+
+class TestExtractDEReferences:
+    """Tests for QueryExtractor._extract_de_references()."""
+
+    def test_from_and_join_types(self, extractor):
+        """FROM and every JOIN flavour should yield a reference."""
+        sql = """
+            SELECT * FROM Master a
+            LEFT JOIN Lefty b ON 1=1
+            right join Righty c ON 1=1
+            INNER JOIN Inner_DE d ON 1=1
+            FULL OUTER JOIN Full_DE e ON 1=1
+            CROSS JOIN Cross_DE f
+            JOIN Plain_DE g ON 1=1
+        """
+
+        names = [ref["name"] for ref in extractor._extract_de_references(sql)]
+
+        assert names == sorted([
+            "Master", "Lefty", "Righty", "Inner_DE", "Full_DE", "Cross_DE", "Plain_DE",
+        ])
+
+    def test_shared_schema_and_brackets(self, extractor):
+        """ENT./_ENT. prefixes mark shared DEs; brackets are stripped."""
+        sql = "SELECT 1 FROM ENT.Shared_DE a JOIN [Local DE] b ON 1=1 JOIN _ENT.[Other] c ON 1=1"
+
+        refs = extractor._extract_de_references(sql)
+
+        assert {"name": "Shared_DE", "isShared": True} in refs
+        assert {"name": "Other", "isShared": True} in refs
+        assert {"name": "Local", "isShared": False} in refs
+
+    def test_shared_wins_when_seen_both_ways(self, extractor):
+        """A DE referenced both locally and via ENT. should be marked shared."""
+        sql = "SELECT 1 FROM Profile a JOIN ENT.Profile b ON 1=1"
+
+        assert extractor._extract_de_references(sql) == [
+            {"name": "Profile", "isShared": True},
+        ]
+
+    def test_shared_kept_when_local_reference_follows(self, extractor):
+        """A later local reference should not clear an earlier shared one."""
+        sql = "SELECT 1 FROM ENT.Profile a JOIN Profile b ON 1=1 JOIN Profile c ON 1=1"
+
+        assert extractor._extract_de_references(sql) == [
+            {"name": "Profile", "isShared": True},
+        ]
+
+    def test_skips_system_tables(self, extractor):
+        """System data views and tables should be ignored."""
+        sql = "SELECT 1 FROM _Sent s JOIN Subscribers x ON 1=1 JOIN sysobjects o ON 1=1 JOIN Real_DE r ON 1=1"
+
+        assert extractor._extract_de_references(sql) == [
+            {"name": "Real_DE", "isShared": False},
+        ]
+
+    def test_ignores_keywords_inside_words(self, extractor):
+        """FROM/JOIN embedded in identifiers should not match."""
+        sql = "SELECT DateFROMx, rejoin_flag FROM Events"
+
+        assert extractor._extract_de_references(sql) == [
+            {"name": "Events", "isShared": False},
+        ]
+
+    def test_repeated_sql_returns_independent_results(self, extractor):
+        """Cached scans should hand each caller its own reference dicts."""
+        sql = "SELECT 1 FROM Cached_DE"
+
+        first = extractor._extract_de_references(sql)
+        first[0]["isShared"] = True
+
+        assert extractor._extract_de_references(sql) == [
+            {"name": "Cached_DE", "isShared": False},
+        ]
+
+
+class TestFetchData:
+    """Tests for QueryExtractor.fetch_data()."""
+
+    @pytest.mark.asyncio
+    async def test_paginates_until_short_page(self, extractor):
+        """Full pages continue pagination; a short page ends it."""
+        extractor._rest = FakeRESTClient([
+            {"items": [{"name": "a"}, {"name": "b"}]},
+            {"items": [{"name": "c"}]},
+        ])
+
+        queries = await extractor.fetch_data(ExtractorOptions(page_size=2))
+
+        assert [q["name"] for q in queries] == ["a", "b", "c"]
+        assert extractor._pages_fetched == 2
+
+    @pytest.mark.asyncio
+    async def test_reported_count_bounds_requests(self, extractor):
+        """No page past the API's reported total should be requested."""
+        pages = [{"items": [{"name": f"q{i}"}, {"name": f"q{i}b"}]} for i in range(3)]
+        extractor._rest = FakeRESTClient(pages, count=6)
+
+        queries = await extractor.fetch_data(ExtractorOptions(page_size=2, max_concurrent=5))
+
+        assert len(queries) == 6
+        assert sorted(extractor._rest.requested) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_failed_page_stops_in_order(self, extractor):
+        """Pages after a failed one are dropped even if they were fetched."""
+        pages = [{"items": [{"name": f"q{i}"}]} for i in range(4)]
+        extractor._rest = FakeRESTClient(pages, fail_pages={3})
+
+        queries = await extractor.fetch_data(ExtractorOptions(page_size=1, max_concurrent=3))
+
+        assert [q["name"] for q in queries] == ["q0", "q1"]
+        assert extractor._pages_fetched == 2
+
+    @pytest.mark.asyncio
+    async def test_null_data_stops_pagination(self, extractor):
+        """A response with null data should end pagination cleanly."""
+        extractor._rest = FakeRESTClient([None])
+
+        assert await extractor.fetch_data(ExtractorOptions()) == []
+
+
+class TestTransformData:
+    """Tests for QueryExtractor.transform_data()."""
+
+    def test_maps_fields_and_reference_names(self, extractor):
+        """Output should rename API fields and list referenced DE names."""
+        refs = [{"name": "Master", "isShared": False}, {"name": "Profile", "isShared": True}]
+        items = [{
+            "queryDefinitionId": "q1",
+            "name": "Daily Load",
+            "key": "daily-load",
+            "targetName": "Target_DE",
+            "referencedDataExtensions": refs,
+        }]
+
+        output = extractor.transform_data(items, ExtractorOptions())[0]
+
+        assert output["id"] == "q1"
+        assert output["customerKey"] == "daily-load"
+        assert output["targetName"] == "Target_DE"
+        assert output["referencedDataExtensions"] == refs
+        assert output["referencedDataExtensionNames"] == ["Master", "Profile"]
+
+    def test_missing_references(self, extractor):
+        """Queries without SQL analysis should get empty reference lists."""
+        output = extractor.transform_data([{"queryDefinitionId": "q2"}], ExtractorOptions())[0]
+
+        assert output["referencedDataExtensions"] == []
+        assert output["referencedDataExtensionNames"] == []
+
+
+class TestExtractRelationships:
+    """Tests for QueryExtractor.extract_relationships()."""
+
+    @pytest.mark.asyncio
+    async def test_write_and_read_edges(self, extractor):
+        """Each query should link to its target DE and every DE it reads."""
+        items = [
+            {
+                "queryDefinitionId": "q1",
+                "name": "Daily Load",
+                "targetId": 42,
+                "targetName": "Target_DE",
+                "referencedDataExtensions": [
+                    {"name": "Master", "isShared": False},
+                    {"name": "Profile", "isShared": True},
+                ],
+            },
+            {"name": "No ID", "targetId": 7},
+        ]
+        result = ExtractorResult(extractor_name="queries")
+
+        await extractor.extract_relationships(items, result)
+
+        assert [
+            (edge.source_id, edge.target_id, edge.relationship_type)
+            for edge in result.relationships
+        ] == [
+            ("q1", "42", RelationshipType.QUERY_WRITES_DE),
+            ("q1", "Master", RelationshipType.QUERY_READS_DE),
+            ("q1", "Profile", RelationshipType.QUERY_READS_DE),
+        ]
+        assert result.relationships[2].metadata == {
+            "resolved_by_name": True,
+            "isShared": True,
+        }
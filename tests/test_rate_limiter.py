@@ -0,0 +1,124 @@
+"""Tests for the adaptive request limiters."""
+
+import asyncio
+import threading
+
+import pytest
+
+from sfmc_inv2.orchestration.rate_limiter import AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AIMD concurrency limiting."""
+
+    def test_additive_increase_per_window(self):
+        """The limit should grow by about one per window of successes."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.limit == 2
+
+        limiter.acquire()
+        limiter.release()
+        assert limiter.limit == 3
+
+    def test_multiplicative_decrease_on_overload(self):
+        """Overload should halve the limit, but not below the minimum."""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, min_limit=3)
+
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == 4
+
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == 3
+        assert limiter.get_status()["overloads"] == 2
+
+    def test_burst_of_overloads_cuts_once(self):
+        """Throttled requests sent before a cut shouldn't cut the limit again."""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+        for _ in range(8):
+            limiter.acquire()
+
+        for _ in range(8):
+            limiter.release(overloaded=True)
+        assert limiter.limit == 4
+
+        # A request sent at the new limit is a fresh signal
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == 2
+        assert limiter.get_status()["overloads"] == 9
+
+    @pytest.mark.asyncio
+    async def test_sync_acquire_on_event_loop_does_not_wait(self):
+        """A sync request on the loop thread mustn't deadlock the coroutines."""
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        await limiter.acquire_async()
+
+        limiter.acquire()
+
+        assert limiter.get_status()["in_flight"] == 2
+        limiter.release()
+        limiter.release()
+        assert limiter.get_status()["in_flight"] == 0
+
+    def test_limit_capped_at_max(self):
+        """The limit should never grow past max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release()
+
+        assert limiter.limit == 2
+
+    def test_thread_waits_for_free_slot(self):
+        """A blocking acquire should wait until a slot is released."""
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        limiter.release()
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.get_status()["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_coroutines_share_limit_with_threads(self):
+        """Async waiters should be woken by releases from worker threads."""
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await asyncio.to_thread(limiter.release)
+        await asyncio.wait_for(waiter, 1)
+        assert limiter.get_status()["in_flight"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_hold_slot(self):
+        """Cancelling a waiting coroutine should leave the slot for others."""
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        limiter.acquire()
+
+        cancelled = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        limiter.release()
+
+        await asyncio.wait_for(limiter.acquire_async(), 1)
+        assert limiter.get_status()["in_flight"] == 1
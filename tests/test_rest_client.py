@@ -0,0 +1,79 @@
+"""Tests for RESTClient connection handling."""
+
+import asyncio
+import logging
+
+import httpx
+import pytest
+
+from sfmc_inv2.clients import rest_client as rest_module
+from sfmc_inv2.clients.rest_client import RESTClient
+from sfmc_inv2.core.config import SFMCConfig
+
+
+class FakeTokenManager:
+    """Token manager stub returning a fixed token."""
+
+    def get_token(self):
+        return "token"
+
+    def force_refresh(self):
+        pass
+
+
+@pytest.fixture
+def async_clients(monkeypatch):
+    """Route async REST traffic to a mock transport, recording each client made."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"path": request.url.path})
+    )
+    created = []
+    real_client = httpx.AsyncClient
+
+    def make_client(*args, **kwargs):
+        client = real_client(*args, transport=transport, **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(rest_module.httpx, "AsyncClient", make_client)
+    return created
+
+
+class TestAsyncConnectionPooling:
+    """Tests for the shared async HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_async_client(self, async_clients):
+        """Async requests should reuse one pooled client until closed."""
+        client = RESTClient(
+            config=SFMCConfig("test", "id", "secret"),
+            token_manager=FakeTokenManager(),
+        )
+
+        first = await client.get_async("/a")
+        second = await client.get_async("/b")
+
+        assert first["data"]["path"].endswith("/a")
+        assert second["data"]["path"].endswith("/b")
+        assert len(async_clients) == 1
+        assert not async_clients[0].is_closed
+
+        await client.aclose()
+
+        assert async_clients[0].is_closed
+        await client.get_async("/c")
+        assert len(async_clients) == 2
+
+    def test_client_from_finished_loop_is_replaced(self, async_clients, caplog):
+        """A new event loop should get its own client and report the stale one."""
+        client = RESTClient(
+            config=SFMCConfig("test", "id", "secret"),
+            token_manager=FakeTokenManager(),
+        )
+
+        asyncio.run(client.get_async("/a"))
+        with caplog.at_level(logging.WARNING):
+            asyncio.run(client.get_async("/b"))
+
+        assert len(async_clients) == 2
+        assert "another event loop (closed)" in caplog.text
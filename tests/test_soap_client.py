@@ -0,0 +1,179 @@
+"""Tests for SOAPClient connection handling and response parsing."""
+
+import httpx
+import pytest
+
+from sfmc_inv2.clients import soap_client as soap_module
+from sfmc_inv2.clients.soap_client import (
+    SOAPClient,
+    nested_object_fields,
+    parse_retrieve_response,
+)
+from sfmc_inv2.core.config import SFMCConfig
+from sfmc_inv2.orchestration.rate_limiter import AdaptiveConcurrencyLimiter
+
+
+def _retrieve_response(status, request_id, names):
+    """Build a minimal RetrieveResponseMsg envelope."""
+    results = "".join(f"<Results><Name>{name}</Name></Results>" for name in names)
+    return (
+        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+        "<soap:Body>"
+        '<RetrieveResponseMsg xmlns="http://exacttarget.com/wsdl/partnerAPI">'
+        f"<OverallStatus>{status}</OverallStatus>"
+        f"<RequestID>{request_id}</RequestID>"
+        f"{results}"
+        "</RetrieveResponseMsg>"
+        "</soap:Body>"
+        "</soap:Envelope>"
+    )
+
+
+class FakeTokenManager:
+    """Token manager stub returning a fixed token."""
+
+    def get_token(self):
+        return "token"
+
+    def force_refresh(self):
+        pass
+
+
+@pytest.fixture
+def http_clients(monkeypatch):
+    """Route SOAP HTTP traffic to a mock transport, recording each client made."""
+    pages = iter([
+        _retrieve_response("MoreDataAvailable", "r1", ["a"]),
+        _retrieve_response("MoreDataAvailable", "r1", ["b"]),
+        _retrieve_response("OK", "r1", ["c"]),
+    ])
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=next(pages)))
+    created = []
+    real_client = httpx.Client
+
+    def make_client(*args, **kwargs):
+        client = real_client(*args, transport=transport, **kwargs)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(soap_module.httpx, "Client", make_client)
+    return created
+
+
+class TestConnectionPooling:
+    """Tests for the shared HTTP client."""
+
+    def test_pages_share_one_http_client(self, http_clients):
+        """All pages of a retrieve should go through a single pooled client."""
+        client = SOAPClient(
+            config=SFMCConfig("test", "id", "secret"),
+            token_manager=FakeTokenManager(),
+        )
+
+        result = client.retrieve_all_pages("List", ["Name"])
+
+        assert [obj["Name"] for obj in result["objects"]] == ["a", "b", "c"]
+        assert result["pages_retrieved"] == 3
+        assert len(http_clients) == 1
+        assert not http_clients[0].is_closed
+
+    def test_close_releases_client(self, http_clients):
+        """close() should close the pooled client and allow a fresh one later."""
+        client = SOAPClient(
+            config=SFMCConfig("test", "id", "secret"),
+            token_manager=FakeTokenManager(),
+        )
+        client.retrieve("List", ["Name"])
+
+        client.close()
+
+        assert http_clients[0].is_closed
+        client.retrieve("List", ["Name"])
+        assert len(http_clients) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_posts_share_one_client(self, monkeypatch):
+        """post_async should reuse one pooled AsyncClient, closed by aclose()."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text=_retrieve_response("OK", "r1", []))
+        )
+        created = []
+        real_client = httpx.AsyncClient
+
+        def make_client(*args, **kwargs):
+            client = real_client(*args, transport=transport, **kwargs)
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(soap_module.httpx, "AsyncClient", make_client)
+        client = SOAPClient(
+            config=SFMCConfig("test", "id", "secret"),
+            token_manager=FakeTokenManager(),
+        )
+        envelope = soap_module.env_with_oauth("token")
+
+        await client.post_async(envelope)
+        await client.post_async(envelope)
+
+        assert len(created) == 1
+        await client.aclose()
+        assert created[0].is_closed
+
+
+class TestConcurrencyLimiter:
+    """Tests for reporting request outcomes to the concurrency limiter."""
+
+    def test_throttled_response_shrinks_limit(self, monkeypatch):
+        """A 429 should cut the shared limit; the retry then succeeds."""
+        responses = iter([
+            httpx.Response(429),
+            httpx.Response(200, text=_retrieve_response("OK", "r1", ["a"])),
+        ])
+        transport = httpx.MockTransport(lambda request: next(responses))
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            soap_module.httpx, "Client",
+            lambda *args, **kwargs: real_client(*args, transport=transport, **kwargs),
+        )
+        monkeypatch.setattr(soap_module.time, "sleep", lambda seconds: None)
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8)
+        client = SOAPClient(
+            config=SFMCConfig("test", "id", "secret"),
+            token_manager=FakeTokenManager(),
+            limiter=limiter,
+        )
+
+        result = client.retrieve("List", ["Name"])
+
+        assert [obj["Name"] for obj in result["objects"]] == ["a"]
+        assert limiter.limit == 4
+        assert limiter.get_status() == {"limit": 4, "in_flight": 0, "overloads": 1}
+
+
+class TestNestedFieldNormalization:
+    """Tests for normalizing nested objects at parse time."""
+
+    def test_nested_object_fields(self):
+        """Only the roots of dotted properties should be nested fields."""
+        assert nested_object_fields(
+            ["Name", "Email.ID", "Email.Name", "List.ID"]
+        ) == {"Email", "List"}
+
+    def test_missing_and_scalar_nested_fields_become_dicts(self):
+        """Nested fields should always parse to dicts."""
+        xml = (
+            '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">'
+            "<soap:Body>"
+            '<RetrieveResponseMsg xmlns="http://exacttarget.com/wsdl/partnerAPI">'
+            "<OverallStatus>OK</OverallStatus>"
+            "<Results><Name>ts</Name><Email><ID>42</ID></Email><List/></Results>"
+            "</RetrieveResponseMsg>"
+            "</soap:Body>"
+            "</soap:Envelope>"
+        )
+
+        result = parse_retrieve_response(xml, {"Email", "List", "SenderProfile"})
+
+        assert result["objects"] == [
+            {"Name": "ts", "Email": {"ID": "42"}, "List": {}, "SenderProfile": {}}
+        ]
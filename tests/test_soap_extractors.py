@@ -0,0 +1,259 @@
+"""Tests for the SOAP-backed List, Template, and Triggered Send extractors."""
+
+import asyncio
+import threading
+
+import pytest
+
+from sfmc_inv2.extractors.base_extractor import ExtractorOptions, ExtractorResult
+from sfmc_inv2.extractors.subscriber_list import ListExtractor
+from sfmc_inv2.extractors.template import TemplateExtractor
+from sfmc_inv2.extractors.triggered_send import TriggeredSendExtractor
+from sfmc_inv2.types.relationships import RelationshipType
+
+
+class FakeSOAPClient:
+    """SOAP client stub serving canned pages from iter_retrieve_pages."""
+
+    def __init__(self, pages, ok=True):
+        self.pages = pages
+        self.ok = ok
+        self.calls = []
+        self.threads = []
+        self.served = 0
+
+    def iter_retrieve_pages(self, object_type, properties, filter_xml=None,
+                            max_pages=None, query_all_accounts=False):
+        self.calls.append({"object_type": object_type, "properties": list(properties),
+                           "max_pages": max_pages})
+        if not self.ok:
+            yield {"ok": False, "error": "boom", "objects": []}
+            return
+        for objects in self.pages:
+            self.threads.append(threading.current_thread().name)
+            self.served += 1
+            yield {"ok": True, "objects": list(objects)}
+
+
+class FakeCacheManager:
+    """Cache manager stub with no-op warming and fixed breadcrumbs."""
+
+    def __init__(self):
+        self.breadcrumb_calls = []
+
+    def warm(self, cache_types):
+        pass
+
+    def get_breadcrumb(self, folder_id, cache_type):
+        self.breadcrumb_calls.append((folder_id, cache_type))
+        return f"Root > {folder_id}"
+
+
+def _make_extractor(cls, soap):
+    """Create an extractor wired to stub clients."""
+    return cls(rest_client=object(), soap_client=soap, cache_manager=FakeCacheManager())
+
+
+class TestFetchData:
+    """Tests for SOAP fetch_data()."""
+
+    @pytest.mark.parametrize(
+        "cls", [ListExtractor, TemplateExtractor, TriggeredSendExtractor]
+    )
+    @pytest.mark.asyncio
+    async def test_paging_runs_on_extractor_pool(self, cls):
+        """Blocking SOAP paging should run on the extractor's worker threads."""
+        soap = FakeSOAPClient([[{"ObjectID": "o1"}], [{"ObjectID": "o2"}]])
+        extractor = _make_extractor(cls, soap)
+
+        result = await extractor.extract(ExtractorOptions(max_pages=7))
+
+        assert result.success
+        assert result.item_count == 2
+        assert result.pages_fetched == 2
+        assert soap.calls[0]["object_type"] == cls.SOAP_OBJECT_TYPE
+        assert soap.calls[0]["max_pages"] == 7
+        assert all(name.startswith(f"{cls.name}-fetch") for name in soap.threads)
+
+    @pytest.mark.asyncio
+    async def test_pages_streamed_through_pipeline(self):
+        """Each page should be transformed before the next is requested."""
+        soap = FakeSOAPClient([[{"ID": 1}], [{"ID": 2}], [{"ID": 3}]])
+        extractor = _make_extractor(ListExtractor, soap)
+        served_at_transform = []
+
+        transform = extractor.transform_data
+
+        def recording_transform(items, options):
+            served_at_transform.append(soap.served)
+            return transform(items, options)
+
+        extractor.transform_data = recording_transform
+
+        result = await extractor.extract()
+
+        assert [item["id"] for item in result.items] == [1, 2, 3]
+        assert served_at_transform == [1, 2, 3]
+
+    @pytest.mark.parametrize("include_content", [False, True])
+    @pytest.mark.asyncio
+    async def test_template_content_properties(self, include_content):
+        """Content properties should only be requested when asked for."""
+        soap = FakeSOAPClient([])
+        extractor = _make_extractor(TemplateExtractor, soap)
+
+        await extractor.fetch_data(ExtractorOptions(include_content=include_content))
+
+        expected = list(TemplateExtractor.SOAP_PROPERTIES)
+        if include_content:
+            expected += TemplateExtractor.CONTENT_PROPERTIES
+        assert soap.calls[0]["properties"] == expected
+        assert "LayoutHTML" not in TemplateExtractor.SOAP_PROPERTIES
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_page_request(self):
+        """Cancelling mid-request should raise CancelledError and close paging."""
+        in_request = threading.Event()
+        release = threading.Event()
+        closed = threading.Event()
+
+        class BlockingSOAPClient:
+            def iter_retrieve_pages(self, object_type, properties, **kwargs):
+                try:
+                    in_request.set()
+                    release.wait(5)
+                    yield {"ok": True, "objects": [{"ID": 1}]}
+                finally:
+                    closed.set()
+
+        extractor = _make_extractor(ListExtractor, BlockingSOAPClient())
+        task = asyncio.ensure_future(extractor.fetch_data(ExtractorOptions()))
+        await asyncio.to_thread(in_request.wait, 5)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not closed.is_set()
+        release.set()
+        assert await asyncio.to_thread(closed.wait, 5)
+
+    @pytest.mark.asyncio
+    async def test_failed_retrieve_returns_nothing(self):
+        """A failed retrieve should yield no items rather than raise."""
+        extractor = _make_extractor(ListExtractor, FakeSOAPClient([], ok=False))
+
+        assert await extractor.fetch_data(ExtractorOptions()) == []
+
+
+class TestTransformData:
+    """Tests for SOAP transform_data()."""
+
+    def test_triggered_send_booleans_and_references(self):
+        """SOAP "true"/"false" strings become bools; nested refs are flattened.
+
+        Nested objects arrive as dicts (empty when absent) from the SOAP client.
+        """
+        extractor = _make_extractor(TriggeredSendExtractor, FakeSOAPClient([]))
+        item = {
+            "ObjectID": "ts-1",
+            "Email": {"ID": "42"},
+            "List": {},
+            "IsMultipart": "true",
+            "IsWrapped": "false",
+            "AutoAddSubscribers": True,
+        }
+
+        output = extractor.transform_data([item], ExtractorOptions())[0]
+
+        assert output["emailId"] == "42"
+        assert output["listId"] is None
+        assert output["isMultipart"] is True
+        assert output["isWrapped"] is False
+        assert output["autoAddSubscribers"] is True
+        assert output["autoUpdateSubscribers"] is None
+
+    def test_template_booleans(self):
+        """Template flags should be converted from SOAP strings."""
+        extractor = _make_extractor(TemplateExtractor, FakeSOAPClient([]))
+        item = {"ID": 1, "ActiveFlag": "true", "IsTemplateSubjectLocked": "false"}
+
+        output = extractor.transform_data([item], ExtractorOptions())[0]
+
+        assert output["isActive"] is True
+        assert output["isTemplateSubjectLocked"] is False
+        assert output["isBlank"] is None
+
+
+class TestEnrichment:
+    """Tests for breadcrumb enrichment."""
+
+    @pytest.mark.asyncio
+    async def test_breadcrumbs_memoized_per_run(self):
+        """Items sharing a folder should cost one cache manager lookup."""
+        objects = [
+            {"ObjectID": "o1", "CategoryID": 10},
+            {"ObjectID": "o2", "CategoryID": 10},
+            {"ObjectID": "o3", "CategoryID": 20},
+        ]
+        extractor = _make_extractor(TriggeredSendExtractor, FakeSOAPClient([objects]))
+
+        result = await extractor.extract()
+        await extractor.extract()
+
+        assert [item["folderPath"] for item in result.items] == [
+            "Root > 10", "Root > 10", "Root > 20",
+        ]
+        # One lookup per distinct folder per run
+        assert len(extractor._cache.breadcrumb_calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_enrich_stage_skipped_without_enrich_item(self):
+        """Extractors with no per-item enrichment should pass items through."""
+        extractor = _make_extractor(ListExtractor, FakeSOAPClient([]))
+        items = [{"ID": 1, "Category": 5}]
+
+        enriched = await extractor.enrich_data(
+            items, ExtractorOptions(), ExtractorResult(extractor_name="lists")
+        )
+
+        assert enriched is items
+        assert "folderPath" not in items[0]
+
+
+class TestTriggeredSendRelationships:
+    """Tests for TriggeredSendExtractor.extract_relationships()."""
+
+    @pytest.mark.asyncio
+    async def test_all_reference_types(self):
+        """Each populated reference should yield one edge, in a fixed order."""
+        extractor = _make_extractor(TriggeredSendExtractor, FakeSOAPClient([]))
+        items = [
+            {
+                "ObjectID": "ts-1",
+                "Name": "Welcome",
+                "Email": {"ID": 42, "Name": "Welcome Email"},
+                "List": {"ID": 7},
+                "SenderProfile": {"CustomerKey": "sp"},
+                "DeliveryProfile": {"CustomerKey": "dp"},
+                "SendClassification": {"CustomerKey": "sc"},
+            },
+            {"ObjectID": "ts-2", "Email": {}, "List": {"ID": None}},
+            {"Name": "No ID", "Email": {"ID": 1}},
+        ]
+        result = ExtractorResult(extractor_name="triggered_sends")
+
+        await extractor.extract_relationships(items, result)
+
+        assert [
+            (edge.source_id, edge.target_id, edge.target_type, edge.relationship_type)
+            for edge in result.relationships
+        ] == [
+            ("ts-1", "42", "email", RelationshipType.TRIGGERED_SEND_USES_EMAIL),
+            ("ts-1", "7", "list", RelationshipType.TRIGGERED_SEND_USES_LIST),
+            ("ts-1", "sp", "sender_profile", RelationshipType.TRIGGERED_SEND_USES_SENDER_PROFILE),
+            ("ts-1", "dp", "delivery_profile", RelationshipType.TRIGGERED_SEND_USES_DELIVERY_PROFILE),
+            ("ts-1", "sc", "send_classification",
+             RelationshipType.TRIGGERED_SEND_USES_SEND_CLASSIFICATION),
+        ]
+        assert result.relationships[0].target_name == "Welcome Email"